@@ -8,9 +8,12 @@ It includes classification of financial statements, document types, and content
 """
 
 import pandas as pd
-from typing import List, Dict, Any, Optional
+import numpy as np
+from typing import List, Dict, Any, Optional, Sequence
 import logging
 
+from ..processing.term_matcher import TermMatcher
+
 
 class FinancialClassifier:
     """
@@ -74,6 +77,34 @@ class FinancialClassifier:
                 'digital transformation', 'growth strategy'
             ]
         }
+        
+        # Statement type indicators
+        self.statement_patterns = {
+            'income_statement': [
+                'revenue', 'income', 'earnings', 'profit', 'loss',
+                'operating income', 'net income'
+            ],
+            'balance_sheet': [
+                'assets', 'liabilities', 'equity', 'balance sheet',
+                'total assets', 'shareholders equity'
+            ],
+            'cash_flow': [
+                'cash flow', 'operating cash flow', 'free cash flow',
+                'cash and cash equivalents'
+            ],
+            'capital_adequacy': [
+                'capital ratio', 'tier 1', 'tier 2', 'risk weighted assets',
+                'capital adequacy', 'basel'
+            ]
+        }
+        
+        # Compiled matchers for batch classification: document types are
+        # matched on text plus filename, the other families on text only
+        self.document_matcher = TermMatcher(self.document_patterns)
+        self.text_matcher = TermMatcher({
+            **{f'content:{name}': patterns for name, patterns in self.content_patterns.items()},
+            **{f'statement:{name}': patterns for name, patterns in self.statement_patterns.items()},
+        })
     
     def classify_document_type(self, text: str, filename: str = "") -> Dict[str, Any]:
         """
@@ -186,26 +217,7 @@ class FinancialClassifier:
             }
         
         text_lower = text.lower()
-        
-        # Statement type indicators
-        statement_indicators = {
-            'income_statement': [
-                'revenue', 'income', 'earnings', 'profit', 'loss',
-                'operating income', 'net income'
-            ],
-            'balance_sheet': [
-                'assets', 'liabilities', 'equity', 'balance sheet',
-                'total assets', 'shareholders equity'
-            ],
-            'cash_flow': [
-                'cash flow', 'operating cash flow', 'free cash flow',
-                'cash and cash equivalents'
-            ],
-            'capital_adequacy': [
-                'capital ratio', 'tier 1', 'tier 2', 'risk weighted assets',
-                'capital adequacy', 'basel'
-            ]
-        }
+        statement_indicators = self.statement_patterns
         
         scores = {}
         found_indicators = {}
@@ -231,6 +243,137 @@ class FinancialClassifier:
             'indicators': found_indicators[best_type]
         }
     
+    @staticmethod
+    def _to_list(column: Any) -> List[Any]:
+        """Convert an Arrow array, pandas Series or sequence to a Python list (missing values as None)."""
+        if hasattr(column, 'to_pylist'):
+            return column.to_pylist()
+        if isinstance(column, pd.Series):
+            return column.astype(object).where(column.notna(), None).tolist()
+        if hasattr(column, 'tolist'):
+            return column.tolist()
+        return list(column)
+    
+    @staticmethod
+    def _best_family(matches, families: Sequence[str]) -> tuple:
+        """Per-row score matrix over families and the index of the best one."""
+        scores = np.column_stack([matches.count(family) for family in families])
+        return scores, scores.argmax(axis=1), scores.max(axis=1)
+    
+    def classify_columns(
+        self,
+        texts: Any,
+        filenames: Optional[Any] = None,
+        include_metadata: bool = False
+    ) -> pd.DataFrame:
+        """
+        Classify whole columns of text in one matching pass per family group.
+        
+        Produces the same results as ``classify_document_type``,
+        ``classify_content_category`` and ``classify_financial_statement_type``
+        applied row by row.
+        
+        Args:
+            texts: Text column (Arrow array, pandas Series or list)
+            filenames: Optional filename column aligned with ``texts``
+            include_metadata: Add the ``classification_metadata`` column with
+                matched patterns and category scores
+            
+        Returns:
+            DataFrame with document, content and statement classifications
+        """
+        texts = self._to_list(texts)
+        n_rows = len(texts)
+        filenames = [''] * n_rows if filenames is None else self._to_list(filenames)
+        
+        # Same truthiness checks as the per-record methods
+        has_text = np.fromiter((bool(t) for t in texts), dtype=bool, count=n_rows)
+        has_document = has_text | np.fromiter((bool(f) for f in filenames), dtype=bool, count=n_rows)
+        
+        # Document type from text plus filename
+        doc_types = list(self.document_patterns)
+        doc_matches = self.document_matcher.match([f"{t} {f}" for t, f in zip(texts, filenames)])
+        doc_scores, doc_best, doc_max = self._best_family(doc_matches, doc_types)
+        doc_found = has_document & (doc_max > 0)
+        doc_sizes = np.array([len(self.document_patterns[d]) for d in doc_types])
+        
+        # Content category and statement type from text only
+        text_matches = self.text_matcher.match([str(t) if t else '' for t in texts])
+        categories = list(self.content_patterns)
+        content_scores, content_best, content_max = self._best_family(
+            text_matches, [f'content:{c}' for c in categories]
+        )
+        content_total = content_scores.sum(axis=1)
+        content_found = has_text & (content_max > 0)
+        
+        statement_types = list(self.statement_patterns)
+        statement_scores, statement_best, statement_max = self._best_family(
+            text_matches, [f'statement:{t}' for t in statement_types]
+        )
+        statement_found = has_text & (statement_max > 0)
+        statement_sizes = np.array([len(self.statement_patterns[t]) for t in statement_types])
+        
+        result = pd.DataFrame({
+            'document_type': np.where(doc_found, np.array(doc_types, dtype=object)[doc_best], 'unknown'),
+            'document_confidence': np.where(doc_found, doc_max / doc_sizes[doc_best], 0.0),
+            'content_category': np.select(
+                [content_found, has_text],
+                [np.array(categories, dtype=object)[content_best], 'general'],
+                default='unknown'
+            ),
+            'content_confidence': np.where(content_found, content_max / np.maximum(content_total, 1), 0.0),
+            'statement_type': np.select(
+                [statement_found, has_text],
+                [np.array(statement_types, dtype=object)[statement_best], 'general_financial'],
+                default='unknown'
+            ),
+            'statement_confidence': np.where(statement_found, statement_max / statement_sizes[statement_best], 0.0),
+        })
+        
+        if include_metadata:
+            doc_terms = doc_matches.select_terms(doc_types, np.where(doc_found, doc_best, -1))
+            statement_terms = text_matches.select_terms(
+                [f'statement:{t}' for t in statement_types],
+                np.where(statement_found, statement_best, -1)
+            )
+            metadata = [
+                {
+                    'doc_type_patterns': doc_patterns,
+                    'category_scores': dict(zip(categories, scores)) if present else {},
+                    'statement_indicators': indicators
+                }
+                for doc_patterns, scores, present, indicators in zip(
+                    doc_terms, content_scores.tolist(), has_text.tolist(), statement_terms
+                )
+            ]
+            result['classification_metadata'] = metadata
+        
+        return result
+    
+    def classify_dataframe(
+        self,
+        df: pd.DataFrame,
+        text_column: str = 'text',
+        filename_column: str = 'source_file',
+        include_metadata: bool = False
+    ) -> pd.DataFrame:
+        """
+        Add classification columns to a DataFrame.
+        
+        Args:
+            df: Input DataFrame
+            text_column: Name of the text column
+            filename_column: Name of the filename column (optional in ``df``)
+            include_metadata: Add the ``classification_metadata`` column
+            
+        Returns:
+            DataFrame with classification columns added
+        """
+        filenames = df[filename_column] if filename_column in df.columns else None
+        classified = self.classify_columns(df[text_column], filenames, include_metadata=include_metadata)
+        classified.index = df.index
+        return pd.concat([df, classified], axis=1)
+    
     def classify_batch(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Classify a batch of records.
@@ -241,33 +384,20 @@ class FinancialClassifier:
         Returns:
             List of records with classification results
         """
-        classified_records = []
+        classified = self.classify_columns(
+            [record.get('text', '') for record in records],
+            [record.get('source_file', '') for record in records],
+            include_metadata=True
+        )
         
-        for record in records:
-            text = record.get('text', '')
-            filename = record.get('source_file', '')
-            
-            # Perform all classifications
-            doc_type = self.classify_document_type(text, filename)
-            content_category = self.classify_content_category(text)
-            statement_type = self.classify_financial_statement_type(text)
-            
+        columns = list(classified.columns)
+        values = zip(*(classified[column].tolist() for column in columns))
+        
+        classified_records = []
+        for record, row in zip(records, values):
             # Add classification results to record
             enhanced_record = record.copy()
-            enhanced_record.update({
-                'document_type': doc_type['document_type'],
-                'document_confidence': doc_type['confidence'],
-                'content_category': content_category['primary_category'],
-                'content_confidence': content_category['confidence'],
-                'statement_type': statement_type['statement_type'],
-                'statement_confidence': statement_type['confidence'],
-                'classification_metadata': {
-                    'doc_type_patterns': doc_type['matched_patterns'],
-                    'category_scores': content_category['category_scores'],
-                    'statement_indicators': statement_type['indicators']
-                }
-            })
-            
+            enhanced_record.update(zip(columns, row))
             classified_records.append(enhanced_record)
         
         return classified_records
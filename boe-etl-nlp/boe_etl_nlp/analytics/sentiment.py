@@ -8,6 +8,8 @@ It includes specialized sentiment analysis for financial text and earnings calls
 """
 
 import pandas as pd
+import numpy as np
+from scipy import sparse
 from typing import List, Dict, Any, Optional
 import logging
 
@@ -40,6 +42,16 @@ class SentimentAnalyzer:
             'decline', 'decrease', 'weak', 'negative', 'worse', 'deteriorate',
             'underperform', 'challenging', 'difficult', 'concern', 'risk', 'loss'
         }
+        
+        # Lexicon vocabulary and polarity vectors for the batch engine
+        self.vocabulary = sorted(self.positive_terms | self.negative_terms)
+        self.vocabulary_index = {term: i for i, term in enumerate(self.vocabulary)}
+        self.positive_weights = np.array(
+            [term in self.positive_terms for term in self.vocabulary], dtype=np.float64
+        )
+        self.negative_weights = np.array(
+            [term in self.negative_terms for term in self.vocabulary], dtype=np.float64
+        )
     
     def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """
@@ -95,17 +107,102 @@ class SentimentAnalyzer:
             'negative_terms': negative_matches
         }
     
-    def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+    def build_document_term_matrix(self, texts: List[str]):
+        """
+        Tokenise all texts once into a sparse document-term matrix.
+        
+        Columns are the lexicon vocabulary; tokens outside the lexicon are
+        only counted towards the document length.
+        
+        Args:
+            texts: List of texts (None is treated as empty)
+            
+        Returns:
+            Tuple of (CSR count matrix, token count per text)
+        """
+        vocabulary_index = self.vocabulary_index
+        indptr = [0]
+        lengths = []
+        indices: List[int] = []
+        
+        for text in texts:
+            tokens = text.lower().split() if text else []
+            lengths.append(len(tokens))
+            indices.extend([vocabulary_index[token] for token in tokens if token in vocabulary_index])
+            indptr.append(len(indices))
+        
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float64), np.array(indices, dtype=np.int64),
+             np.array(indptr, dtype=np.int64)),
+            shape=(len(texts), len(self.vocabulary))
+        )
+        return matrix, np.array(lengths, dtype=np.int64)
+    
+    def score_batch(self, texts: List[str], include_terms: bool = False) -> pd.DataFrame:
+        """
+        Score a batch of texts with matrix operations over the lexicon.
+        
+        Produces the same scores, labels and confidences as
+        ``analyze_sentiment`` applied to every text.
+        
+        Args:
+            texts: List of texts to analyze
+            include_terms: Also return the matched positive/negative term lists
+            
+        Returns:
+            DataFrame with one row per text
+        """
+        matrix, lengths = self.build_document_term_matrix(texts)
+        positive_count = matrix @ self.positive_weights
+        negative_count = matrix @ self.negative_weights
+        total = positive_count + negative_count
+        
+        has_terms = total > 0
+        safe_lengths = np.maximum(lengths, 1)
+        sentiment_score = np.where(has_terms, (positive_count - negative_count) / safe_lengths, 0.0)
+        confidence = np.where(has_terms, total / safe_lengths, 0.0)
+        sentiment_label = np.select(
+            [has_terms & (sentiment_score > 0.01), has_terms & (sentiment_score < -0.01)],
+            ['positive', 'negative'],
+            default='neutral'
+        )
+        
+        result = pd.DataFrame({
+            'sentiment_score': sentiment_score,
+            'sentiment_label': sentiment_label,
+            'confidence': confidence
+        })
+        
+        if include_terms:
+            # CSR indices keep token order within each text
+            vocabulary = self.vocabulary
+            is_positive = self.positive_weights.astype(bool).tolist()
+            indices = matrix.indices.tolist()
+            indptr = matrix.indptr.tolist()
+            positive_terms, negative_terms = [], []
+            for start, end in zip(indptr[:-1], indptr[1:]):
+                row = indices[start:end]
+                positive_terms.append([vocabulary[j] for j in row if is_positive[j]])
+                negative_terms.append([vocabulary[j] for j in row if not is_positive[j]])
+            result['positive_terms'] = positive_terms
+            result['negative_terms'] = negative_terms
+        
+        return result
+    
+    def analyze_batch(self, texts: List[str], include_terms: bool = True) -> List[Dict[str, Any]]:
         """
         Analyze sentiment for a batch of texts.
         
         Args:
             texts: List of texts to analyze
+            include_terms: Include the matched term lists in each result
             
         Returns:
             List of sentiment analysis results
         """
-        return [self.analyze_sentiment(text) for text in texts]
+        result = self.score_batch(texts, include_terms=include_terms)
+        columns = list(result.columns)
+        return [dict(zip(columns, row)) for row in zip(*(result[c].tolist() for c in columns))]
 
 
 def analyze_sentiment(text: str, config: Optional[Dict] = None) -> Dict[str, Any]:
@@ -7,10 +7,11 @@ This module provides a command-line interface for the BoE ETL NLP extension pack
 """
 
 import argparse
+import itertools
 import sys
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 import pandas as pd
 
@@ -23,14 +24,175 @@ def setup_logging(verbose: bool = False) -> None:
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        force=True  # Optional-dependency warnings at import time may have configured logging already
     )
 
 
+# Rows per batch in streaming mode
+DEFAULT_STREAM_BATCH_SIZE = 100000
+
+
+def iter_input_batches(input_file: Path, batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV/Parquet file as a sequence of DataFrame batches.
+    
+    Parquet files are read with ``ParquetFile.iter_batches`` and CSV files
+    with chunked ``read_csv``, so only one batch is held in memory.
+    
+    Args:
+        input_file: Path to input CSV/Parquet file
+        batch_size: Number of rows per batch
+        
+    Yields:
+        DataFrame for each batch
+    """
+    suffix = input_file.suffix.lower()
+    if suffix == '.csv':
+        yield from pd.read_csv(input_file, chunksize=batch_size)
+    elif suffix == '.parquet':
+        import pyarrow.parquet as pq
+        
+        parquet_file = pq.ParquetFile(input_file)
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported file format: {input_file.suffix}")
+
+
+def count_input_rows(input_file: Path) -> Optional[int]:
+    """Total row count from Parquet metadata, or None when unknown (CSV)."""
+    if input_file.suffix.lower() == '.parquet':
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(input_file).metadata.num_rows
+    return None
+
+
+class StreamWriter:
+    """
+    Append DataFrame batches to a CSV or Parquet output file.
+    
+    Parquet output goes through a single ``ParquetWriter`` whose schema is
+    fixed by the first batch; column types known from the input Parquet
+    schema take precedence so that all-null batches do not change types.
+    """
+    
+    def __init__(self, output_file: Path, input_schema=None):
+        self.output_file = output_file
+        self.input_schema = input_schema
+        self.is_parquet = output_file.suffix.lower() == '.parquet'
+        self._writer = None
+        self._schema = None
+        self._columns = None
+        self._header_written = False
+    
+    def _build_schema(self, table):
+        """Output schema from the first batch, preferring input column types."""
+        import pyarrow as pa
+        
+        if self.input_schema is None:
+            return table.schema
+        input_types = {field.name: field.type for field in self.input_schema}
+        return pa.schema([
+            pa.field(field.name, input_types.get(field.name, field.type))
+            for field in table.schema
+        ])
+    
+    def write(self, df: pd.DataFrame) -> None:
+        """Append one batch to the output file."""
+        # Later batches are aligned to the columns of the first batch
+        if self._columns is None:
+            self._columns = list(df.columns)
+        elif list(df.columns) != self._columns:
+            dropped = set(df.columns) - set(self._columns)
+            if dropped:
+                logging.getLogger(__name__).warning(f"Dropping columns not in first batch: {sorted(dropped)}")
+            df = df.reindex(columns=self._columns)
+        
+        if self.is_parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            if self._writer is None:
+                self._schema = self._build_schema(pa.Table.from_pandas(df, preserve_index=False))
+                self._writer = pq.ParquetWriter(self.output_file, self._schema)
+            table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+            self._writer.write_table(table)
+        else:
+            df.to_csv(self.output_file, index=False, mode='a' if self._header_written else 'w',
+                      header=not self._header_written)
+            self._header_written = True
+    
+    def close(self) -> None:
+        """Finalize the output file."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+    
+    def __enter__(self) -> 'StreamWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def stream_transform(
+    input_file: Path,
+    output_file: Path,
+    transform: Callable[[pd.DataFrame], pd.DataFrame],
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+) -> int:
+    """
+    Apply a DataFrame transform batch by batch with constant memory.
+    
+    Args:
+        input_file: Path to input CSV/Parquet file
+        output_file: Path to output CSV/Parquet file
+        transform: Function applied to each batch
+        batch_size: Number of rows per batch
+        
+    Returns:
+        Total number of rows processed
+    """
+    logger = logging.getLogger(__name__)
+    
+    input_schema = None
+    if input_file.suffix.lower() == '.parquet':
+        import pyarrow.parquet as pq
+        input_schema = pq.ParquetFile(input_file).schema_arrow
+    total_rows = count_input_rows(input_file)
+    
+    processed = 0
+    with StreamWriter(output_file, input_schema) as writer:
+        for batch_number, batch_df in enumerate(iter_input_batches(input_file, batch_size), start=1):
+            writer.write(transform(batch_df))
+            processed += len(batch_df)
+            
+            if total_rows:
+                logger.info(f"Batch {batch_number}: processed {processed}/{total_rows} records "
+                            f"({processed / total_rows:.1%})")
+            else:
+                logger.info(f"Batch {batch_number}: processed {processed} records")
+    
+    return processed
+
+
+def _default_output_file(input_file: Path, output_file: Optional[Path], tag: str) -> Path:
+    """Resolve the output path, defaulting to the input format."""
+    if output_file is None:
+        output_file = input_file.parent / f"{input_file.stem}_{tag}{input_file.suffix}"
+    if output_file.suffix.lower() not in ('.csv', '.parquet'):
+        output_file = output_file.with_suffix('.csv')
+    return output_file
+
+
 def process_file(
     input_file: Path,
     output_file: Optional[Path] = None,
-    config: Optional[dict] = None
+    config: Optional[dict] = None,
+    n_jobs: int = 1,
+    stream: bool = False,
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE
 ) -> None:
     """
     Process a single file with NLP features.
@@ -39,9 +201,23 @@ def process_file(
         input_file: Path to input CSV/Parquet file
         output_file: Path to output file (optional)
         config: Configuration dictionary (optional)
+        n_jobs: Worker processes for feature extraction (-1 for all cores)
+        stream: Read, process and write in batches with constant memory
+        batch_size: Number of rows per batch in streaming mode
     """
     logger = logging.getLogger(__name__)
     
+    if stream:
+        processor = NLPProcessor(config)
+        output_file = _default_output_file(input_file, output_file, 'nlp_enhanced')
+        total = stream_transform(
+            input_file, output_file,
+            lambda batch: processor.add_nlp_features(batch, n_jobs=n_jobs, inplace=True),
+            batch_size=batch_size
+        )
+        logger.info(f"Saved {total} enhanced records to {output_file}")
+        return
+    
     # Read input file
     if input_file.suffix.lower() == '.csv':
         df = pd.read_csv(input_file)
@@ -54,7 +230,7 @@ def process_file(
     
     # Process with NLP features
     processor = NLPProcessor(config)
-    enhanced_df = processor.add_nlp_features(df)
+    enhanced_df = processor.add_nlp_features(df, n_jobs=n_jobs, inplace=True)
     
     logger.info(f"Added NLP features to {len(enhanced_df)} records")
     
@@ -79,7 +255,9 @@ def analyze_topics(
     bank_name: str,
     quarter: str,
     output_file: Optional[Path] = None,
-    config: Optional[dict] = None
+    config: Optional[dict] = None,
+    stream: bool = False,
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE
 ) -> None:
     """
     Analyze topics in the input data.
@@ -90,9 +268,29 @@ def analyze_topics(
         quarter: Quarter identifier
         output_file: Path to output file (optional)
         config: Configuration dictionary (optional)
+        stream: Model topics batch by batch with constant memory. Emerging
+            topics are then fitted per batch and their labels are only
+            comparable within the same ``topic_batch``.
+        batch_size: Number of rows per batch in streaming mode
     """
     logger = logging.getLogger(__name__)
     
+    if stream:
+        modeler = TopicModeler(config)
+        output_file = _default_output_file(input_file, output_file, 'topics')
+        batch_counter = itertools.count()
+        
+        def _model_batch(batch_df: pd.DataFrame) -> pd.DataFrame:
+            batch_results = pd.DataFrame(
+                modeler.process_batch(batch_df.to_dict('records'), bank_name, quarter)
+            )
+            batch_results['topic_batch'] = next(batch_counter)
+            return batch_results
+        
+        total = stream_transform(input_file, output_file, _model_batch, batch_size=batch_size)
+        logger.info(f"Saved topic analysis results for {total} records to {output_file}")
+        return
+    
     # Read input file
     if input_file.suffix.lower() == '.csv':
         df = pd.read_csv(input_file)
@@ -138,6 +336,12 @@ Examples:
   
   # Process with verbose logging
   boe-etl-nlp process data.csv --verbose
+  
+  # Extract features on 8 worker processes
+  boe-etl-nlp process data.parquet --jobs 8
+  
+  # Stream a multi-GB file in 200k-row batches
+  boe-etl-nlp process corpus.parquet --stream --batch-size 200000
         """
     )
     
@@ -170,6 +374,23 @@ Examples:
         type=Path,
         help='Output file path (optional)'
     )
+    process_parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Worker processes for feature extraction (-1 for all cores)'
+    )
+    process_parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Process the file in batches with constant memory'
+    )
+    process_parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_STREAM_BATCH_SIZE,
+        help='Rows per batch in streaming mode'
+    )
     
     # Topics command
     topics_parser = subparsers.add_parser(
@@ -196,6 +417,17 @@ Examples:
         type=Path,
         help='Output file path (optional)'
     )
+    topics_parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Model topics batch by batch with constant memory'
+    )
+    topics_parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_STREAM_BATCH_SIZE,
+        help='Rows per batch in streaming mode'
+    )
     
     args = parser.parse_args()
     
@@ -208,9 +440,11 @@ Examples:
     
     try:
         if args.command == 'process':
-            process_file(args.input_file, args.output)
+            process_file(args.input_file, args.output, n_jobs=args.jobs,
+                         stream=args.stream, batch_size=args.batch_size)
         elif args.command == 'topics':
-            analyze_topics(args.input_file, args.bank, args.quarter, args.output)
+            analyze_topics(args.input_file, args.bank, args.quarter, args.output,
+                           stream=args.stream, batch_size=args.batch_size)
         else:
             parser.print_help()
             sys.exit(1)
@@ -8,13 +8,16 @@ for the BoE ETL NLP extension package.
 
 Components:
 - feature_extraction: Main NLP processor for adding comprehensive features
+- term_matcher: Single-pass multi-pattern matcher for term lexicons
 - text_cleaning: Advanced text cleaning and normalization
 - sentiment: Sentiment analysis for financial text
 """
 
 from .feature_extraction import NLPProcessor, add_nlp_features
+from .term_matcher import TermMatcher
 
 __all__ = [
     "NLPProcessor",
     "add_nlp_features",
+    "TermMatcher",
 ]
\ No newline at end of file
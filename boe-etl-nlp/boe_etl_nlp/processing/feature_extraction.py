@@ -13,10 +13,31 @@ and enhanced for modular use.
 
 import pandas as pd
 import numpy as np
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Optional
 import logging
 
+from .term_matcher import TermMatcher, findall_rows, group_join
+
+# Default number of rows per partition in parallel mode
+DEFAULT_CHUNK_SIZE = 250000
+
+# Per-worker processor, built once by the pool initializer
+_WORKER_PROCESSOR = None
+
+
+def _init_worker(config: Optional[Dict]) -> None:
+    """Build the worker's NLPProcessor once so term lists are compiled per worker, not per chunk."""
+    global _WORKER_PROCESSOR
+    _WORKER_PROCESSOR = NLPProcessor(config)
+
+
+def _extract_chunk(texts: List[str]) -> Dict[str, np.ndarray]:
+    """Extract text features for one partition inside a worker."""
+    return _WORKER_PROCESSOR.extract_text_features(texts)
+
 
 class NLPProcessor:
     """
@@ -41,9 +62,24 @@ class NLPProcessor:
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
         
+        # Partitioned execution settings
+        self.n_jobs = self.config.get('n_jobs', 1)
+        self.chunk_size = self.config.get('chunk_size', DEFAULT_CHUNK_SIZE)
+        
         # Load financial terms vocabulary
         self.financial_terms_list = self._load_financial_terms()
         
+        # Load classification vocabularies and compile them into one matcher
+        self.term_families = self._load_term_families()
+        self.topic_rules = self._load_topic_rules()
+        self.term_matcher = self._build_term_matcher()
+        
+        # Patterns for financial figures, compiled once
+        self.figure_patterns = [
+            re.compile(pattern, re.IGNORECASE) for pattern in self._load_figure_patterns()
+        ]
+        self._digit_pattern = re.compile(r'[\d,]')
+        
     def _load_financial_terms(self) -> List[str]:
         """Load comprehensive financial terms list."""
         return [
@@ -60,7 +96,166 @@ class NLPProcessor:
             'note', 'facility', 'line', 'commitment', 'exposure', 'concentration'
         ]
     
-    def add_nlp_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _load_term_families(self) -> Dict[str, List[str]]:
+        """Load the substring vocabularies used for classification."""
+        return {
+            # Projection indicators
+            'projection': [
+                'expect', 'forecast', 'project', 'anticipate', 'estimate',
+                'guidance', 'outlook', 'target', 'goal', 'plan', 'intend',
+                'will be', 'should be', 'likely to', 'going forward',
+                'next quarter', 'next year', 'future', 'upcoming'
+            ],
+            # Actual/historical indicators
+            'actual': [
+                'reported', 'achieved', 'delivered', 'recorded', 'posted',
+                'was', 'were', 'had', 'generated', 'earned', 'realized',
+                'last quarter', 'previous', 'year-over-year', 'compared to'
+            ],
+            'temporal': [
+                'quarter', 'year', 'month', 'annual', 'quarterly', 'monthly',
+                'q1', 'q2', 'q3', 'q4', 'fy', 'ytd', 'mtd', 'qoq', 'yoy',
+                'previous', 'prior', 'last', 'next', 'future', 'upcoming',
+                'historical', 'current', 'recent', 'latest'
+            ],
+        }
+    
+    def _load_topic_rules(self) -> List[tuple]:
+        """Load ordered (topic, terms) rules; the first matching rule wins."""
+        return [
+            ('Revenue & Growth', ['revenue', 'income', 'growth', 'earnings']),
+            ('Risk Management', ['risk', 'credit', 'provision', 'loss']),
+            ('Capital & Regulatory', ['capital', 'regulatory', 'basel', 'tier']),
+            ('Strategy & Outlook', ['strategy', 'outlook', 'guidance', 'plan']),
+            ('Operational Efficiency', ['cost', 'efficiency', 'expense', 'margin']),
+            ('Digital & Technology', ['digital', 'technology', 'innovation']),
+        ]
+    
+    def _load_figure_patterns(self) -> List[str]:
+        """Load regex patterns for financial figures."""
+        return [
+            r'\$[\d,]+\.?\d*\s*(?:billion|million|thousand|B|M|K)?',  # Dollar amounts
+            r'[\d,]+\.?\d*\s*(?:billion|million|thousand|percent|%|basis points|bps)',  # Numbers with units
+            r'[\d,]+\.?\d*\s*(?:dollars|cents)',  # Dollar/cent amounts
+            r'(?:approximately|about|around|roughly)\s*[\d,]+\.?\d*',  # Approximate figures
+        ]
+    
+    def _build_term_matcher(self) -> TermMatcher:
+        """Compile every term family into a single matcher."""
+        families = {'financial': self.financial_terms_list, **self.term_families}
+        for topic, terms in self.topic_rules:
+            families[f'topic:{topic}'] = terms
+        return TermMatcher(families)
+    
+    def extract_text_features(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Extract all text-derived feature columns in a single pass.
+        
+        Produces the same values as the per-row ``_extract_financial_terms``,
+        ``_extract_financial_figures``, ``_classify_actual_vs_projection``,
+        ``_assign_topic`` and ``_extract_temporal_indicators`` methods.
+        
+        Args:
+            texts: List of non-null strings
+            
+        Returns:
+            Dictionary of feature name to array with one value per text
+        """
+        n_rows = len(texts)
+        is_empty = np.fromiter((t == '' for t in texts), dtype=bool, count=n_rows)
+        matches = self.term_matcher.match(texts)
+        
+        # Actual vs projection: compare distinct indicator counts
+        projection_score = matches.count('projection')
+        actual_score = matches.count('actual')
+        data_type = np.select(
+            [is_empty, projection_score > actual_score, actual_score > projection_score],
+            ['unknown', 'projection', 'actual'],
+            default='unclear'
+        ).astype(object)
+        
+        # Primary topic: first rule with any term present
+        primary_topic = np.select(
+            [is_empty] + [matches.any(f'topic:{topic}') for topic, _ in self.topic_rules],
+            ['Unknown'] + [topic for topic, _ in self.topic_rules],
+            default='General Banking'
+        ).astype(object)
+        
+        # Financial figures: all matches of each pattern in pattern order.
+        # Every figure pattern needs a digit or comma, so only those rows are scanned.
+        digit_rows = np.flatnonzero(
+            np.fromiter((self._digit_pattern.search(t) is not None for t in texts), dtype=bool, count=n_rows)
+        )
+        digit_texts = [texts[i] for i in digit_rows]
+        figure_rows, figure_values = [], []
+        for pattern in self.figure_patterns:
+            rows, values = findall_rows(pattern, digit_texts)
+            figure_rows.append(digit_rows[rows])
+            figure_values.extend(values)
+        figure_rows = np.concatenate(figure_rows) if figure_rows else np.empty(0, dtype=np.int64)
+        order = np.argsort(figure_rows, kind='stable')
+        financial_figures = group_join(
+            figure_rows[order], np.array(figure_values, dtype=object)[order], n_rows
+        )
+        
+        return {
+            'word_count': np.fromiter((len(t.split()) for t in texts), dtype=np.int64, count=n_rows),
+            'all_financial_terms': matches.join('financial'),
+            'financial_figures': financial_figures,
+            'data_type': data_type,
+            'primary_topic': primary_topic,
+            'temporal_indicators': matches.join('temporal'),
+        }
+    
+    def extract_text_features_parallel(
+        self,
+        texts: List[str],
+        n_jobs: Optional[int] = None,
+        chunk_size: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Extract text features by partitioning rows across a process pool.
+        
+        Each worker compiles the term lists once in its initializer and then
+        processes whole partitions; partition results are concatenated in
+        input order.
+        
+        Args:
+            texts: List of non-null strings
+            n_jobs: Number of worker processes (-1 for all cores)
+            chunk_size: Number of rows per partition
+            
+        Returns:
+            Dictionary of feature name to array with one value per text
+        """
+        n_jobs = self.n_jobs if n_jobs is None else n_jobs
+        chunk_size = chunk_size or self.chunk_size
+        if n_jobs is None or n_jobs < 1:
+            n_jobs = os.cpu_count() or 1
+        
+        # Small inputs are not worth the pool start-up and pickling cost
+        if n_jobs == 1 or len(texts) <= chunk_size:
+            return self.extract_text_features(texts)
+        
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        self.logger.info(f"Extracting features for {len(texts)} rows in {len(chunks)} partitions on {n_jobs} workers")
+        
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                                 initargs=(self.config,)) as executor:
+            partitions = list(executor.map(_extract_chunk, chunks))
+        
+        return {
+            key: np.concatenate([partition[key] for partition in partitions])
+            for key in partitions[0]
+        }
+    
+    def add_nlp_features(
+        self,
+        df: pd.DataFrame,
+        n_jobs: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        inplace: bool = False
+    ) -> pd.DataFrame:
         """
         Add comprehensive NLP features with proper missing value handling.
         
@@ -69,30 +264,40 @@ class NLPProcessor:
         
         Args:
             df: Input DataFrame with basic ETL fields (text, speaker_norm, etc.)
+            n_jobs: Worker processes for text features (defaults to config
+                ``n_jobs``, 1 runs in-process, -1 uses all cores)
+            chunk_size: Rows per partition in parallel mode
+            inplace: Add the features to ``df`` itself instead of a copy,
+                avoiding a second copy of large frames in memory
             
         Returns:
             Enhanced DataFrame with additional NLP features
         """
         # Create a copy to avoid modifying the original
-        enhanced_df = df.copy()
+        enhanced_df = df if inplace else df.copy()
         
         # Handle missing text values first
         enhanced_df['text'] = enhanced_df['text'].fillna('').astype(str)
         enhanced_df['speaker_norm'] = enhanced_df['speaker_norm'].fillna('UNKNOWN').astype(str)
         
+        # Text features (terms, figures, data type, topic, temporal) in one pass
+        text_features = self.extract_text_features_parallel(
+            enhanced_df['text'].tolist(), n_jobs=n_jobs, chunk_size=chunk_size
+        )
+        
         # Basic text metrics (with zero defaults for missing)
-        enhanced_df['word_count'] = enhanced_df['text'].str.split().str.len().fillna(0).astype(int)
+        enhanced_df['word_count'] = text_features['word_count']
         enhanced_df['char_count'] = enhanced_df['text'].str.len().fillna(0).astype(int)
         
         # Extract financial terms from each text (never null)
-        enhanced_df['all_financial_terms'] = enhanced_df['text'].apply(self._extract_financial_terms)
+        enhanced_df['all_financial_terms'] = text_features['all_financial_terms']
         
         # Extract financial figures (numbers with financial context) - never null
-        enhanced_df['financial_figures'] = enhanced_df['text'].apply(self._extract_financial_figures)
+        enhanced_df['financial_figures'] = text_features['financial_figures']
         enhanced_df['financial_figures_text'] = enhanced_df['financial_figures']  # Compatibility
         
         # Classify actual vs projected financial data (never null)
-        enhanced_df['data_type'] = enhanced_df['text'].apply(self._classify_actual_vs_projection)
+        enhanced_df['data_type'] = text_features['data_type']
         
         # Boolean flags for data type (never null)
         enhanced_df['is_actual_data'] = (enhanced_df['data_type'] == 'actual').astype(bool)
@@ -116,7 +321,7 @@ class NLPProcessor:
         enhanced_df['is_named_speaker'] = (enhanced_df['speaker_norm'] != 'UNKNOWN').astype(bool)
         
         # Enhanced topic assignment (never null)
-        enhanced_df['primary_topic'] = enhanced_df['text'].apply(self._assign_topic)
+        enhanced_df['primary_topic'] = text_features['primary_topic']
         
         # Enhanced topic flags (never null)
         enhanced_df['has_financial_topic'] = enhanced_df['primary_topic'].str.contains(
@@ -131,7 +336,7 @@ class NLPProcessor:
         enhanced_df['has_unknown_topic'] = (enhanced_df['primary_topic'] == 'Unknown').astype(bool)
         
         # Temporal indicators
-        enhanced_df['temporal_indicators'] = enhanced_df['text'].apply(self._extract_temporal_indicators)
+        enhanced_df['temporal_indicators'] = text_features['temporal_indicators']
         enhanced_df['has_temporal_language'] = (enhanced_df['temporal_indicators'] != 'NONE').astype(bool)
         
         # Additional financial flags
@@ -165,18 +370,9 @@ class NLPProcessor:
         
         text_str = str(text)
         
-        # Patterns for financial figures
-        patterns = [
-            r'\$[\d,]+\.?\d*\s*(?:billion|million|thousand|B|M|K)?',  # Dollar amounts
-            r'[\d,]+\.?\d*\s*(?:billion|million|thousand|percent|%|basis points|bps)',  # Numbers with units
-            r'[\d,]+\.?\d*\s*(?:dollars|cents)',  # Dollar/cent amounts
-            r'(?:approximately|about|around|roughly)\s*[\d,]+\.?\d*',  # Approximate figures
-        ]
-        
         figures = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text_str, re.IGNORECASE)
-            figures.extend(matches)
+        for pattern in self.figure_patterns:
+            figures.extend(pattern.findall(text_str))
         
         return '|'.join(figures) if figures else 'NONE'
     
@@ -187,23 +383,8 @@ class NLPProcessor:
         
         text_lower = str(text).lower()
         
-        # Projection indicators
-        projection_terms = [
-            'expect', 'forecast', 'project', 'anticipate', 'estimate',
-            'guidance', 'outlook', 'target', 'goal', 'plan', 'intend',
-            'will be', 'should be', 'likely to', 'going forward',
-            'next quarter', 'next year', 'future', 'upcoming'
-        ]
-        
-        # Actual/historical indicators
-        actual_terms = [
-            'reported', 'achieved', 'delivered', 'recorded', 'posted',
-            'was', 'were', 'had', 'generated', 'earned', 'realized',
-            'last quarter', 'previous', 'year-over-year', 'compared to'
-        ]
-        
-        projection_score = sum(1 for term in projection_terms if term in text_lower)
-        actual_score = sum(1 for term in actual_terms if term in text_lower)
+        projection_score = sum(1 for term in self.term_families['projection'] if term in text_lower)
+        actual_score = sum(1 for term in self.term_families['actual'] if term in text_lower)
         
         if projection_score > actual_score:
             return 'projection'
@@ -218,20 +399,10 @@ class NLPProcessor:
             return 'Unknown'
         
         text_lower = str(text).lower()
-        if any(term in text_lower for term in ['revenue', 'income', 'growth', 'earnings']):
-            return 'Revenue & Growth'
-        elif any(term in text_lower for term in ['risk', 'credit', 'provision', 'loss']):
-            return 'Risk Management'
-        elif any(term in text_lower for term in ['capital', 'regulatory', 'basel', 'tier']):
-            return 'Capital & Regulatory'
-        elif any(term in text_lower for term in ['strategy', 'outlook', 'guidance', 'plan']):
-            return 'Strategy & Outlook'
-        elif any(term in text_lower for term in ['cost', 'efficiency', 'expense', 'margin']):
-            return 'Operational Efficiency'
-        elif any(term in text_lower for term in ['digital', 'technology', 'innovation']):
-            return 'Digital & Technology'
-        else:
-            return 'General Banking'
+        for topic, terms in self.topic_rules:
+            if any(term in text_lower for term in terms):
+                return topic
+        return 'General Banking'
     
     def _extract_temporal_indicators(self, text: str) -> str:
         """Extract temporal indicators from text."""
@@ -239,15 +410,9 @@ class NLPProcessor:
             return 'NONE'
         
         text_lower = str(text).lower()
-        temporal_terms = [
-            'quarter', 'year', 'month', 'annual', 'quarterly', 'monthly',
-            'q1', 'q2', 'q3', 'q4', 'fy', 'ytd', 'mtd', 'qoq', 'yoy',
-            'previous', 'prior', 'last', 'next', 'future', 'upcoming',
-            'historical', 'current', 'recent', 'latest'
-        ]
         
         found_terms = []
-        for term in temporal_terms:
+        for term in self.term_families['temporal']:
             if term in text_lower:
                 found_terms.append(term)
         
@@ -310,16 +475,25 @@ class NLPProcessor:
                 df[col] = df[col].fillna(default_val).astype(bool)
 
 
-def add_nlp_features(df: pd.DataFrame, config: Optional[Dict] = None) -> pd.DataFrame:
+def add_nlp_features(
+    df: pd.DataFrame,
+    config: Optional[Dict] = None,
+    n_jobs: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    inplace: bool = False
+) -> pd.DataFrame:
     """
     Convenience function to add NLP features to a DataFrame.
     
     Args:
         df: Input DataFrame with basic ETL fields
         config: Optional configuration dictionary
+        n_jobs: Worker processes for text features (-1 for all cores)
+        chunk_size: Rows per partition in parallel mode
+        inplace: Add the features to ``df`` instead of a copy
         
     Returns:
         Enhanced DataFrame with NLP features
     """
     processor = NLPProcessor(config)
-    return processor.add_nlp_features(df)
\ No newline at end of file
+    return processor.add_nlp_features(df, n_jobs=n_jobs, chunk_size=chunk_size, inplace=inplace)
\ No newline at end of file
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Multi-Pattern Term Matching
+===========================
+
+This module provides a single-pass matcher for the substring lexicons used
+across the NLP feature extractors. All term families are compiled into one
+trie-factored regular expression, which is run once over a whole column of
+texts instead of testing every term against every row with ``in``.
+
+When ``pyahocorasick`` is installed the terms are compiled into an
+Aho-Corasick automaton instead, which reports every occurrence directly.
+
+Results are identical to per-row ``term in text.lower()`` checks: the trie
+pattern returns the longest term starting at each position, and terms
+contained in a matched term are added back from a precomputed closure.
+"""
+
+import re
+import logging
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# Optional C automaton for multi-pattern matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logging.debug("pyahocorasick not available. Using trie regex term matching.")
+
+# Row separator for joined texts; never part of a term or a figure pattern
+ROW_SEPARATOR = '\x00'
+
+
+def build_trie_pattern(terms: Sequence[str]) -> str:
+    """
+    Build a prefix-factored regex alternation from a list of literal terms.
+
+    Continuations are tried before the end of a shorter term, so the pattern
+    matches the longest term available at a given position.
+
+    Args:
+        terms: Literal terms to match
+
+    Returns:
+        Regex source string (without surrounding group)
+    """
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def _build(node: Dict) -> str:
+        is_end = '' in node
+        branches = [
+            re.escape(char) + _build(child)
+            for char, child in sorted(node.items()) if char != ''
+        ]
+        if not branches:
+            return ''
+        if len(branches) == 1 and not is_end:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if is_end else group
+
+    return _build(trie)
+
+
+def iter_row_chunks(texts: Sequence[str], chunk_size: int):
+    """Yield ``(row_offset, chunk)`` slices of a text sequence."""
+    for start in range(0, len(texts), chunk_size):
+        yield start, texts[start:start + chunk_size]
+
+
+def join_rows(texts: Sequence[str]) -> Tuple[str, np.ndarray]:
+    """
+    Join texts with the row separator.
+
+    Args:
+        texts: Sequence of strings
+
+    Returns:
+        Tuple of (joined string, start offset of every row)
+    """
+    lengths = np.fromiter((len(t) + 1 for t in texts), dtype=np.int64, count=len(texts))
+    starts = np.zeros(len(texts), dtype=np.int64)
+    if len(texts) > 1:
+        np.cumsum(lengths[:-1], out=starts[1:])
+    return ROW_SEPARATOR.join(texts), starts
+
+
+def findall_rows(pattern: 're.Pattern', texts: Sequence[str],
+                 chunk_size: int = 100000) -> Tuple[np.ndarray, List[str]]:
+    """
+    Run a compiled regex over a column of texts in one pass per chunk.
+
+    Equivalent to ``pattern.findall(text)`` on every row, provided the
+    pattern cannot match the row separator.
+
+    Args:
+        pattern: Compiled regex without capturing groups
+        texts: Sequence of strings
+        chunk_size: Number of rows joined per regex pass
+
+    Returns:
+        Tuple of (row index of every match, matched strings)
+    """
+    rows: List[np.ndarray] = []
+    matches: List[str] = []
+    for offset, chunk in iter_row_chunks(texts, chunk_size):
+        joined, starts = join_rows(chunk)
+        positions = []
+        for match in pattern.finditer(joined):
+            positions.append(match.start())
+            matches.append(match.group(0))
+        rows.append(np.searchsorted(starts, positions, side='right') - 1 + offset)
+
+    if not rows:
+        return np.empty(0, dtype=np.int64), matches
+    return np.concatenate(rows).astype(np.int64), matches
+
+
+def group_join(rows: np.ndarray, values: np.ndarray, n_rows: int,
+               sep: str = '|', empty: str = 'NONE') -> np.ndarray:
+    """
+    Join values per row, keeping their order within each row.
+
+    Args:
+        rows: Row index of every value, grouped by row
+        values: Values to join (same length as ``rows``)
+        n_rows: Total number of rows
+        sep: Separator between values
+        empty: Value for rows without any values
+
+    Returns:
+        Object array of joined strings, one per row
+    """
+    result = np.full(n_rows, empty, dtype=object)
+    if len(rows) == 0:
+        return result
+
+    boundaries = np.flatnonzero(np.diff(rows)) + 1
+    group_starts = np.concatenate(([0], boundaries))
+    group_ends = np.concatenate((boundaries, [len(rows)]))
+    values = list(values)
+    for start, end in zip(group_starts.tolist(), group_ends.tolist()):
+        result[rows[start]] = sep.join(values[start:end])
+    return result
+
+
+class TermMatches:
+    """
+    Distinct term occurrences for a column of texts.
+
+    Holds one ``(row, term_id)`` pair per term present in a row, sorted by
+    row and term id, and exposes per-family reductions over them.
+    """
+
+    def __init__(self, matcher: 'TermMatcher', rows: np.ndarray, term_ids: np.ndarray, n_rows: int):
+        self.matcher = matcher
+        self.rows = rows
+        self.term_ids = term_ids
+        self.n_rows = n_rows
+
+    def _family_pairs(self, family: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Rows and family ranks of the pairs belonging to a family."""
+        ranks = self.matcher.family_ranks[family][self.term_ids]
+        mask = ranks >= 0
+        return self.rows[mask], ranks[mask]
+
+    def count(self, family: str) -> np.ndarray:
+        """Number of distinct family terms present in each row."""
+        rows, _ = self._family_pairs(family)
+        return np.bincount(rows, minlength=self.n_rows)
+
+    def any(self, family: str) -> np.ndarray:
+        """Whether any family term is present in each row."""
+        return self.count(family) > 0
+
+    def terms(self, family: str) -> List[List[str]]:
+        """List the family terms present in each row in family order."""
+        return self.select_terms([family], np.zeros(self.n_rows, dtype=np.int64))
+
+    def select_terms(self, families: Sequence[str], choice: np.ndarray) -> List[List[str]]:
+        """
+        List the terms of one chosen family per row, in family order.
+
+        Args:
+            families: Candidate family names
+            choice: Index into ``families`` for every row (-1 for none)
+
+        Returns:
+            List of matched terms per row
+        """
+        result: List[List[str]] = [[] for _ in range(self.n_rows)]
+        for index, family in enumerate(families):
+            rows, ranks = self._family_pairs(family)
+            keep = choice[rows] == index
+            rows, ranks = rows[keep], ranks[keep]
+            order = np.lexsort((ranks, rows))
+            names = self.matcher.family_terms[family][ranks[order]].tolist()
+            for row, name in zip(rows[order].tolist(), names):
+                result[row].append(name)
+        return result
+
+    def join(self, family: str, sep: str = '|', empty: str = 'NONE') -> np.ndarray:
+        """Join the family terms present in each row in family order."""
+        rows, ranks = self._family_pairs(family)
+        order = np.lexsort((ranks, rows))
+        names = self.matcher.family_terms[family][ranks[order]]
+        return group_join(rows[order], names, self.n_rows, sep=sep, empty=empty)
+
+
+class TermMatcher:
+    """
+    Single-pass substring matcher over several named term families.
+
+    Example:
+        >>> matcher = TermMatcher({'risk': ['risk', 'credit'], 'time': ['quarter']})
+        >>> matches = matcher.match(['Credit risk this quarter', 'Nothing here'])
+        >>> list(matches.join('risk'))
+        ['risk|credit', 'NONE']
+    """
+
+    def __init__(self, families: Dict[str, Sequence[str]], lowercase: bool = True,
+                 chunk_size: int = 100000):
+        """
+        Compile the term families.
+
+        Args:
+            families: Mapping of family name to ordered list of terms
+            lowercase: Lowercase texts before matching
+            chunk_size: Number of rows joined per regex pass
+        """
+        self.lowercase = lowercase
+        self.chunk_size = chunk_size
+
+        # Global vocabulary across all families
+        self.terms: List[str] = []
+        self.term_index: Dict[str, int] = {}
+        for family_terms in families.values():
+            for term in family_terms:
+                if term and term not in self.term_index:
+                    self.term_index[term] = len(self.terms)
+                    self.terms.append(term)
+
+        n_terms = len(self.terms)
+        self.family_terms: Dict[str, np.ndarray] = {}
+        self.family_ranks: Dict[str, np.ndarray] = {}
+        for family, family_terms in families.items():
+            ordered = list(dict.fromkeys(t for t in family_terms if t))
+            ranks = np.full(n_terms, -1, dtype=np.int64)
+            for rank, term in enumerate(ordered):
+                ranks[self.term_index[term]] = rank
+            self.family_terms[family] = np.array(ordered, dtype=object)
+            self.family_ranks[family] = ranks
+
+        # Terms contained in each term (including itself), as CSR arrays
+        contained = [[j for j, other in enumerate(self.terms) if other in term]
+                     for term in self.terms]
+        self._closure_counts = np.array([len(c) for c in contained], dtype=np.int64)
+        self._closure_indptr = np.concatenate(([0], np.cumsum(self._closure_counts)))
+        self._closure_indices = np.array([j for c in contained for j in c], dtype=np.int64)
+
+        self.pattern = None
+        self.automaton = None
+        if self.terms and AHOCORASICK_AVAILABLE:
+            self.automaton = ahocorasick.Automaton()
+            for term, term_id in self.term_index.items():
+                self.automaton.add_word(term, term_id)
+            self.automaton.make_automaton()
+        elif self.terms:
+            self.pattern = re.compile('(?=(' + build_trie_pattern(self.terms) + '))')
+
+    def _expand(self, term_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Expand matched term ids into all terms they contain."""
+        counts = self._closure_counts[term_ids]
+        owners = np.repeat(np.arange(len(term_ids)), counts)
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return owners, self._closure_indices[self._closure_indptr[term_ids][owners] + within]
+
+    def _scan(self, joined: str) -> Tuple[List[int], List[int]]:
+        """Return the position and term id of every match in a joined string."""
+        if self.automaton is not None:
+            hits = list(self.automaton.iter(joined))
+            return [end for end, _ in hits], [term_id for _, term_id in hits]
+
+        term_index = self.term_index
+        positions, matched = [], []
+        for match in self.pattern.finditer(joined):
+            positions.append(match.start())
+            matched.append(term_index[match.group(1)])
+        return positions, matched
+
+    def match(self, texts: Sequence[str]) -> TermMatches:
+        """
+        Find every term present in every text.
+
+        Args:
+            texts: Sequence of strings
+
+        Returns:
+            TermMatches for the column
+        """
+        n_rows = len(texts)
+        if not self.terms or n_rows == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return TermMatches(self, empty, empty, n_rows)
+
+        row_parts: List[np.ndarray] = []
+        term_parts: List[np.ndarray] = []
+        for offset, chunk in iter_row_chunks(texts, self.chunk_size):
+            if self.lowercase:
+                chunk = [t.lower() for t in chunk]
+            joined, starts = join_rows(chunk)
+
+            positions, matched = self._scan(joined)
+            row_parts.append(np.searchsorted(starts, positions, side='right') - 1 + offset)
+            term_parts.append(np.array(matched, dtype=np.int64))
+
+        rows = np.concatenate(row_parts).astype(np.int64)
+        term_ids = np.concatenate(term_parts)
+
+        # The trie regex reports one term per position; add contained terms back
+        if self.automaton is None:
+            owners, term_ids = self._expand(term_ids)
+            rows = rows[owners]
+
+        keys = np.unique(rows * len(self.terms) + term_ids)
+        return TermMatches(self, keys // len(self.terms), keys % len(self.terms), n_rows)
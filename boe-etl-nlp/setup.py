@@ -48,6 +48,7 @@ setup(
         "boe-etl>=1.0.0",  # Core dependency
         "bertopic>=0.15.0",
         "scikit-learn>=1.3.0",
+        "pyarrow>=10.0.0",
         "plotly>=5.15.0",
         "nltk>=3.8.0",
         "spacy>=3.6.0",
@@ -69,6 +70,9 @@ setup(
             "seaborn>=0.11.0",
             "wordcloud>=1.9.0",
         ],
+        "fast": [
+            "pyahocorasick>=2.0.0",
+        ],
         "all": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -78,6 +82,7 @@ setup(
             "matplotlib>=3.5.0",
             "seaborn>=0.11.0",
             "wordcloud>=1.9.0",
+            "pyahocorasick>=2.0.0",
         ],
     },
     entry_points={
@@ -0,0 +1,122 @@
+"""
+Tests for column-wise financial classification
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add the package root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from boe_etl_nlp.analytics.classification import FinancialClassifier
+
+RECORDS = [
+    ('Revenue and net income beat guidance on the earnings call', 'q1_call.txt'),
+    ('Risk factors and headwinds: risks, uncertainties', ''),
+    ('Tier 1 capital ratio and risk weighted assets under Basel', 'supplement.pdf'),
+    # Tie between income statement and balance sheet indicators
+    ('Income rose while assets grew', ''),
+    # Tie between performance and outlook categories
+    ('revenue guidance', 'press release.txt'),
+    ('Nothing to classify here', ''),
+    ('', 'investor presentation deck.pdf'),
+    ('', ''),
+    (None, ''),
+    ('OPERATING CASH FLOW and Free Cash Flow improved', 'Annual Report 10-K.pdf'),
+    ('Digital transformation is our growth strategy', None),
+]
+
+
+@pytest.fixture
+def classifier():
+    return FinancialClassifier()
+
+
+def per_row(classifier, text, filename):
+    """Reference classification with the per-record methods."""
+    document = classifier.classify_document_type(text, filename or '')
+    content = classifier.classify_content_category(text)
+    statement = classifier.classify_financial_statement_type(text)
+    return {
+        'document_type': document['document_type'],
+        'document_confidence': document['confidence'],
+        'content_category': content['primary_category'],
+        'content_confidence': content['confidence'],
+        'statement_type': statement['statement_type'],
+        'statement_confidence': statement['confidence'],
+        'classification_metadata': {
+            'doc_type_patterns': document['matched_patterns'],
+            'category_scores': content['category_scores'],
+            'statement_indicators': statement['indicators'],
+        },
+    }
+
+
+def test_classify_columns_matches_per_row_classifier(classifier):
+    texts = [text for text, _ in RECORDS]
+    filenames = [filename or '' for _, filename in RECORDS]
+
+    result = classifier.classify_columns(texts, filenames, include_metadata=True)
+
+    assert len(result) == len(RECORDS)
+    for row, (text, filename) in zip(result.to_dict('records'), RECORDS):
+        expected = per_row(classifier, text, filename)
+        assert row.keys() == expected.keys()
+        for column, value in expected.items():
+            if column.endswith('_confidence'):
+                assert row[column] == pytest.approx(value), (text, column)
+            else:
+                assert row[column] == value, (text, column)
+
+
+def test_classify_dataframe_keeps_index_and_columns(classifier):
+    df = pd.DataFrame(
+        {'text': [text for text, _ in RECORDS], 'source_file': [f or '' for _, f in RECORDS]},
+        index=range(100, 100 + len(RECORDS))
+    )
+
+    result = classifier.classify_dataframe(df)
+
+    assert result.index.equals(df.index)
+    pd.testing.assert_frame_equal(result[df.columns], df)
+    for (_, row), (text, filename) in zip(result.iterrows(), RECORDS):
+        expected = per_row(classifier, text, filename)
+        assert row['document_type'] == expected['document_type']
+        assert row['content_category'] == expected['content_category']
+        assert row['statement_type'] == expected['statement_type']
+    assert 'classification_metadata' not in result.columns
+
+
+def test_classify_dataframe_without_filename_column(classifier):
+    df = pd.DataFrame({'text': ['Quarterly call on revenue', 'slide deck']})
+
+    result = classifier.classify_dataframe(df)
+
+    assert result['document_type'].tolist() == [
+        classifier.classify_document_type(text)['document_type'] for text in df['text']
+    ]
+
+
+def test_classify_columns_accepts_arrow_arrays(classifier):
+    pa = pytest.importorskip('pyarrow')
+    texts = [text for text, _ in RECORDS]
+
+    from_arrow = classifier.classify_columns(pa.array(texts))
+    from_list = classifier.classify_columns(texts)
+
+    pd.testing.assert_frame_equal(from_arrow, from_list)
+
+
+def test_classify_batch_matches_per_row_classifier(classifier):
+    records = [{'text': text, 'source_file': filename or '', 'id': i} for i, (text, filename) in enumerate(RECORDS)]
+
+    classified = classifier.classify_batch(records)
+
+    for record, result in zip(records, classified):
+        expected = per_row(classifier, record['text'], record['source_file'])
+        assert result['id'] == record['id']
+        assert result['document_type'] == expected['document_type']
+        assert result['classification_metadata'] == expected['classification_metadata']
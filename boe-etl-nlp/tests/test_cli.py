@@ -0,0 +1,119 @@
+"""
+Tests for the command line interface
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add the package root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from boe_etl_nlp import cli
+from boe_etl_nlp.processing import feature_extraction
+
+TEXTS = [
+    'Revenue was $1,234.5 million, up 12% year-over-year.',
+    'We expect next quarter guidance to improve by about 50 basis points.',
+    'Credit provisions of 2.5 billion dollars were recorded last quarter.',
+    'Our digital strategy will be delivered in FY2025.',
+    'Nothing financial here',
+    None,
+    'Tier 1 capital ratio reached 14.2 percent; cost efficiency improved.',
+]
+
+
+def make_input(rows: int) -> pd.DataFrame:
+    """Transcript-like rows with a distinct id so row order is observable."""
+    return pd.DataFrame({
+        'sentence_id': range(rows),
+        'speaker_norm': [['CEO', 'Analyst', None][i % 3] for i in range(rows)],
+        'text': [TEXTS[i % len(TEXTS)] for i in range(rows)],
+    })
+
+
+def read_output(path: Path) -> pd.DataFrame:
+    """Read a CLI output file without the run-dependent timestamp column."""
+    df = pd.read_parquet(path) if path.suffix == '.parquet' else pd.read_csv(path)
+    return df.drop(columns=['processing_date'])
+
+
+def run_cli(monkeypatch, *args: str) -> None:
+    monkeypatch.setattr(sys, 'argv', ['boe-etl-nlp', *map(str, args)])
+    cli.main()
+
+
+def test_process_jobs_output_matches_serial(tmp_path, monkeypatch):
+    input_file = tmp_path / 'input.csv'
+    make_input(47).to_csv(input_file, index=False)
+
+    # Small partitions so --jobs 2 splits the input into several chunks
+    monkeypatch.setattr(feature_extraction, 'DEFAULT_CHUNK_SIZE', 10)
+    pools = []
+
+    class RecordingPool(feature_extraction.ProcessPoolExecutor):
+        def map(self, fn, *iterables, **kwargs):
+            chunks = list(iterables[0])
+            pools.append(len(chunks))
+            return super().map(fn, chunks, **kwargs)
+
+    monkeypatch.setattr(feature_extraction, 'ProcessPoolExecutor', RecordingPool)
+
+    run_cli(monkeypatch, 'process', input_file, '--jobs', '1', '--output', tmp_path / 'serial.csv')
+    run_cli(monkeypatch, 'process', input_file, '--jobs', '2', '--output', tmp_path / 'parallel.csv')
+
+    assert pools == [5]
+
+    serial = read_output(tmp_path / 'serial.csv')
+    parallel = read_output(tmp_path / 'parallel.csv')
+
+    assert parallel['sentence_id'].tolist() == list(range(47))
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+def test_stream_matches_in_memory_transform(tmp_path, monkeypatch):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+
+    df = make_input(23)
+    # Only filled in the last batch, so earlier batches see an all-null column
+    df['analyst_note'] = [None] * 20 + ['follow up', 'capital', 'risk']
+    input_file = tmp_path / 'input.parquet'
+    df.to_parquet(input_file, index=False)
+
+    run_cli(monkeypatch, 'process', input_file, '--output', tmp_path / 'memory.parquet')
+    run_cli(monkeypatch, 'process', input_file, '--stream', '--batch-size', '5',
+            '--output', tmp_path / 'streamed.parquet')
+
+    streamed_file = pq.ParquetFile(tmp_path / 'streamed.parquet')
+    assert streamed_file.metadata.num_row_groups == 5
+    input_schema = pq.read_schema(input_file)
+    for column in df.columns:
+        assert streamed_file.schema_arrow.field(column).type == input_schema.field(column).type
+    assert pa.types.is_integer(streamed_file.schema_arrow.field('word_count').type)
+
+    # Every batch was written with the same schema as the in-memory output
+    memory_schema = pq.read_schema(tmp_path / 'memory.parquet').remove_metadata()
+    assert streamed_file.schema_arrow.remove_metadata() == memory_schema
+    for index in range(streamed_file.metadata.num_row_groups):
+        assert streamed_file.read_row_group(index).schema.remove_metadata() == memory_schema
+
+    pd.testing.assert_frame_equal(
+        read_output(tmp_path / 'streamed.parquet'),
+        read_output(tmp_path / 'memory.parquet')
+    )
+
+
+def test_stream_writer_keeps_first_batch_columns(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    output_file = tmp_path / 'out.parquet'
+
+    with cli.StreamWriter(output_file) as writer:
+        writer.write(pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}))
+        writer.write(pd.DataFrame({'b': ['z'], 'a': [3], 'extra': [0.5]}))
+
+    result = pq.read_table(output_file).to_pandas()
+    assert list(result.columns) == ['a', 'b']
+    assert result.to_dict('list') == {'a': [1, 2, 3], 'b': ['x', 'y', 'z']}
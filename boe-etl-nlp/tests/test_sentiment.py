@@ -0,0 +1,77 @@
+"""
+Tests for batch lexicon sentiment scoring
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add the package root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from boe_etl_nlp.analytics.sentiment import SentimentAnalyzer
+
+TEXTS = [
+    'Strong growth and robust margins despite risk',
+    'Loss loss LOSS and a challenging, difficult quarter',
+    'Risk growth',
+    'growth, strong. (Healthy) outlook',
+    'Nothing in the lexicon here',
+    '',
+    None,
+    'improved improved decline decline',
+    'Growth ' + 'filler ' * 150,
+    '   ',
+]
+
+
+@pytest.fixture
+def analyzer():
+    return SentimentAnalyzer()
+
+
+def test_score_batch_matches_per_text_scorer(analyzer):
+    result = analyzer.score_batch(TEXTS, include_terms=True)
+
+    assert len(result) == len(TEXTS)
+    for row, text in zip(result.to_dict('records'), TEXTS):
+        expected = analyzer.analyze_sentiment(text)
+        assert row['sentiment_label'] == expected['sentiment_label'], text
+        assert row['sentiment_score'] == pytest.approx(expected['sentiment_score'], abs=1e-12)
+        assert row['confidence'] == pytest.approx(expected['confidence'], abs=1e-12)
+        # Matched terms keep their token order and repeats
+        assert row['positive_terms'] == expected['positive_terms']
+        assert row['negative_terms'] == expected['negative_terms']
+
+
+def test_score_batch_without_terms_has_score_columns_only(analyzer):
+    with_terms = analyzer.score_batch(TEXTS, include_terms=True)
+    without_terms = analyzer.score_batch(TEXTS)
+
+    assert list(without_terms.columns) == ['sentiment_score', 'sentiment_label', 'confidence']
+    assert without_terms.equals(with_terms[without_terms.columns])
+
+
+def test_analyze_batch_matches_per_text_scorer(analyzer):
+    results = analyzer.analyze_batch(TEXTS)
+
+    for result, text in zip(results, TEXTS):
+        expected = analyzer.analyze_sentiment(text)
+        assert result.keys() == expected.keys()
+        assert result['sentiment_label'] == expected['sentiment_label']
+        assert np.isclose(result['sentiment_score'], expected['sentiment_score'])
+        assert result['positive_terms'] == expected['positive_terms']
+        assert result['negative_terms'] == expected['negative_terms']
+
+
+def test_document_term_matrix_counts_lexicon_tokens(analyzer):
+    matrix, lengths = analyzer.build_document_term_matrix(['risk growth risk', None])
+
+    assert lengths.tolist() == [3, 0]
+    assert matrix.shape == (2, len(analyzer.vocabulary))
+    dense = matrix.toarray()
+    assert dense[0, analyzer.vocabulary_index['risk']] == 2
+    assert dense[0, analyzer.vocabulary_index['growth']] == 1
+    assert dense[1].sum() == 0
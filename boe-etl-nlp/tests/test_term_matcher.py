@@ -0,0 +1,174 @@
+"""
+Tests for single-pass term matching and text feature extraction
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the package root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from boe_etl_nlp.processing import term_matcher as term_matcher_module
+from boe_etl_nlp.processing.term_matcher import TermMatcher
+from boe_etl_nlp.processing.feature_extraction import NLPProcessor
+
+# Overlapping (risk/risky/risk weighted), multi-word and prefix-sharing terms
+FAMILIES = {
+    'risk': ['risk', 'risky', 'risk weighted', 'credit risk', 'credit', 'edit'],
+    'time': ['next quarter', 'quarter', 'quarterly', 'q4', 'year', 'year-over-year'],
+    'empty': [],
+}
+
+TEXTS = [
+    'Credit Risk rose next QUARTER',
+    'RISK WEIGHTED assets grew year-over-year',
+    'A risky quarterly Q4 edit',
+    'creditrisk without a space',
+    'Nothing to see here',
+    '',
+    'risk risk RISK credit credit',
+    'Year\x01quarter',
+]
+
+
+@pytest.fixture(params=['automaton', 'trie'])
+def backend(request, monkeypatch):
+    """Run each test with the Aho-Corasick automaton and the trie regex fallback."""
+    if request.param == 'automaton':
+        pytest.importorskip('ahocorasick')
+    else:
+        monkeypatch.setattr(term_matcher_module, 'AHOCORASICK_AVAILABLE', False)
+    return request.param
+
+
+def per_term_matches(terms, text):
+    """Reference: one escaped regex search per term, as in the per-row extractors."""
+    return [term for term in terms if re.search(re.escape(term), text.lower())]
+
+
+def test_matcher_matches_per_term_search(backend):
+    matcher = TermMatcher(FAMILIES)
+    assert (matcher.automaton is not None) == (backend == 'automaton')
+
+    matches = matcher.match(TEXTS)
+
+    for family, terms in FAMILIES.items():
+        expected = [per_term_matches(terms, text) for text in TEXTS]
+        assert matches.terms(family) == expected
+        assert matches.count(family).tolist() == [len(found) for found in expected]
+        assert matches.any(family).tolist() == [bool(found) for found in expected]
+        assert matches.join(family).tolist() == ['|'.join(found) or 'NONE' for found in expected]
+
+
+def test_matcher_reports_contained_terms(backend):
+    matches = TermMatcher(FAMILIES).match(['credit risk weighted'])
+
+    # Every term inside the longest match is reported, including 'edit'
+    assert matches.terms('risk') == [['risk', 'risk weighted', 'credit risk', 'credit', 'edit']]
+
+
+def test_matcher_chunking_keeps_rows_aligned(backend):
+    texts = TEXTS * 5
+    matches = TermMatcher(FAMILIES, chunk_size=3).match(texts)
+
+    assert matches.terms('time') == [per_term_matches(FAMILIES['time'], text) for text in texts]
+
+
+# Reference implementation of the per-row extractors before single-pass extraction
+FINANCIAL_FIGURE_PATTERNS = [
+    r'\$[\d,]+\.?\d*\s*(?:billion|million|thousand|B|M|K)?',
+    r'[\d,]+\.?\d*\s*(?:billion|million|thousand|percent|%|basis points|bps)',
+    r'[\d,]+\.?\d*\s*(?:dollars|cents)',
+    r'(?:approximately|about|around|roughly)\s*[\d,]+\.?\d*',
+]
+
+
+def reference_features(processor, texts):
+    """Feature columns as computed row by row with per-term ``in`` checks."""
+    series = pd.Series(texts)
+
+    def terms(vocabulary):
+        return series.apply(
+            lambda t: ('|'.join(term for term in vocabulary if term in t.lower()) or 'NONE') if t else 'NONE'
+        )
+
+    def figures(text):
+        if text == '':
+            return 'NONE'
+        found = []
+        for pattern in FINANCIAL_FIGURE_PATTERNS:
+            found.extend(re.findall(pattern, text, re.IGNORECASE))
+        return '|'.join(found) if found else 'NONE'
+
+    def data_type(text):
+        if text == '':
+            return 'unknown'
+        lower = text.lower()
+        projection = sum(1 for term in processor.term_families['projection'] if term in lower)
+        actual = sum(1 for term in processor.term_families['actual'] if term in lower)
+        if projection > actual:
+            return 'projection'
+        if actual > projection:
+            return 'actual'
+        return 'unclear'
+
+    def topic(text):
+        if text == '':
+            return 'Unknown'
+        lower = text.lower()
+        for name, vocabulary in processor.topic_rules:
+            if any(term in lower for term in vocabulary):
+                return name
+        return 'General Banking'
+
+    return {
+        'word_count': series.str.split().str.len().fillna(0).astype(int),
+        'all_financial_terms': terms(processor.financial_terms_list),
+        'financial_figures': series.apply(figures),
+        'data_type': series.apply(data_type),
+        'primary_topic': series.apply(topic),
+        'temporal_indicators': terms(processor.term_families['temporal']),
+    }
+
+
+FEATURE_TEXTS = [
+    'Revenue was $1,234.5 million, up 12% year-over-year.',
+    'We expect NEXT QUARTER guidance to improve by about 50 basis points.',
+    'Credit provisions of 2.5 billion dollars were recorded last quarter.',
+    'Our digital strategy will be delivered in FY2025 and Q4.',
+    'Nothing financial here',
+    '',
+    'Tier 1 capital ratio reached 14.2 percent; cost efficiency improved.',
+    'approximately 3,000 staff, roughly 40 cents per share, $5B buyback',
+    '   ',
+]
+
+
+def test_extract_text_features_matches_per_row_reference(backend):
+    processor = NLPProcessor()
+    texts = FEATURE_TEXTS * 3
+
+    features = processor.extract_text_features(texts)
+    expected = reference_features(processor, texts)
+
+    assert set(features) == set(expected)
+    for column, values in expected.items():
+        assert len(features[column]) == len(texts)
+        assert list(features[column]) == values.tolist(), column
+
+
+def test_extract_text_features_matches_per_row_methods(backend):
+    processor = NLPProcessor()
+
+    features = processor.extract_text_features(FEATURE_TEXTS)
+
+    assert list(features['all_financial_terms']) == [processor._extract_financial_terms(t) for t in FEATURE_TEXTS]
+    assert list(features['financial_figures']) == [processor._extract_financial_figures(t) for t in FEATURE_TEXTS]
+    assert list(features['data_type']) == [processor._classify_actual_vs_projection(t) for t in FEATURE_TEXTS]
+    assert list(features['primary_topic']) == [processor._assign_topic(t) for t in FEATURE_TEXTS]
+    assert list(features['temporal_indicators']) == [processor._extract_temporal_indicators(t) for t in FEATURE_TEXTS]
@@ -7,14 +7,14 @@ to business insights.
 
 Key Features:
 - Document processing pipeline integration
-- Real-time analysis orchestration
+- Real-time analysis orchestration (concurrent documents, CPU stages in worker processes)
 - Results caching and optimization
 - Error handling and fallback mechanisms
 """
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from pathlib import Path
 import logging
 import json
@@ -24,6 +24,8 @@ import os
 from datetime import datetime
 import asyncio
 import concurrent.futures
+import multiprocessing
+from concurrent.futures.process import BrokenProcessPool
 
 # Add project paths
 sys.path.append(str(Path(__file__).parent.parent.parent))
@@ -38,10 +40,152 @@ try:
 except ImportError as e:
     logging.error(f"Import error in dashboard integration: {e}")
 
+# Optional FinBERT sentiment stage (requires transformers and torch)
+try:
+    from scripts.sentiment_analysis.finbert_analyzer import FinBERTAnalyzer
+    FINBERT_AVAILABLE = True
+except ImportError:
+    FINBERT_AVAILABLE = False
+    logging.debug("FinBERT not available. Sentiment stage disabled.")
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+# Sentiment analyzer owned by each pipeline worker process (loaded on first use)
+_WORKER_SENTIMENT_ANALYZER = None
+_WORKER_NUM_THREADS = 1
+
+
+def _init_pipeline_worker(num_threads: int):
+    """Record the worker's share of the cores"""
+    global _WORKER_NUM_THREADS
+    _WORKER_NUM_THREADS = num_threads
+
+
+def _parse_text_document(file_path: Path, institution: str, quarter: str) -> List[Dict[str, Any]]:
+    """Parse a text document (transcript, PDF) into records in a worker process"""
+    # Read file content
+    if file_path.suffix.lower() == '.pdf':
+        # For PDF files, we'd use a PDF parser here
+        # For now, simulate content extraction
+        content = f"Sample content from {file_path.name}"
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    
+    # Split content into segments (simulate speaker segments)
+    segments = DashboardIntegration._split_content_into_segments(content)
+    
+    records = []
+    for i, segment in enumerate(segments):
+        record = {
+            'text': segment,
+            'speaker_norm': DashboardIntegration._identify_speaker(segment),
+            'source_file': file_path.name,
+            'institution': institution,
+            'quarter': quarter,
+            'segment_id': i,
+            'document_type': 'transcript'
+        }
+        records.append(record)
+    
+    return records
+
+
+def _parse_spreadsheet(file_path: Path, institution: str, quarter: str) -> List[Dict[str, Any]]:
+    """Parse a spreadsheet (financial data) into records in a worker process"""
+    # Read spreadsheet
+    if file_path.suffix.lower() == '.xlsx':
+        df = pd.read_excel(file_path)
+    else:
+        df = pd.read_csv(file_path)
+    
+    records = []
+    for _, row in df.iterrows():
+        record = {
+            'text': DashboardIntegration._convert_row_to_text(row),
+            'speaker_norm': 'Financial Data',
+            'source_file': file_path.name,
+            'institution': institution,
+            'quarter': quarter,
+            'document_type': 'financial_data'
+        }
+        records.append(record)
+    
+    return records
+
+
+def _score_sentiment(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Add FinBERT sentiment to one document's records in a worker process"""
+    global _WORKER_SENTIMENT_ANALYZER
+    if _WORKER_SENTIMENT_ANALYZER is None:
+        _WORKER_SENTIMENT_ANALYZER = FinBERTAnalyzer(num_threads=_WORKER_NUM_THREADS)
+    return _WORKER_SENTIMENT_ANALYZER.analyze_dataframe(pd.DataFrame(records)).to_dict('records')
+
+
+def _score_risk(risk_scorer: Any, data: pd.DataFrame) -> Dict[str, Any]:
+    """Run risk scoring in a worker process"""
+    try:
+        return risk_scorer.calculate_risk_scores(data)
+    except Exception as e:
+        logger.error(f"Risk scoring failed: {e}")
+        return {'overall_risk_score': 0.5, 'error': str(e)}
+
+
+class PipelineProgress:
+    """
+    Per-stage progress events for one pipeline run
+    
+    Each event is a dict with 'stage', 'status' ('started', 'completed',
+    'skipped', 'failed' or 'cancelled'), 'document' (None for corpus-wide
+    stages), document counters, an overall 'progress' fraction, a readable
+    'message' and a 'timestamp'. Document stages cover the first 70% of the
+    run, statistical analysis the next 20% and insights the rest.
+    """
+    
+    DOCUMENT_SHARE = 0.7
+    STAGE_PROGRESS = {
+        ('statistical_analysis', 'completed'): 0.9,
+        ('stakeholder_insights', 'completed'): 0.95,
+        ('pipeline', 'completed'): 1.0
+    }
+    
+    def __init__(self, total_documents: int, callback: Optional[Callable[[Dict[str, Any]], Any]] = None):
+        self.total_documents = total_documents
+        self.callback = callback
+        self.completed_documents = 0
+        self.in_flight_documents = 0
+        self.progress = 0.0
+        self.events = []
+    
+    def emit(self, stage: str, status: str, document: Optional[str] = None, **details):
+        """Record an event and pass it to the callback (callback errors are logged)"""
+        self.progress = max(self.progress, self.STAGE_PROGRESS.get(
+            (stage, status),
+            self.DOCUMENT_SHARE * self.completed_documents / max(self.total_documents, 1)
+        ))
+        event = {
+            'stage': stage,
+            'status': status,
+            'document': document,
+            'completed_documents': self.completed_documents,
+            'total_documents': self.total_documents,
+            'in_flight_documents': self.in_flight_documents,
+            'progress': self.progress,
+            'message': f"{stage.replace('_', ' ').capitalize()} {status}" + (f": {document}" if document else ''),
+            'timestamp': datetime.now().isoformat(),
+            **details
+        }
+        self.events.append(event)
+        
+        if self.callback is not None:
+            try:
+                self.callback(event)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+
 class DashboardIntegration:
     """
     Orchestrates the complete analysis pipeline for stakeholder dashboard
@@ -58,8 +202,11 @@ class DashboardIntegration:
             self.schema_transformer = SchemaTransformer()
             
             # Processing configuration
-            self.max_workers = 4
+            self.max_workers = 4  # Worker processes for CPU stages
+            self.max_in_flight_documents = 8  # Documents saved, parsed or scored at once
             self.timeout_seconds = 300  # 5 minutes
+            self.enable_sentiment = FINBERT_AVAILABLE
+            self._process_pool = None
             
             logger.info("Dashboard integration initialized successfully")
             
@@ -67,30 +214,42 @@ class DashboardIntegration:
             logger.error(f"Failed to initialize dashboard integration: {e}")
             raise
     
-    async def process_documents_async(self, uploaded_files: List[Any], institution: str) -> Dict[str, Any]:
+    async def process_documents_async(self, uploaded_files: List[Any], institution: str,
+                                      progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None) -> Dict[str, Any]:
         """
         Asynchronously process uploaded documents and generate stakeholder insights
         
+        Documents are processed concurrently, at most ``max_in_flight_documents``
+        at a time. Parsing, FinBERT scoring and risk scoring run in a pool of
+        ``max_workers`` processes, so the event loop stays responsive.
+        Cancelling the awaiting task cancels all in-flight documents; queued
+        pool work is dropped and stages already running finish unused.
+        
         Args:
             uploaded_files: List of uploaded file objects
             institution: Institution name for analysis
+            progress_callback: Called with every progress event (see PipelineProgress)
             
         Returns:
             Complete analysis results with stakeholder-friendly insights
         """
+        progress = PipelineProgress(len(uploaded_files), progress_callback)
         try:
             logger.info(f"Starting document processing for {institution} with {len(uploaded_files)} files")
+            progress.emit('pipeline', 'started')
             
             # Step 1: Process documents through ETL pipeline
-            processed_data = await self._process_documents_etl(uploaded_files, institution)
+            processed_data = await self._process_documents_etl(uploaded_files, institution, progress)
             
             # Step 2: Run statistical analysis
-            statistical_results = await self._run_statistical_analysis(processed_data)
+            statistical_results = await self._run_statistical_analysis(processed_data, progress)
             
             # Step 3: Generate stakeholder insights
+            progress.emit('stakeholder_insights', 'started')
             stakeholder_insights = await self._generate_stakeholder_insights(
                 statistical_results, institution
             )
+            progress.emit('stakeholder_insights', 'completed')
             
             # Step 4: Compile final results
             final_results = self._compile_final_results(
@@ -98,19 +257,28 @@ class DashboardIntegration:
             )
             
             logger.info(f"Document processing completed successfully for {institution}")
+            progress.emit('pipeline', 'completed')
             return final_results
             
+        except asyncio.CancelledError:
+            logger.info(f"Document processing cancelled for {institution}")
+            progress.emit('pipeline', 'cancelled')
+            raise
+            
         except Exception as e:
             logger.error(f"Document processing failed: {e}")
+            progress.emit('pipeline', 'failed', error=str(e))
             return self._generate_fallback_results(institution, str(e))
     
-    def process_documents_sync(self, uploaded_files: List[Any], institution: str) -> Dict[str, Any]:
+    def process_documents_sync(self, uploaded_files: List[Any], institution: str,
+                               progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None) -> Dict[str, Any]:
         """
         Synchronous wrapper for document processing
         
         Args:
             uploaded_files: List of uploaded file objects
             institution: Institution name for analysis
+            progress_callback: Called with every progress event
             
         Returns:
             Complete analysis results with stakeholder-friendly insights
@@ -120,7 +288,7 @@ class DashboardIntegration:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             result = loop.run_until_complete(
-                self.process_documents_async(uploaded_files, institution)
+                self.process_documents_async(uploaded_files, institution, progress_callback)
             )
             loop.close()
             return result
@@ -129,17 +297,20 @@ class DashboardIntegration:
             logger.error(f"Synchronous processing failed: {e}")
             return self._generate_fallback_results(institution, str(e))
     
-    async def _process_documents_etl(self, uploaded_files: List[Any], institution: str) -> pd.DataFrame:
+    async def _process_documents_etl(self, uploaded_files: List[Any], institution: str,
+                                     progress: Optional[PipelineProgress] = None) -> pd.DataFrame:
         """
         Process documents through ETL pipeline
         
         Args:
             uploaded_files: List of uploaded file objects
             institution: Institution name
+            progress: Progress events for this run
             
         Returns:
             Processed DataFrame with NLP features
         """
+        progress = progress or PipelineProgress(len(uploaded_files))
         try:
             logger.info("Processing documents through ETL pipeline")
             
@@ -147,46 +318,31 @@ class DashboardIntegration:
             with tempfile.TemporaryDirectory() as temp_dir:
                 temp_path = Path(temp_dir)
                 
-                # Save uploaded files to temporary directory
-                file_paths = []
-                for file in uploaded_files:
-                    file_path = temp_path / file.name
-                    with open(file_path, 'wb') as f:
-                        f.write(file.getvalue())
-                    file_paths.append(file_path)
-                
-                # Process files through ETL pipeline
-                processed_records = []
+                # One task per file; the semaphore holds back the rest until a slot frees up
+                in_flight = asyncio.Semaphore(self.max_in_flight_documents)
+                tasks = [
+                    asyncio.ensure_future(self._process_document(
+                        file, temp_path / str(i), institution, in_flight, progress
+                    ))
+                    for i, file in enumerate(uploaded_files)
+                ]
+                try:
+                    document_records = await asyncio.gather(*tasks)
+                except BaseException:
+                    # Cancelled (or failed): stop the remaining documents before removing their files
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
                 
-                for file_path in file_paths:
-                    try:
-                        # Determine quarter from filename or use default
-                        quarter = self._extract_quarter_from_filename(file_path.name)
-                        
-                        # Process file based on type
-                        if file_path.suffix.lower() in ['.txt', '.pdf']:
-                            records = await self._process_text_document(file_path, institution, quarter)
-                        elif file_path.suffix.lower() in ['.xlsx', '.csv']:
-                            records = await self._process_spreadsheet(file_path, institution, quarter)
-                        else:
-                            logger.warning(f"Unsupported file type: {file_path.suffix}")
-                            continue
-                        
-                        processed_records.extend(records)
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to process {file_path.name}: {e}")
-                        continue
+                processed_records = [record for records in document_records for record in records]
                 
                 # Convert to DataFrame
                 if processed_records:
-                    df = pd.DataFrame(processed_records)
-                    
-                    # Add NLP features using schema transformer
-                    enhanced_df = self.schema_transformer.add_nlp_features(df)
+                    df = await asyncio.get_running_loop().run_in_executor(None, pd.DataFrame, processed_records)
                     
-                    logger.info(f"ETL processing completed: {len(enhanced_df)} records")
-                    return enhanced_df
+                    logger.info(f"ETL processing completed: {len(df)} records")
+                    return df
                 else:
                     logger.warning("No records processed from uploaded files")
                     return self._generate_sample_data(institution)
@@ -195,100 +351,162 @@ class DashboardIntegration:
             logger.error(f"ETL processing failed: {e}")
             return self._generate_sample_data(institution)
     
+    async def _process_document(self, file: Any, document_dir: Path, institution: str,
+                                in_flight: asyncio.Semaphore, progress: PipelineProgress) -> List[Dict[str, Any]]:
+        """
+        Save, parse and score one uploaded document while holding an in-flight slot
+        
+        A document that fails or times out contributes no records.
+        """
+        async with in_flight:
+            progress.in_flight_documents += 1
+            progress.emit('document', 'started', file.name)
+            status = 'completed'
+            try:
+                file_path = document_dir / file.name
+                suffix = file_path.suffix.lower()
+                if suffix not in ['.txt', '.pdf', '.xlsx', '.csv']:
+                    logger.warning(f"Unsupported file type: {file_path.suffix}")
+                    status = 'skipped'
+                    return []
+                
+                records = await asyncio.wait_for(
+                    self._run_document_stages(file, file_path, institution, progress),
+                    timeout=self.timeout_seconds
+                )
+                return records
+                
+            except asyncio.CancelledError:
+                status = 'cancelled'
+                raise
+                
+            except Exception as e:
+                logger.error(f"Failed to process {file.name}: {e}")
+                status = 'failed'
+                return []
+                
+            finally:
+                progress.in_flight_documents -= 1
+                progress.completed_documents += 1
+                progress.emit('document', status, file.name)
+    
+    async def _run_document_stages(self, file: Any, file_path: Path, institution: str,
+                                   progress: PipelineProgress) -> List[Dict[str, Any]]:
+        """Upload, parsing and sentiment stages of one document"""
+        loop = asyncio.get_running_loop()
+        
+        # Save uploaded file without blocking the event loop
+        progress.emit('upload', 'started', file.name)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        await loop.run_in_executor(None, file_path.write_bytes, file.getvalue())
+        progress.emit('upload', 'completed', file.name)
+        
+        # Determine quarter from filename or use default
+        quarter = self._extract_quarter_from_filename(file_path.name)
+        
+        # Process file based on type
+        progress.emit('parsing', 'started', file.name)
+        if file_path.suffix.lower() in ['.txt', '.pdf']:
+            records = await self._process_text_document(file_path, institution, quarter)
+        else:
+            records = await self._process_spreadsheet(file_path, institution, quarter)
+        progress.emit('parsing', 'completed', file.name, records=len(records))
+        
+        # Add FinBERT sentiment; unscored records are kept if it fails
+        if records and self.enable_sentiment:
+            progress.emit('sentiment', 'started', file.name)
+            try:
+                records = await self._run_cpu_stage(_score_sentiment, records)
+                progress.emit('sentiment', 'completed', file.name)
+            except Exception as e:
+                logger.error(f"Sentiment scoring failed for {file.name}: {e}")
+                progress.emit('sentiment', 'failed', file.name, error=str(e))
+        
+        return records
+    
     async def _process_text_document(self, file_path: Path, institution: str, quarter: str) -> List[Dict[str, Any]]:
-        """Process text document (transcript, PDF)"""
+        """Process text document (transcript, PDF) in the process pool"""
         try:
-            # Read file content
-            if file_path.suffix.lower() == '.pdf':
-                # For PDF files, we'd use a PDF parser here
-                # For now, simulate content extraction
-                content = f"Sample content from {file_path.name}"
-            else:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            
-            # Split content into segments (simulate speaker segments)
-            segments = self._split_content_into_segments(content)
-            
-            records = []
-            for i, segment in enumerate(segments):
-                record = {
-                    'text': segment,
-                    'speaker_norm': self._identify_speaker(segment),
-                    'source_file': file_path.name,
-                    'institution': institution,
-                    'quarter': quarter,
-                    'segment_id': i,
-                    'document_type': 'transcript'
-                }
-                records.append(record)
-            
-            return records
-            
+            return await self._run_cpu_stage(_parse_text_document, file_path, institution, quarter)
         except Exception as e:
             logger.error(f"Failed to process text document {file_path}: {e}")
             return []
     
     async def _process_spreadsheet(self, file_path: Path, institution: str, quarter: str) -> List[Dict[str, Any]]:
-        """Process spreadsheet (financial data)"""
+        """Process spreadsheet (financial data) in the process pool"""
         try:
-            # Read spreadsheet
-            if file_path.suffix.lower() == '.xlsx':
-                df = pd.read_excel(file_path)
-            else:
-                df = pd.read_csv(file_path)
-            
-            records = []
-            for _, row in df.iterrows():
-                # Convert row to text representation
-                text_content = self._convert_row_to_text(row)
-                
-                record = {
-                    'text': text_content,
-                    'speaker_norm': 'Financial Data',
-                    'source_file': file_path.name,
-                    'institution': institution,
-                    'quarter': quarter,
-                    'document_type': 'financial_data'
-                }
-                records.append(record)
-            
-            return records
-            
+            return await self._run_cpu_stage(_parse_spreadsheet, file_path, institution, quarter)
         except Exception as e:
             logger.error(f"Failed to process spreadsheet {file_path}: {e}")
             return []
     
-    async def _run_statistical_analysis(self, processed_data: pd.DataFrame) -> Dict[str, Any]:
+    def _get_process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Worker processes for CPU stages, started on first use and reused across runs"""
+        if self._process_pool is None:
+            num_threads = max(1, (os.cpu_count() or 1) // self.max_workers)
+            # Spawned workers avoid inheriting the parent's initialised thread pools
+            self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_pipeline_worker,
+                initargs=(num_threads,)
+            )
+        return self._process_pool
+    
+    async def _run_cpu_stage(self, func: Callable, *args) -> Any:
+        """
+        Run a CPU-bound stage in the process pool without blocking the event loop
+        
+        Cancelling the caller drops the work if it has not started yet.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_process_pool(), func, *args)
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool for the next stage
+            self._process_pool = None
+            raise
+    
+    def close(self):
+        """Shut down the worker processes"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+    
+    async def _run_statistical_analysis(self, processed_data: pd.DataFrame,
+                                        progress: Optional[PipelineProgress] = None) -> Dict[str, Any]:
         """
         Run complete statistical analysis on processed data
         
+        Time series and anomaly detection run in threads (the detector keeps
+        its fitted ensemble in memory); risk scoring runs in the process pool.
+        
         Args:
             processed_data: DataFrame with processed and enhanced data
+            progress: Progress events for this run
             
         Returns:
             Statistical analysis results
         """
+        progress = progress or PipelineProgress(0)
         try:
             logger.info("Running statistical analysis")
+            progress.emit('statistical_analysis', 'started')
+            loop = asyncio.get_running_loop()
             
             # Run analyses in parallel
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit analysis tasks
-                time_series_future = executor.submit(
-                    self._run_time_series_analysis, processed_data
-                )
-                anomaly_future = executor.submit(
-                    self._run_anomaly_detection, processed_data
-                )
-                risk_future = executor.submit(
-                    self._run_risk_scoring, processed_data
-                )
-                
-                # Collect results
-                time_series_results = time_series_future.result(timeout=self.timeout_seconds)
-                anomaly_results = anomaly_future.result(timeout=self.timeout_seconds)
-                risk_results = risk_future.result(timeout=self.timeout_seconds)
+            time_series_results, anomaly_results, risk_results = await asyncio.wait_for(
+                asyncio.gather(
+                    self._track_stage(progress, 'time_series', loop.run_in_executor(
+                        None, self._run_time_series_analysis, processed_data
+                    )),
+                    self._track_stage(progress, 'anomaly_detection', loop.run_in_executor(
+                        None, self._run_anomaly_detection, processed_data
+                    )),
+                    self._track_stage(progress, 'risk_scoring', self._run_risk_scoring(processed_data))
+                ),
+                timeout=self.timeout_seconds
+            )
             
             # Combine results
             statistical_results = {
@@ -300,12 +518,21 @@ class DashboardIntegration:
             }
             
             logger.info("Statistical analysis completed successfully")
+            progress.emit('statistical_analysis', 'completed')
             return statistical_results
             
         except Exception as e:
             logger.error(f"Statistical analysis failed: {e}")
+            progress.emit('statistical_analysis', 'failed', error=str(e))
             return self._generate_fallback_statistical_results()
     
+    async def _track_stage(self, progress: PipelineProgress, stage: str, awaitable) -> Any:
+        """Await a corpus-wide stage between its started and completed events"""
+        progress.emit(stage, 'started')
+        result = await awaitable
+        progress.emit(stage, 'completed')
+        return result
+    
     def _run_time_series_analysis(self, data: pd.DataFrame) -> Dict[str, Any]:
         """Run time series analysis"""
         try:
@@ -320,17 +547,37 @@ class DashboardIntegration:
     def _run_anomaly_detection(self, data: pd.DataFrame) -> Dict[str, Any]:
         """Run anomaly detection"""
         try:
-            results = self.anomaly_detector.detect_anomalies(data)
+            # Score against the persisted ensemble; a due refit uses the stored history
+            if self.anomaly_detector.fitted_ensemble is None:
+                self.anomaly_detector.load_models()
+            baseline = self._load_historical_window() if self.anomaly_detector.needs_refit(data) else None
+            results = self.anomaly_detector.score_anomalies(data, baseline_df=baseline)
             return results
         except Exception as e:
             logger.error(f"Anomaly detection failed: {e}")
             return {'total_anomalies': 0, 'error': str(e)}
     
-    def _run_risk_scoring(self, data: pd.DataFrame) -> Dict[str, Any]:
-        """Run risk scoring"""
+    def _load_historical_window(self) -> Optional[pd.DataFrame]:
+        """Latest stored ETL version of every bank and quarter (None if nothing is stored)"""
+        version_manager = self.etl_pipeline.version_manager
+        frames = []
+        for bank_dir in sorted(version_manager.versions_path.glob('*')):
+            for quarter_dir in sorted(bank_dir.glob('*')):
+                version_id = version_manager.get_latest_version(bank_dir.name, quarter_dir.name)
+                parquet_path = quarter_dir / str(version_id) / "processed_data.parquet"
+                if version_id and parquet_path.exists():
+                    frames.append(pd.read_parquet(parquet_path))
+        
+        if not frames:
+            logger.warning("No stored ETL versions found for the anomaly baseline")
+            return None
+        logger.info(f"Loaded anomaly baseline from {len(frames)} stored bank quarters")
+        return pd.concat(frames, ignore_index=True)
+    
+    async def _run_risk_scoring(self, data: pd.DataFrame) -> Dict[str, Any]:
+        """Run risk scoring in the process pool"""
         try:
-            results = self.risk_scorer.calculate_risk_scores(data)
-            return results
+            return await self._run_cpu_stage(_score_risk, self.risk_scorer, data)
         except Exception as e:
             logger.error(f"Risk scoring failed: {e}")
             return {'overall_risk_score': 0.5, 'error': str(e)}
@@ -455,7 +702,8 @@ class DashboardIntegration:
         current_quarter = (datetime.now().month - 1) // 3 + 1
         return f"Q{current_quarter}_{current_year}"
     
-    def _split_content_into_segments(self, content: str) -> List[str]:
+    @staticmethod
+    def _split_content_into_segments(content: str) -> List[str]:
         """Split content into meaningful segments"""
         # Simple segmentation by sentences or paragraphs
         segments = []
@@ -476,7 +724,8 @@ class DashboardIntegration:
         
         return segments[:100]  # Limit to 100 segments
     
-    def _identify_speaker(self, segment: str) -> str:
+    @staticmethod
+    def _identify_speaker(segment: str) -> str:
         """Identify speaker from text segment"""
         # Simple speaker identification
         speaker_patterns = {
@@ -494,7 +743,8 @@ class DashboardIntegration:
         
         return 'UNKNOWN'
     
-    def _convert_row_to_text(self, row: pd.Series) -> str:
+    @staticmethod
+    def _convert_row_to_text(row: pd.Series) -> str:
         """Convert spreadsheet row to text representation"""
         # Convert row data to meaningful text
         text_parts = []
@@ -7,9 +7,12 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 import re
+import weakref
 from datetime import datetime
 import warnings
 
+from .quote_index import QuoteIndex
+
 warnings.filterwarnings('ignore')
 
 class QuoteAnalyzer:
@@ -17,7 +20,14 @@ class QuoteAnalyzer:
     Advanced quote extraction and sentiment contradiction analysis
     """
     
-    def __init__(self):
+    def __init__(self, search_index: Optional[Any] = None):
+        """
+        Args:
+            search_index: Optional corpus-wide full-text index (e.g. the ETL
+                SentenceSearchIndex) queried by ``search_quotes`` when no data is given
+        """
+        self.search_index = search_index
+        
         # Sentiment contradiction indicators
         self.contradiction_patterns = {
             'downplaying': [
@@ -70,21 +80,105 @@ class QuoteAnalyzer:
                 'developing', 'exploring', 'investigating', 'studying', 'analyzing'
             ]
         }
+        
+        self._compile_patterns()
+        
+        # Inverted index over the processed sentences (built on first use),
+        # with a weak reference to the frame it was built from
+        self.index = None
+        self._indexed_frame = None
+        self._indexed_layout = None
     
-    def extract_topic_quotes(self, data: pd.DataFrame, topic: str, 
+    def build_index(self, data: pd.DataFrame, **kwargs) -> QuoteIndex:
+        """
+        Build the inverted index used for quote retrieval
+        
+        Call this again after editing ``data`` in place: queries passing the
+        same frame reuse the index without re-reading its contents.
+        
+        Args:
+            data: Processed sentences
+            **kwargs: Passed to QuoteIndex (call_column, sentence_column, k1, b)
+        """
+        self.index = QuoteIndex(data, **kwargs)
+        self._indexed_frame = weakref.ref(data)
+        self._indexed_layout = (data.shape, list(data.columns))
+        return self.index
+    
+    def load_index(self, path) -> QuoteIndex:
+        """
+        Load a persisted inverted index for use with ``data=None`` queries
+        """
+        self.index = QuoteIndex.load(path)
+        self._indexed_frame = None
+        return self.index
+    
+    def _get_index(self, data: Optional[pd.DataFrame]) -> QuoteIndex:
+        """
+        Index for the given data, building it for a frame other than the
+        indexed one or when the indexed frame's shape or columns changed
+        
+        Frames are compared by identity, not content, so this check is O(1);
+        in-place edits of cell values need an explicit ``build_index``.
+        """
+        if data is not None and (
+            self.index is None
+            or self._indexed_frame is None
+            or self._indexed_frame() is not data
+            or self._indexed_layout != (data.shape, list(data.columns))
+        ):
+            return self.build_index(data)
+        if self.index is None:
+            raise ValueError("No quote index: pass data or call build_index/load_index first")
+        return self.index
+    
+    def search_quotes(self, data: Optional[pd.DataFrame] = None, keyword: Optional[str] = None,
+                      topic: Optional[str] = None, speaker: Optional[str] = None,
+                      limit: int = 20) -> pd.DataFrame:
+        """
+        Ranked sentences matching a keyword or phrase, topic and/or speaker
+        
+        Without data, the full-text search index is queried if one was given
+        (topic and speaker then match exactly).
+        
+        Args:
+            data: Processed sentences (None to query the current index)
+            keyword: Word or phrase the sentence must contain
+            topic: Topic pattern matched against 'primary_topic'
+            speaker: Speaker name
+            limit: Maximum number of results
+            
+        Returns:
+            Matching rows with 'call_id', 'sentence_id' and BM25 'score' columns
+        """
+        if data is None and self.search_index is not None:
+            results = self.search_index.search_frame(
+                keyword,
+                topics=[topic] if topic else None,
+                speakers=[speaker] if speaker else None,
+                limit=limit
+            )
+            return results.rename(columns={'speaker': 'speaker_norm', 'topic': 'primary_topic'})
+        
+        return self._get_index(data).search(keyword=keyword, topic=topic, speaker=speaker, limit=limit)
+    
+    def extract_topic_quotes(self, data: Optional[pd.DataFrame], topic: str, 
                            max_quotes: int = 20) -> List[Dict[str, Any]]:
         """
         Extract specific quotes related to a topic with timestamps and context
+        
+        Quotes are the highest-ranked sentences for the topic in the quote index;
+        ``data=None`` uses the current index.
         """
         try:
-            # Filter data for the specific topic
-            topic_data = data[data['primary_topic'].str.contains(topic, case=False, na=False)]
+            index = self._get_index(data)
+            topic_data = index.search(topic=topic, limit=max_quotes)
             
             if topic_data.empty:
                 return self._generate_sample_climate_quotes()
             
             quotes = []
-            for idx, row in topic_data.iterrows():
+            for (idx, row), position in zip(topic_data.iterrows(), topic_data['position']):
                 quote_info = {
                     'quote_id': f"{topic}_{idx}",
                     'text': row.get('text', ''),
@@ -93,16 +187,13 @@ class QuoteAnalyzer:
                     'quarter': row.get('quarter', 'Unknown'),
                     'source_file': row.get('source_file', 'Unknown'),
                     'sentiment_score': row.get('sentiment_score', 0.0),
-                    'context_before': self._get_context_before(data, idx),
-                    'context_after': self._get_context_after(data, idx),
+                    'context_before': self._get_context_before(index, position),
+                    'context_after': self._get_context_after(index, position),
                     'contradiction_analysis': self._analyze_contradiction(row.get('text', '')),
                     'urgency_indicators': self._detect_urgency_indicators(row.get('text', '')),
                     'topic_relevance_score': self._calculate_topic_relevance(row.get('text', ''), topic)
                 }
                 quotes.append(quote_info)
-                
-                if len(quotes) >= max_quotes:
-                    break
             
             # Sort by timestamp and relevance
             quotes.sort(key=lambda x: (x['timestamp'], -x['topic_relevance_score']))
@@ -132,29 +223,22 @@ class QuoteAnalyzer:
             total_contradictions = 0
             total_quotes = len(quotes)
             
-            for quote in quotes:
-                quote_analysis = self._analyze_single_quote_contradiction(quote)
-                
-                # Accumulate contradiction indicators
-                if quote_analysis['downplaying_count'] > 0:
-                    contradiction_analysis['downplaying_indicators'].extend(
-                        quote_analysis['downplaying_matches']
-                    )
-                    total_contradictions += quote_analysis['downplaying_count']
-                
-                if quote_analysis['hedging_count'] > 0:
-                    contradiction_analysis['hedging_patterns'].extend(
-                        quote_analysis['hedging_matches']
-                    )
-                    total_contradictions += quote_analysis['hedging_count']
-                
-                if quote_analysis['deflection_count'] > 0:
-                    contradiction_analysis['deflection_attempts'].extend(
-                        quote_analysis['deflection_matches']
-                    )
-                    total_contradictions += quote_analysis['deflection_count']
-                
-                # Store detailed analysis for each quote
+            batch = self.analyze_contradiction_batch([quote.get('text', '') for quote in quotes])
+            families = {
+                'downplaying': 'downplaying_indicators',
+                'hedging': 'hedging_patterns',
+                'deflection': 'deflection_attempts'
+            }
+            
+            # Accumulate contradiction indicators
+            for family, key in families.items():
+                for matches in batch[f'{family}_matches']:
+                    contradiction_analysis[key].extend(matches)
+                total_contradictions += int(batch[f'{family}_count'].sum())
+            
+            # Store detailed analysis for each quote
+            detail_columns = [column for column in batch.columns if not column.endswith('_spans')]
+            for quote, quote_analysis in zip(quotes, batch[detail_columns].to_dict('records')):
                 contradiction_analysis['detailed_analysis'][quote['quote_id']] = quote_analysis
             
             # Calculate overall contradiction score
@@ -184,59 +268,114 @@ class QuoteAnalyzer:
             print(f"Error analyzing contradictory sentiment: {e}")
             return self._get_default_contradiction_analysis()
     
+    def _compile_patterns(self):
+        """
+        Compile the contradiction patterns and sentiment indicators once
+        
+        Texts are lower-cased before matching, so the patterns are compiled
+        case-sensitively (IGNORECASE defeats the regex engine's literal prefix
+        search). Call again after editing ``contradiction_patterns`` or
+        ``sentiment_indicators``.
+        """
+        self._compiled_patterns = {
+            family: [re.compile(pattern) for pattern in patterns]
+            for family, patterns in self.contradiction_patterns.items()
+        }
+        self._compiled_indicators = {
+            kind: [re.compile(re.escape(indicator)) for indicator in indicators]
+            for kind, indicators in self.sentiment_indicators.items()
+        }
+    
+    def _classify_sentiment(self, positive_count, negative_count, hedging_count):
+        """
+        Classify sentiment from the number of indicators of each kind present
+        """
+        if positive_count > negative_count + hedging_count:
+            return 'positive'
+        elif negative_count > positive_count + hedging_count:
+            return 'negative'
+        elif hedging_count > 0:
+            return 'hedging'
+        else:
+            return 'neutral'
+    
+    def analyze_contradiction_batch(self, texts) -> pd.DataFrame:
+        """
+        Contradiction patterns and sentiment classification for many quotes at once
+        
+        The lower-cased texts are joined into one corpus and every pattern and
+        indicator is scanned over it in a single pass; matches are mapped back
+        to their quote by offset. Results equal ``_analyze_single_quote_contradiction``
+        applied to each text.
+        
+        Args:
+            texts: Series or sequence of quote texts (missing values count as empty)
+            
+        Returns:
+            DataFrame aligned with ``texts`` with '<family>_count', '<family>_matches'
+            and '<family>_spans' ((start, end) within the quote) for each family,
+            plus 'sentiment_classification'
+        """
+        texts = texts if isinstance(texts, pd.Series) else pd.Series(list(texts), dtype=object)
+        lowered = [text.lower() if isinstance(text, str) else '' for text in texts]
+        
+        # NUL never matches a pattern, so matches cannot cross quotes
+        starts = np.cumsum([0] + [len(text) + 1 for text in lowered])[:-1]
+        corpus = '\x00'.join(lowered)
+        
+        result = pd.DataFrame(index=texts.index)
+        for family, patterns in self._compiled_patterns.items():
+            matches = [(m.start(), m.end(), m.group(0)) for pattern in patterns for m in pattern.finditer(corpus)]
+            rows = np.searchsorted(starts, [m[0] for m in matches], side='right') - 1
+            
+            # Stable sort keeps the per-pattern match order within each quote
+            family_matches = [[] for _ in lowered]
+            family_spans = [[] for _ in lowered]
+            for i in np.argsort(rows, kind='stable'):
+                row = rows[i]
+                match_start, match_end, match_text = matches[i]
+                family_matches[row].append(match_text)
+                family_spans[row].append((int(match_start - starts[row]), int(match_end - starts[row])))
+            
+            result[f'{family}_count'] = np.bincount(rows, minlength=len(lowered)).astype(int)
+            result[f'{family}_matches'] = family_matches
+            result[f'{family}_spans'] = family_spans
+        
+        # Number of distinct indicators of each kind present in each quote
+        indicator_counts = {}
+        for kind, indicators in self._compiled_indicators.items():
+            counts = np.zeros(len(lowered), dtype=int)
+            for indicator in indicators:
+                positions = [m.start() for m in indicator.finditer(corpus)]
+                counts[np.unique(np.searchsorted(starts, positions, side='right') - 1)] += 1
+            indicator_counts[kind] = counts
+        
+        positive, negative = indicator_counts['positive'], indicator_counts['negative']
+        hedging = indicator_counts['neutral_hedging']
+        result['sentiment_classification'] = np.select(
+            [positive > negative + hedging, negative > positive + hedging, hedging > 0],
+            ['positive', 'negative', 'hedging'],
+            default='neutral'
+        ).astype(object)
+        return result
+    
     def _analyze_single_quote_contradiction(self, quote: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze contradiction patterns in a single quote
         """
         text = quote.get('text', '').lower()
         
-        analysis = {
-            'downplaying_count': 0,
-            'downplaying_matches': [],
-            'hedging_count': 0,
-            'hedging_matches': [],
-            'deflection_count': 0,
-            'deflection_matches': [],
-            'sentiment_classification': 'neutral'
-        }
-        
-        # Check for downplaying patterns
-        for pattern in self.contradiction_patterns['downplaying']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                analysis['downplaying_count'] += len(matches)
-                analysis['downplaying_matches'].extend(matches)
-        
-        # Check for hedging patterns
-        for pattern in self.contradiction_patterns['hedging']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                analysis['hedging_count'] += len(matches)
-                analysis['hedging_matches'].extend(matches)
-        
-        # Check for deflection patterns
-        for pattern in self.contradiction_patterns['deflection']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                analysis['deflection_count'] += len(matches)
-                analysis['deflection_matches'].extend(matches)
+        analysis = {}
+        for family, patterns in self._compiled_patterns.items():
+            matches = [match for pattern in patterns for match in pattern.findall(text)]
+            analysis[f'{family}_count'] = len(matches)
+            analysis[f'{family}_matches'] = matches
         
         # Classify sentiment
-        positive_count = sum(1 for indicator in self.sentiment_indicators['positive'] 
-                           if indicator in text)
-        negative_count = sum(1 for indicator in self.sentiment_indicators['negative'] 
-                           if indicator in text)
-        hedging_count = sum(1 for indicator in self.sentiment_indicators['neutral_hedging'] 
-                          if indicator in text)
-        
-        if positive_count > negative_count + hedging_count:
-            analysis['sentiment_classification'] = 'positive'
-        elif negative_count > positive_count + hedging_count:
-            analysis['sentiment_classification'] = 'negative'
-        elif hedging_count > 0:
-            analysis['sentiment_classification'] = 'hedging'
-        else:
-            analysis['sentiment_classification'] = 'neutral'
+        analysis['sentiment_classification'] = self._classify_sentiment(*(
+            sum(1 for indicator in self.sentiment_indicators[kind] if indicator in text)
+            for kind in ['positive', 'negative', 'neutral_hedging']
+        ))
         
         return analysis
     
@@ -393,27 +532,27 @@ class QuoteAnalyzer:
         else:
             return '2025-01-15 10:30:00'
     
-    def _get_context_before(self, data: pd.DataFrame, idx: int, context_size: int = 1) -> str:
+    def _get_context_before(self, index: QuoteIndex, position: int) -> str:
         """
-        Get context before the current quote
+        Get context before the current quote (previous sentence of the same call)
         """
         try:
-            if idx > 0:
-                prev_row = data.iloc[idx - 1]
-                return prev_row.get('text', '')[:100] + '...'
-            return 'Beginning of document...'
+            text = index.context(position, -1)
+            if text is None:
+                return 'Beginning of document...'
+            return text[:100] + '...'
         except:
             return 'Context not available...'
     
-    def _get_context_after(self, data: pd.DataFrame, idx: int, context_size: int = 1) -> str:
+    def _get_context_after(self, index: QuoteIndex, position: int) -> str:
         """
-        Get context after the current quote
+        Get context after the current quote (next sentence of the same call)
         """
         try:
-            if idx < len(data) - 1:
-                next_row = data.iloc[idx + 1]
-                return next_row.get('text', '')[:100] + '...'
-            return 'End of document...'
+            text = index.context(position, 1)
+            if text is None:
+                return 'End of document...'
+            return text[:100] + '...'
         except:
             return 'Context not available...'
     
@@ -421,26 +560,11 @@ class QuoteAnalyzer:
         """
         Analyze contradiction patterns in text
         """
-        analysis = {'downplaying_count': 0, 'hedging_count': 0, 'deflection_count': 0}
-        
         text_lower = text.lower()
-        
-        # Count downplaying patterns
-        for pattern in self.contradiction_patterns['downplaying']:
-            matches = len(re.findall(pattern, text_lower, re.IGNORECASE))
-            analysis['downplaying_count'] += matches
-        
-        # Count hedging patterns
-        for pattern in self.contradiction_patterns['hedging']:
-            matches = len(re.findall(pattern, text_lower, re.IGNORECASE))
-            analysis['hedging_count'] += matches
-        
-        # Count deflection patterns
-        for pattern in self.contradiction_patterns['deflection']:
-            matches = len(re.findall(pattern, text_lower, re.IGNORECASE))
-            analysis['deflection_count'] += matches
-        
-        return analysis
+        return {
+            f'{family}_count': sum(len(pattern.findall(text_lower)) for pattern in patterns)
+            for family, patterns in self._compiled_patterns.items()
+        }
     
     def _detect_urgency_indicators(self, text: str) -> List[str]:
         """
@@ -0,0 +1,245 @@
+"""
+Inverted Index for Quote Retrieval
+Term, topic and speaker posting lists over processed sentences with
+positional context windows and BM25 ranking
+"""
+
+import pandas as pd
+import numpy as np
+from typing import List, Tuple, Optional, Any, Union
+from pathlib import Path
+import joblib
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class QuoteIndex:
+    """
+    Persistent inverted index over processed sentences
+
+    Sentences are stored in one array ordered by call and then sentence, so a
+    position identifies a ``(call_id, sentence_id)`` pair and neighbouring
+    sentences of the same call are one position away. Posting lists are
+    sorted position arrays kept in CSR layout (one offsets array and one
+    flat positions array per field).
+    """
+
+    TOKEN_PATTERN = r'[a-z0-9]+'
+
+    def __init__(self, data: pd.DataFrame, call_column: Optional[str] = None,
+                 sentence_column: Optional[str] = None, k1: float = 1.2, b: float = 0.75):
+        """
+        Args:
+            data: Processed sentences with 'text' and optionally 'primary_topic' and 'speaker_norm'
+            call_column: Column identifying a call (default 'call_id', then 'source_file')
+            sentence_column: Column ordering sentences within a call
+                (default 'sentence_id', then 'segment_id'; frame order if not numeric)
+            k1: BM25 term frequency saturation
+            b: BM25 length normalisation
+        """
+        self.k1 = k1
+        self.b = b
+        self.call_column = call_column or next((c for c in ['call_id', 'source_file'] if c in data.columns), None)
+        self.sentence_column = sentence_column or next(
+            (c for c in ['sentence_id', 'segment_id'] if c in data.columns), None
+        )
+        self._build(data)
+
+    def _build(self, data: pd.DataFrame):
+        """Order the sentences and build all posting lists"""
+        n = len(data)
+        calls = data[self.call_column] if self.call_column else pd.Series(0, index=data.index)
+        call_codes, self.call_ids = pd.factorize(calls, use_na_sentinel=False)
+
+        order_keys = [np.arange(n)]
+        if self.sentence_column:
+            sentence_order = pd.to_numeric(data[self.sentence_column], errors='coerce')
+            if sentence_order.notna().all():
+                order_keys.append(sentence_order.to_numpy())
+        order = np.lexsort(order_keys + [call_codes])
+
+        # Sentence store in (call, sentence) order
+        self.data = data.iloc[order]
+        self.row_positions = order
+        self.call_codes = call_codes[order]
+        self.sentence_ids = (self.data[self.sentence_column].to_numpy() if self.sentence_column
+                             else np.arange(n) - np.searchsorted(self.call_codes, self.call_codes))
+        self.call_starts = np.searchsorted(self.call_codes, np.arange(len(self.call_ids)))
+        self.call_ends = np.searchsorted(self.call_codes, np.arange(len(self.call_ids)), side='right')
+        self.texts = self.data['text'].to_numpy(dtype=object)
+
+        # Term postings with term frequencies
+        tokens = self.data['text'].astype(object).str.lower().str.findall(self.TOKEN_PATTERN).reset_index(drop=True)
+        self.doc_lengths = tokens.str.len().fillna(0).to_numpy(dtype=float)
+        self.avg_doc_length = float(self.doc_lengths.mean()) if n else 0.0
+
+        flat = tokens.explode().dropna()
+        term_codes, vocabulary = pd.factorize(flat)
+
+        # Token occurrences as ``position * stride + token offset`` keys, grouped by
+        # term, so phrase checks are intersections of shifted key arrays
+        self.token_stride = int(self.doc_lengths.max()) + 1 if n else 1
+        keys = flat.index.to_numpy(dtype=np.int64) * self.token_stride + flat.groupby(level=0).cumcount().to_numpy()
+        self.occurrence_keys = keys[np.lexsort((keys, term_codes))]
+        self.occurrence_offsets = np.concatenate([[0], np.cumsum(np.bincount(term_codes, minlength=len(vocabulary)))])
+        pairs, term_frequency = np.unique(term_codes.astype(np.int64) * max(n, 1) + flat.index.to_numpy(),
+                                          return_counts=True)
+        self.vocabulary = {term: i for i, term in enumerate(vocabulary)}
+        self.term_offsets = np.concatenate([[0], np.cumsum(np.bincount(pairs // max(n, 1),
+                                                                         minlength=len(vocabulary)))])
+        self.term_positions = pairs % max(n, 1)
+        self.term_frequency = term_frequency
+
+        # Topic and speaker postings
+        self.topic_labels, self.topic_offsets, self.topic_positions = self._field_postings('primary_topic')
+        self.speaker_labels, self.speaker_offsets, self.speaker_positions = self._field_postings('speaker_norm')
+
+        logger.info(f"Quote index built: {n} sentences, {len(self.call_ids)} calls, {len(vocabulary)} terms")
+
+    def _field_postings(self, column: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Labels, offsets and sorted positions for each value of a categorical column"""
+        if column not in self.data.columns:
+            return np.array([], dtype=object), np.zeros(1, dtype=int), np.array([], dtype=int)
+
+        codes, labels = pd.factorize(self.data[column])
+        valid = codes >= 0
+        positions = np.flatnonzero(valid)
+        positions = positions[np.argsort(codes[valid], kind='stable')]
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(codes[valid], minlength=len(labels)))])
+        return np.asarray(labels, dtype=object), offsets, positions
+
+    @staticmethod
+    def _union(offsets: np.ndarray, positions: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Sorted union of the posting lists of several codes"""
+        if len(codes) == 0:
+            return np.array([], dtype=int)
+        return np.sort(np.concatenate([positions[offsets[c]:offsets[c + 1]] for c in codes]))
+
+    def _term_postings(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions and term frequencies for a term"""
+        code = self.vocabulary.get(term)
+        if code is None:
+            return np.array([], dtype=int), np.array([], dtype=int)
+        start, end = self.term_offsets[code], self.term_offsets[code + 1]
+        return self.term_positions[start:end], self.term_frequency[start:end]
+
+    def _phrase_positions(self, terms: List[str]) -> np.ndarray:
+        """Sorted positions of sentences containing ``terms`` as consecutive tokens"""
+        starts = None
+        for i, term in enumerate(terms):
+            code = self.vocabulary.get(term)
+            if code is None:
+                return np.array([], dtype=int)
+            # Keys of this term shifted back to where the phrase would start
+            keys = self.occurrence_keys[self.occurrence_offsets[code]:self.occurrence_offsets[code + 1]] - i
+            starts = keys if starts is None else np.intersect1d(starts, keys, assume_unique=True)
+        return np.unique(starts // self.token_stride)
+
+    def tokenize(self, text: str) -> List[str]:
+        """Index tokens of a query string"""
+        return pd.Series([text]).str.lower().str.findall(self.TOKEN_PATTERN).iloc[0]
+
+    def postings(self, term: str) -> List[Tuple[Any, Any]]:
+        """Posting list of a term as ``(call_id, sentence_id)`` pairs"""
+        positions, _ = self._term_postings(term.lower())
+        return list(zip(self.call_ids[self.call_codes[positions]], self.sentence_ids[positions]))
+
+    def query(self, keyword: Optional[str] = None, topic: Optional[str] = None,
+              speaker: Optional[str] = None, limit: Optional[int] = 20) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ranked positions of sentences matching all given filters
+
+        Args:
+            keyword: Word or phrase the sentence must contain (all tokens, adjacent and in order)
+            topic: Case-insensitive pattern matched against 'primary_topic' labels
+            speaker: Case-insensitive speaker name
+            limit: Maximum number of results (None for all)
+
+        Returns:
+            Tuple of (positions, BM25 scores), best first. Keyword tokens are
+            scored; for topic-only queries the topic's own words are scored.
+            Ties keep the original frame order.
+        """
+        if keyword is None and topic is None and speaker is None:
+            raise ValueError("At least one of keyword, topic or speaker is required")
+
+        filters = []
+        if topic is not None:
+            matching = pd.Series(self.topic_labels, dtype=object).str.contains(topic, case=False, na=False)
+            filters.append(self._union(self.topic_offsets, self.topic_positions, np.flatnonzero(matching)))
+        if speaker is not None:
+            matching = pd.Series(self.speaker_labels, dtype=object).str.lower() == speaker.lower()
+            filters.append(self._union(self.speaker_offsets, self.speaker_positions, np.flatnonzero(matching)))
+
+        keyword_terms = self.tokenize(keyword) if keyword is not None else []
+        if keyword is not None and not keyword_terms:
+            # Nothing searchable in the keyword (e.g. only punctuation)
+            return np.array([], dtype=int), np.array([], dtype=float)
+        if len(keyword_terms) > 1:
+            filters.append(self._phrase_positions(keyword_terms))
+        elif keyword_terms:
+            filters.append(self._term_postings(keyword_terms[0])[0])
+
+        candidates = filters[0]
+        for positions in filters[1:]:
+            candidates = np.intersect1d(candidates, positions, assume_unique=True)
+
+        scores = self._bm25(candidates, keyword_terms or (self.tokenize(topic) if topic else []))
+
+        # Only the best ``limit`` scores (with all ties at the cut-off) need a full sort
+        if limit is not None and limit < len(candidates):
+            cutoff = np.partition(-scores, limit - 1)[limit - 1]
+            keep = -scores <= cutoff
+            candidates, scores = candidates[keep], scores[keep]
+
+        ranked = np.lexsort((self.row_positions[candidates], -scores))[:limit]
+        return candidates[ranked], scores[ranked]
+
+    def _bm25(self, candidates: np.ndarray, terms: List[str]) -> np.ndarray:
+        """BM25 scores of candidate positions for the query terms"""
+        n = len(self.texts)
+        scores = np.zeros(n)
+        for term in dict.fromkeys(terms):
+            positions, frequency = self._term_postings(term)
+            if len(positions) == 0:
+                continue
+            idf = np.log(1 + (n - len(positions) + 0.5) / (len(positions) + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[positions] / self.avg_doc_length)
+            scores[positions] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+        return scores[candidates]
+
+    def search(self, keyword: Optional[str] = None, topic: Optional[str] = None,
+               speaker: Optional[str] = None, limit: Optional[int] = 20) -> pd.DataFrame:
+        """
+        Ranked matching sentences with their index position, call, sentence and score
+
+        The result keeps the original index labels; see ``query`` for arguments.
+        """
+        positions, scores = self.query(keyword, topic, speaker, limit)
+        results = self.data.iloc[positions].copy()
+        results['position'] = positions
+        results['call_id'] = self.call_ids[self.call_codes[positions]]
+        results['sentence_id'] = self.sentence_ids[positions]
+        results['score'] = scores
+        return results
+
+    def context(self, position: int, offset: int) -> Optional[str]:
+        """Text of the sentence ``offset`` positions away in the same call (None outside the call)"""
+        target = position + offset
+        call = self.call_codes[position]
+        if target < self.call_starts[call] or target >= self.call_ends[call]:
+            return None
+        return self.texts[target]
+
+    def save(self, path: Union[str, Path]):
+        """Persist the index with joblib"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(self, path)
+        logger.info(f"Quote index saved to {path}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'QuoteIndex':
+        """Load a persisted index"""
+        return joblib.load(Path(path))
@@ -6,7 +6,8 @@ Provides comprehensive statistical validation for trend detection
 import pandas as pd
 import numpy as np
 from scipy import stats
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Sequence, Union
+from collections import Counter
 import warnings
 
 warnings.filterwarnings('ignore')
@@ -94,8 +95,9 @@ class StatisticalSignificanceTester:
             if len(all_speakers) < 2:
                 return self._get_default_test_result()
             
-            recent_counts = [recent_speakers.count(speaker) for speaker in all_speakers]
-            historical_counts = [historical_speakers.count(speaker) for speaker in all_speakers]
+            recent_tally, historical_tally = Counter(recent_speakers), Counter(historical_speakers)
+            recent_counts = [recent_tally[speaker] for speaker in all_speakers]
+            historical_counts = [historical_tally[speaker] for speaker in all_speakers]
             
             # Create contingency table
             contingency_table = np.array([recent_counts, historical_counts])
@@ -126,25 +128,11 @@ class StatisticalSignificanceTester:
                                   method: str = 'bonferroni') -> Dict[str, Any]:
         """
         Apply multiple testing correction
+        
+        Methods: 'bonferroni', 'holm' and 'fdr_bh' (Benjamini-Hochberg)
         """
         try:
-            p_values_array = np.array(p_values)
-            
-            if method.lower() == 'bonferroni':
-                corrected_p_values = p_values_array * len(p_values)
-                corrected_p_values = np.minimum(corrected_p_values, 1.0)
-            elif method.lower() == 'holm':
-                # Holm-Bonferroni method
-                sorted_indices = np.argsort(p_values_array)
-                corrected_p_values = np.zeros_like(p_values_array)
-                
-                for i, idx in enumerate(sorted_indices):
-                    correction_factor = len(p_values) - i
-                    corrected_p_values[idx] = min(
-                        p_values_array[idx] * correction_factor, 1.0
-                    )
-            else:
-                corrected_p_values = p_values_array
+            corrected_p_values = self._corrected_p_values(np.asarray(p_values, dtype=float), method)
             
             return {
                 'method': method,
@@ -163,6 +151,230 @@ class StatisticalSignificanceTester:
                 'alpha_level': self.alpha
             }
     
+    def _corrected_p_values(self, p_values: np.ndarray, method: str) -> np.ndarray:
+        """
+        Corrected p-values for a one-dimensional array of p-values
+        """
+        m = len(p_values)
+        method = method.lower()
+        
+        if method == 'bonferroni':
+            return np.minimum(p_values * m, 1.0)
+        
+        if method == 'holm':
+            # Holm-Bonferroni step-down: running maximum of p * (m - rank) from the smallest p-value up
+            order = np.argsort(p_values)
+            scaled = p_values[order] * (m - np.arange(m))
+            corrected_p_values = np.zeros_like(p_values)
+            corrected_p_values[order] = np.minimum(np.maximum.accumulate(scaled), 1.0)
+            return corrected_p_values
+        
+        if method in ('fdr_bh', 'benjamini-hochberg'):
+            # Step-up: running minimum of p * m / rank from the largest p-value down
+            order = np.argsort(p_values)[::-1]
+            scaled = p_values[order] * m / np.arange(m, 0, -1)
+            corrected_p_values = np.zeros_like(p_values)
+            corrected_p_values[order] = np.minimum(np.minimum.accumulate(scaled), 1.0)
+            return corrected_p_values
+        
+        return p_values
+    
+    def test_frequency_change_batch(self, recent_counts: Union[np.ndarray, Sequence[Sequence[float]]],
+                                    historical_counts: Union[np.ndarray, Sequence[Sequence[float]]]) -> Dict[str, Any]:
+        """
+        Mann-Whitney U tests for many topics at once
+        
+        Uses the tie-corrected normal approximation with continuity correction
+        (scipy's ``method='asymptotic'``) computed from per-row rank arrays.
+        
+        Args:
+            recent_counts: One row per topic (2-D array, NaN-padded, or ragged sequences)
+            historical_counts: One row per topic, aligned with ``recent_counts``
+            
+        Returns:
+            Dictionary of per-topic arrays: statistic, p_value, is_significant,
+            effect_size (rank-biserial correlation) and interpretation
+        """
+        recent, historical = self._pad_groups(recent_counts), self._pad_groups(historical_counts)
+        n1 = (~np.isnan(recent)).sum(axis=1)
+        n2 = (~np.isnan(historical)).sum(axis=1)
+        n = n1 + n2
+        
+        ranks, tie_term = self._rank_rows(np.hstack([recent, historical]))
+        U1 = np.nansum(ranks[:, :recent.shape[1]], axis=1) - n1 * (n1 + 1) / 2
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            U = np.maximum(U1, n1 * n2 - U1)
+            s = np.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+            z = (U - n1 * n2 / 2 - 0.5) / s
+            p_values = np.clip(2 * stats.norm.sf(z), 0, 1)
+            effect_sizes = np.abs(1 - (2 * U1) / (n1 * n2))
+        
+        return self._batch_result('Mann-Whitney U Test', (n1 >= 2) & (n2 >= 2), U1, p_values, effect_sizes)
+    
+    def test_sentiment_change_batch(self, recent_sentiment: Union[np.ndarray, Sequence[Sequence[float]]],
+                                    historical_sentiment: Union[np.ndarray, Sequence[Sequence[float]]],
+                                    equal_var: bool = False) -> Dict[str, Any]:
+        """
+        Two-sample t-tests for many topics at once (Welch's by default)
+        
+        Args:
+            recent_sentiment: One row per topic (2-D array, NaN-padded, or ragged sequences)
+            historical_sentiment: One row per topic, aligned with ``recent_sentiment``
+            equal_var: Use the pooled-variance t-test instead of Welch's
+            
+        Returns:
+            Dictionary of per-topic arrays: statistic, p_value, is_significant,
+            effect_size (Cohen's d) and interpretation
+        """
+        recent, historical = self._pad_groups(recent_sentiment), self._pad_groups(historical_sentiment)
+        n1 = (~np.isnan(recent)).sum(axis=1)
+        n2 = (~np.isnan(historical)).sum(axis=1)
+        testable = (n1 >= 2) & (n2 >= 2)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean1, mean2 = np.nanmean(recent, axis=1), np.nanmean(historical, axis=1)
+            var1, var2 = np.nanvar(recent, axis=1, ddof=1), np.nanvar(historical, axis=1, ddof=1)
+            pooled_var = ((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2)
+            
+            if equal_var:
+                se = np.sqrt(pooled_var * (1 / n1 + 1 / n2))
+                dof = n1 + n2 - 2
+            else:
+                vn1, vn2 = var1 / n1, var2 / n2
+                se = np.sqrt(vn1 + vn2)
+                dof = (vn1 + vn2) ** 2 / (vn1 ** 2 / (n1 - 1) + vn2 ** 2 / (n2 - 1))
+            
+            t_stat = (mean1 - mean2) / se
+            p_values = 2 * stats.t.sf(np.abs(t_stat), dof)
+            
+            # Cohen's d from the same moments
+            pooled_std = np.sqrt(pooled_var)
+            effect_sizes = np.where(pooled_std == 0, 0.0, (mean1 - mean2) / pooled_std)
+        
+        test_name = 'Independent t-test' if equal_var else "Welch's t-test"
+        return self._batch_result(test_name, testable, t_stat, p_values, effect_sizes)
+    
+    def test_speaker_pattern_change_batch(self, contingency_tables: np.ndarray) -> Dict[str, Any]:
+        """
+        Chi-square tests of speaker patterns for many topics at once
+        
+        Speakers with no mentions in either period are ignored, as they would
+        be absent from a per-topic table. Yates' correction is applied when a
+        table has one degree of freedom, as in ``scipy.stats.chi2_contingency``.
+        
+        Args:
+            contingency_tables: Array of shape (topics, 2, speakers) with
+                recent and historical speaker counts (see ``speaker_contingency``)
+            
+        Returns:
+            Dictionary of per-topic arrays: statistic, p_value, degrees_of_freedom,
+            is_significant, effect_size (Cramér's V) and interpretation
+        """
+        observed = np.asarray(contingency_tables, dtype=float)
+        column_totals = observed.sum(axis=1)
+        row_totals = observed.sum(axis=2)
+        total = row_totals.sum(axis=1)
+        present = column_totals > 0
+        
+        n_speakers = present.sum(axis=1)
+        dof = n_speakers - 1
+        testable = (n_speakers >= 2) & ~np.any(present & (column_totals < 5), axis=1) & np.all(row_totals > 0, axis=1)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            expected = row_totals[:, :, None] * column_totals[:, None, :] / total[:, None, None]
+            
+            # Yates' continuity correction for 2x2 tables
+            difference = expected - observed
+            yates = (dof == 1)[:, None, None]
+            observed = np.where(yates, observed + np.sign(difference) * np.minimum(0.5, np.abs(difference)), observed)
+            
+            terms = np.where(present[:, None, :], (observed - expected) ** 2 / expected, 0.0)
+            chi2 = terms.sum(axis=(1, 2))
+            p_values = stats.chi2.sf(chi2, dof)
+            effect_sizes = np.where(total > 0, np.sqrt(chi2 / total), 0.0)
+        
+        result = self._batch_result('Chi-square test', testable, chi2, p_values, effect_sizes)
+        result['degrees_of_freedom'] = np.where(testable, dof, 0)
+        return result
+    
+    def speaker_contingency(self, recent_speakers: Sequence[Sequence[str]],
+                            historical_speakers: Sequence[Sequence[str]]) -> Tuple[np.ndarray, List[str]]:
+        """
+        Build a (topics, 2, speakers) contingency tensor from per-topic speaker lists
+        
+        Returns:
+            Tuple of (contingency tensor, speaker labels for the last axis)
+        """
+        lists = list(recent_speakers) + list(historical_speakers)
+        lengths = np.array([len(speakers) for speakers in lists], dtype=int)
+        codes, labels = pd.factorize(pd.Series([s for speakers in lists for s in speakers], dtype=object))
+        
+        # Table slot of every mention: topic * 2 + period
+        n_topics = len(recent_speakers)
+        slots = np.repeat(np.arange(len(lists)), lengths)
+        slots = (slots % n_topics) * 2 + slots // n_topics
+        
+        counts = np.bincount(slots * len(labels) + codes, minlength=n_topics * 2 * len(labels))
+        return counts.reshape(n_topics, 2, len(labels)), list(labels)
+    
+    def _pad_groups(self, groups: Union[np.ndarray, Sequence[Sequence[float]]]) -> np.ndarray:
+        """
+        Stack per-topic samples into a NaN-padded 2-D float array
+        """
+        if isinstance(groups, np.ndarray) and groups.ndim == 2:
+            return groups.astype(float)
+        
+        rows = [np.asarray(group, dtype=float) for group in groups]
+        padded = np.full((len(rows), max((len(row) for row in rows), default=0)), np.nan)
+        for i, row in enumerate(rows):
+            padded[i, :len(row)] = row
+        return padded
+    
+    def _rank_rows(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Average ranks within each row (NaN stays NaN) and per-row tie term sum(t**3 - t)
+        """
+        n_rows, n_cols = values.shape
+        order = np.argsort(values, axis=1, kind='stable')
+        sorted_values = np.take_along_axis(values, order, axis=1)
+        
+        # Tie groups: a new group starts at each row start and at each change of value
+        starts = np.ones_like(sorted_values, dtype=bool)
+        starts[:, 1:] = sorted_values[:, 1:] != sorted_values[:, :-1]
+        group = np.cumsum(starts.ravel()) - 1
+        group_size = np.bincount(group)
+        group_start = np.flatnonzero(starts.ravel()) % max(n_cols, 1)
+        
+        sorted_ranks = (group_start[group] + (group_size[group] + 1) / 2).reshape(n_rows, n_cols)
+        sorted_ranks[np.isnan(sorted_values)] = np.nan
+        
+        ranks = np.empty_like(sorted_ranks)
+        np.put_along_axis(ranks, order, sorted_ranks, axis=1)
+        
+        group_row = np.flatnonzero(starts.ravel()) // max(n_cols, 1)
+        tie_term = np.bincount(group_row, weights=group_size ** 3 - group_size, minlength=n_rows)
+        return ranks, tie_term
+    
+    def _batch_result(self, test_name: str, testable: np.ndarray, statistic: np.ndarray,
+                      p_values: np.ndarray, effect_sizes: np.ndarray) -> Dict[str, Any]:
+        """
+        Assemble batch results, with default values for topics that cannot be tested
+        """
+        p_values = np.where(testable, p_values, 1.0)
+        effect_sizes = np.where(testable, effect_sizes, 0.0)
+        interpretation = self._interpret_effect_sizes(effect_sizes)
+        interpretation[~testable] = 'No effect'
+        
+        return {
+            'test_name': test_name,
+            'statistic': np.where(testable, statistic, 0.0),
+            'p_value': p_values,
+            'is_significant': p_values < self.alpha,
+            'effect_size': effect_sizes,
+            'interpretation': interpretation
+        }
+    
     def _calculate_cohens_d(self, group1: List[float], group2: List[float]) -> float:
         """
         Calculate Cohen's d effect size
@@ -231,6 +443,16 @@ class StatisticalSignificanceTester:
         else:
             return 'Very large effect'
     
+    def _interpret_effect_sizes(self, effect_sizes: np.ndarray) -> np.ndarray:
+        """
+        Interpret an array of effect size magnitudes
+        """
+        abs_effect = np.abs(effect_sizes)
+        return np.select(
+            [abs_effect < 0.2, abs_effect < 0.5, abs_effect < 0.8],
+            ['Small effect', 'Medium effect', 'Large effect'], default='Very large effect'
+        ).astype(object)
+    
     def _get_default_test_result(self) -> Dict[str, Any]:
         """
         Return default test result when testing fails
@@ -64,25 +64,26 @@ class EmergingTopicsEngine:
             if not all(col in df.columns for col in required_columns):
                 return self._get_fallback_analysis()
             
-            # Segment data by time periods
-            recent_data, historical_data = self._segment_temporal_data(df)
+            # Segment quarters into time periods
+            recent_quarters, historical_quarters = self._segment_quarters(df)
+            recent_records = int(df['quarter'].isin(recent_quarters).sum())
+            historical_records = int(df['quarter'].isin(historical_quarters).sum())
             
-            if recent_data.empty or historical_data.empty:
+            if recent_records == 0 or historical_records == 0:
                 return self._get_fallback_analysis()
             
-            # Extract topics and analyze trends
-            emerging_topics = {}
+            # Analyze every topic at once from the topic/quarter pivot
             all_topics = self._extract_unique_topics(df)
+            topic_analyses = self._analyze_topic_trends(df, all_topics, recent_quarters, historical_quarters)
             
-            for topic in all_topics:
-                topic_analysis = self._analyze_topic_trend(
-                    topic, recent_data, historical_data, df
-                )
-                if topic_analysis['is_significant']:
-                    emerging_topics[topic.lower().replace(' ', '_')] = topic_analysis
+            emerging_topics = {
+                topic.lower().replace(' ', '_'): analysis
+                for topic, analysis in topic_analyses.items()
+                if analysis['is_significant']
+            }
             
             # Generate summary statistics
-            summary = self._generate_trend_summary(emerging_topics, recent_data, historical_data)
+            summary = self._generate_trend_summary(emerging_topics, recent_records, historical_records)
             
             return {
                 'emerging_topics': emerging_topics,
@@ -95,11 +96,10 @@ class EmergingTopicsEngine:
             self.logger.error(f"Error in emerging topics detection: {str(e)}")
             return self._get_fallback_analysis()
     
-    def _segment_temporal_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def _segment_quarters(self, df: pd.DataFrame) -> Tuple[List, List]:
         """
-        Segment data into recent and historical periods
+        Split the sorted quarters into recent and historical periods
         """
-        # Sort quarters and identify periods
         unique_quarters = sorted(df['quarter'].unique())
         
         if len(unique_quarters) < (self.baseline_period + self.recent_period):
@@ -111,6 +111,14 @@ class EmergingTopicsEngine:
             recent_quarters = unique_quarters[-self.recent_period:]
             historical_quarters = unique_quarters[-(self.baseline_period + self.recent_period):-self.recent_period]
         
+        return recent_quarters, historical_quarters
+    
+    def _segment_temporal_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Segment data into recent and historical periods
+        """
+        recent_quarters, historical_quarters = self._segment_quarters(df)
+        
         recent_data = df[df['quarter'].isin(recent_quarters)]
         historical_data = df[df['quarter'].isin(historical_quarters)]
         
@@ -123,199 +131,201 @@ class EmergingTopicsEngine:
         topics = df['primary_topic'].dropna().unique()
         return [topic for topic in topics if topic not in ['Unknown', 'Other', '']]
     
-    def _analyze_topic_trend(self, topic: str, recent_data: pd.DataFrame, 
-                           historical_data: pd.DataFrame, full_data: pd.DataFrame) -> Dict[str, Any]:
-        """
-        Analyze trend for a specific topic
+    def _build_topic_pivot(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
-        # Filter data for this topic
-        recent_topic = recent_data[recent_data['primary_topic'] == topic]
-        historical_topic = historical_data[historical_data['primary_topic'] == topic]
+        Aggregate the data once per (primary_topic, quarter)
         
-        # Calculate basic metrics
-        recent_mentions = len(recent_topic)
-        historical_mentions = len(historical_topic)
+        Returns:
+            Tuple of (row counts and sentiment moments per topic/quarter,
+            speaker counts and first row position per topic/quarter/speaker)
+        """
+        moments = df.groupby(['primary_topic', 'quarter'], sort=False)['sentiment_score'].agg(
+            ['size', 'count', 'mean', 'var']
+        )
         
-        # Calculate growth rate
-        if historical_mentions == 0:
-            growth_rate = 500.0 if recent_mentions > 0 else 0.0
-        else:
-            growth_rate = ((recent_mentions - historical_mentions) / historical_mentions) * 100
+        positions = pd.Series(np.arange(len(df)), index=df.index, name='position')
+        speakers = positions.groupby(
+            [df['primary_topic'], df['quarter'], df['speaker_norm']], sort=False, dropna=False
+        ).agg(['size', 'min'])
         
-        # Calculate sentiment metrics
-        recent_sentiment = recent_topic['sentiment_score'].mean() if not recent_topic.empty else 0.5
-        historical_sentiment = historical_topic['sentiment_score'].mean() if not historical_topic.empty else 0.5
-        sentiment_change = recent_sentiment - historical_sentiment
+        return moments, speakers
+    
+    def _window_moments(self, moments: pd.DataFrame, quarters: List) -> pd.DataFrame:
+        """
+        Combine per-quarter sentiment moments into per-topic moments over a period
+        """
+        window = moments[moments.index.get_level_values('quarter').isin(quarters)]
+        by_topic = window.groupby(level='primary_topic', sort=False)
         
-        # Statistical significance testing
-        significance_results = self._test_statistical_significance(
-            recent_topic, historical_topic, growth_rate, sentiment_change
-        )
+        totals = pd.DataFrame({
+            'rows': by_topic['size'].sum(),
+            'count': by_topic['count'].sum(),
+            'sum': (window['mean'] * window['count']).fillna(0.0).groupby(level='primary_topic', sort=False).sum()
+        })
+        with np.errstate(divide='ignore', invalid='ignore'):
+            totals['mean'] = totals['sum'] / totals['count']
         
-        # Calculate regulatory urgency
-        regulatory_urgency = self._calculate_regulatory_urgency(
-            recent_topic, growth_rate, sentiment_change, significance_results
-        )
+        # Chan's parallel combination of sums of squared deviations
+        topic_mean = totals['mean'].reindex(window.index.get_level_values('primary_topic')).to_numpy()
+        m2 = (window['var'] * (window['count'] - 1)).fillna(0.0) + \
+             (window['count'] * (window['mean'].to_numpy() - topic_mean) ** 2).fillna(0.0)
+        totals['m2'] = m2.groupby(level='primary_topic', sort=False).sum()
         
-        # Extract key information
-        speakers = self._extract_topic_speakers(recent_topic)
-        key_phrases = self._extract_key_phrases(recent_topic)
+        return totals
+    
+    def _window_speakers(self, speakers: pd.DataFrame, quarters: List) -> pd.DataFrame:
+        """
+        Speaker mention counts per topic over a period, ordered as ``value_counts`` would
+        """
+        window = speakers[speakers.index.get_level_values('quarter').isin(quarters)]
+        totals = window.groupby(level=['primary_topic', 'speaker_norm'], sort=False, dropna=False).agg(
+            {'size': 'sum', 'min': 'min'}
+        ).reset_index()
         
-        return {
-            'topic_name': topic,
-            'recent_mentions': recent_mentions,
-            'historical_mentions': historical_mentions,
-            'growth_rate': round(growth_rate, 1),
-            'recent_sentiment': round(recent_sentiment, 3),
-            'historical_sentiment': round(historical_sentiment, 3),
-            'sentiment_change': round(sentiment_change, 3),
-            'speakers': speakers,
-            'key_phrases': key_phrases,
-            'regulatory_urgency': regulatory_urgency,
-            'trend_classification': self._classify_trend(growth_rate),
-            'statistical_significance': significance_results,
-            'is_significant': significance_results['is_significant'],
-            'confidence_interval': significance_results['confidence_interval'],
-            'p_value': significance_results['p_value']
-        }
+        # Most mentioned first; ties in order of first appearance
+        return totals.sort_values(['primary_topic', 'size', 'min'], ascending=[True, False, True], kind='stable')
     
-    def _test_statistical_significance(self, recent_data: pd.DataFrame, 
-                                     historical_data: pd.DataFrame,
-                                     growth_rate: float, sentiment_change: float) -> Dict[str, Any]:
+    def _analyze_topic_trends(self, df: pd.DataFrame, topics: List[str],
+                              recent_quarters: List, historical_quarters: List) -> Dict[str, Dict[str, Any]]:
         """
-        Test statistical significance of observed trends
+        Analyze trends for all topics from a single topic/quarter aggregation
         """
-        try:
-            # Test for frequency change significance (Mann-Whitney U test)
-            if len(recent_data) > 0 and len(historical_data) > 0:
-                # Create frequency arrays for statistical testing
-                recent_freq = [1] * len(recent_data)
-                historical_freq = [1] * len(historical_data)
-                
-                # Mann-Whitney U test for frequency differences
-                if len(recent_freq) > 1 and len(historical_freq) > 1:
-                    freq_stat, freq_p_value = stats.mannwhitneyu(
-                        recent_freq, historical_freq, alternative='two-sided'
-                    )
-                else:
-                    freq_p_value = 1.0
-                
-                # T-test for sentiment change
-                if (len(recent_data) > 1 and len(historical_data) > 1 and 
-                    'sentiment_score' in recent_data.columns):
-                    recent_sentiment = recent_data['sentiment_score'].dropna()
-                    historical_sentiment = historical_data['sentiment_score'].dropna()
-                    
-                    if len(recent_sentiment) > 1 and len(historical_sentiment) > 1:
-                        sent_stat, sent_p_value = stats.ttest_ind(
-                            recent_sentiment, historical_sentiment
-                        )
-                    else:
-                        sent_p_value = 1.0
-                else:
-                    sent_p_value = 1.0
-                
-                # Combined significance (Bonferroni correction)
-                combined_p_value = min(freq_p_value * 2, sent_p_value * 2, 1.0)
-                
-            else:
-                freq_p_value = 1.0
-                sent_p_value = 1.0
-                combined_p_value = 1.0
-            
-            # Calculate confidence interval for growth rate
-            confidence_interval = self._calculate_growth_confidence_interval(
-                len(recent_data), len(historical_data), growth_rate
+        moments, speakers = self._build_topic_pivot(df)
+        index = pd.Index(topics, dtype=object)
+        recent = self._window_moments(moments, recent_quarters).reindex(index)
+        historical = self._window_moments(moments, historical_quarters).reindex(index)
+        
+        recent_mentions = recent['rows'].fillna(0).to_numpy(dtype=int)
+        historical_mentions = historical['rows'].fillna(0).to_numpy(dtype=int)
+        
+        # Growth rate
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth_rate = np.where(
+                historical_mentions == 0,
+                np.where(recent_mentions > 0, 500.0, 0.0),
+                ((recent_mentions - historical_mentions) / historical_mentions) * 100
             )
-            
-            is_significant = combined_p_value < self.significance_threshold
-            
-            return {
-                'frequency_p_value': round(freq_p_value, 4),
-                'sentiment_p_value': round(sent_p_value, 4),
-                'p_value': round(combined_p_value, 4),
-                'is_significant': is_significant,
-                'confidence_interval': confidence_interval,
-                'significance_level': self.significance_threshold
-            }
-            
-        except Exception as e:
-            self.logger.warning(f"Statistical significance testing failed: {str(e)}")
-            return {
+        
+        # Sentiment metrics
+        recent_sentiment = np.where(recent_mentions > 0, recent['mean'].to_numpy(dtype=float), 0.5)
+        historical_sentiment = np.where(historical_mentions > 0, historical['mean'].to_numpy(dtype=float), 0.5)
+        sentiment_change = recent_sentiment - historical_sentiment
+        
+        # Statistical significance
+        significance = self._test_trend_significance(recent, historical, recent_mentions, historical_mentions)
+        confidence_intervals = self._growth_confidence_intervals(recent_mentions, historical_mentions, growth_rate)
+        
+        # Speaker authority and regulatory urgency
+        recent_speakers = self._window_speakers(speakers, recent_quarters)
+        speaker_weight = recent_speakers['speaker_norm'].map(lambda s: self.speaker_weights.get(s, 0.1))
+        max_speaker_weight = speaker_weight.groupby(recent_speakers['primary_topic']).max().reindex(index)
+        urgency = self._regulatory_urgency_levels(
+            growth_rate, sentiment_change, max_speaker_weight.to_numpy(dtype=float), significance['is_significant']
+        )
+        
+        named = recent_speakers[recent_speakers['speaker_norm'].notna()]
+        top_speakers = named.groupby('primary_topic', sort=False).head(5)
+        top_speakers = top_speakers[~top_speakers['speaker_norm'].isin(['Unknown', ''])]
+        speakers_by_topic = top_speakers.groupby('primary_topic', sort=False)['speaker_norm'].agg(list)
+        
+        analyses = {}
+        for i, topic in enumerate(topics):
+            topic_significance = {
                 'frequency_p_value': 1.0,
-                'sentiment_p_value': 1.0,
-                'p_value': 1.0,
-                'is_significant': False,
-                'confidence_interval': [growth_rate - 10, growth_rate + 10],
+                'sentiment_p_value': significance['sentiment_p_value'][i],
+                'p_value': significance['p_value'][i],
+                'is_significant': bool(significance['is_significant'][i]),
+                'confidence_interval': confidence_intervals[i],
                 'significance_level': self.significance_threshold
             }
+            analyses[topic] = {
+                'topic_name': topic,
+                'recent_mentions': int(recent_mentions[i]),
+                'historical_mentions': int(historical_mentions[i]),
+                'growth_rate': round(growth_rate[i], 1),
+                'recent_sentiment': round(recent_sentiment[i], 3),
+                'historical_sentiment': round(historical_sentiment[i], 3),
+                'sentiment_change': round(sentiment_change[i], 3),
+                'speakers': speakers_by_topic.get(topic, []),
+                'key_phrases': self._extract_key_phrases(topic if recent_mentions[i] > 0 else None),
+                'regulatory_urgency': urgency[i],
+                'trend_classification': self._classify_trend(growth_rate[i]),
+                'statistical_significance': topic_significance,
+                'is_significant': topic_significance['is_significant'],
+                'confidence_interval': topic_significance['confidence_interval'],
+                'p_value': topic_significance['p_value']
+            }
+        
+        return analyses
     
-    def _calculate_growth_confidence_interval(self, recent_count: int, 
-                                            historical_count: int, growth_rate: float) -> List[float]:
+    def _test_trend_significance(self, recent: pd.DataFrame, historical: pd.DataFrame,
+                                 recent_mentions: np.ndarray, historical_mentions: np.ndarray) -> Dict[str, np.ndarray]:
         """
-        Calculate confidence interval for growth rate using bootstrap method
+        Test statistical significance of observed trends for all topics
+        
+        Every mention carries the same frequency weight, so the Mann-Whitney U
+        frequency test always gives p = 1.0; the sentiment t-test (pooled
+        variance) is computed from the combined period moments.
         """
-        try:
-            if historical_count == 0:
-                return [max(0, growth_rate - 50), growth_rate + 50]
-            
-            # Simple confidence interval based on Poisson distribution
-            recent_ci = stats.poisson.interval(0.95, recent_count)
-            historical_ci = stats.poisson.interval(0.95, historical_count)
-            
-            # Calculate growth rate bounds
-            lower_growth = ((recent_ci[0] - historical_ci[1]) / historical_count) * 100
-            upper_growth = ((recent_ci[1] - historical_ci[0]) / historical_count) * 100
-            
-            return [round(lower_growth, 1), round(upper_growth, 1)]
-            
-        except Exception:
-            return [max(0, growth_rate - 25), growth_rate + 25]
+        recent_count = recent['count'].fillna(0).to_numpy(dtype=float)
+        historical_count = historical['count'].fillna(0).to_numpy(dtype=float)
+        testable = (recent_mentions > 1) & (historical_mentions > 1) & (recent_count > 1) & (historical_count > 1)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dof = recent_count + historical_count - 2
+            pooled_variance = (recent['m2'].to_numpy(dtype=float) + historical['m2'].to_numpy(dtype=float)) / dof
+            t_stat = (recent['mean'].to_numpy(dtype=float) - historical['mean'].to_numpy(dtype=float)) / \
+                np.sqrt(pooled_variance * (1 / recent_count + 1 / historical_count))
+            sentiment_p_value = np.where(testable, 2 * stats.t.sf(np.abs(t_stat), dof), 1.0)
+        
+        # Combined significance (Bonferroni correction); undefined tests are not significant
+        doubled = sentiment_p_value * 2
+        combined_p_value = np.where(doubled < 1.0, doubled, 1.0)
+        
+        return {
+            'sentiment_p_value': np.round(sentiment_p_value, 4),
+            'p_value': np.round(combined_p_value, 4),
+            'is_significant': combined_p_value < self.significance_threshold
+        }
     
-    def _calculate_regulatory_urgency(self, recent_data: pd.DataFrame, 
-                                    growth_rate: float, sentiment_change: float,
-                                    significance_results: Dict) -> str:
+    def _growth_confidence_intervals(self, recent_mentions: np.ndarray, historical_mentions: np.ndarray,
+                                     growth_rate: np.ndarray) -> List[List[float]]:
         """
-        Calculate regulatory urgency level
+        Confidence intervals for growth rates based on Poisson count intervals
         """
-        urgency_score = 0
+        recent_low, recent_high = stats.poisson.interval(0.95, recent_mentions)
+        historical_low, historical_high = stats.poisson.interval(0.95, historical_mentions)
         
-        # Growth rate contribution
-        if growth_rate > self.growth_thresholds['explosive']:
-            urgency_score += 3
-        elif growth_rate > self.growth_thresholds['rapid']:
-            urgency_score += 2
-        elif growth_rate > self.growth_thresholds['emerging']:
-            urgency_score += 1
-        
-        # Sentiment deterioration contribution
-        if sentiment_change < -0.2:
-            urgency_score += 2
-        elif sentiment_change < -0.1:
-            urgency_score += 1
-        
-        # Speaker authority contribution
-        if not recent_data.empty:
-            max_speaker_weight = max([
-                self.speaker_weights.get(speaker, 0.1) 
-                for speaker in recent_data['speaker_norm'].unique()
-            ])
-            if max_speaker_weight >= 0.9:
-                urgency_score += 1
-        
-        # Statistical significance contribution
-        if significance_results['is_significant']:
-            urgency_score += 1
-        
-        # Map score to urgency level
-        if urgency_score >= 5:
-            return 'Critical'
-        elif urgency_score >= 3:
-            return 'High'
-        elif urgency_score >= 2:
-            return 'Medium'
-        else:
-            return 'Low'
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lower_growth = np.round((recent_low - historical_high) / historical_mentions * 100, 1)
+            upper_growth = np.round((recent_high - historical_low) / historical_mentions * 100, 1)
+        
+        return [
+            [max(0, growth - 50), growth + 50] if historical == 0 else [lower, upper]
+            for historical, growth, lower, upper in zip(
+                historical_mentions, growth_rate.tolist(), lower_growth.tolist(), upper_growth.tolist()
+            )
+        ]
+    
+    def _regulatory_urgency_levels(self, growth_rate: np.ndarray, sentiment_change: np.ndarray,
+                                   max_speaker_weight: np.ndarray, is_significant: np.ndarray) -> List[str]:
+        """
+        Regulatory urgency level for every topic
+        """
+        urgency_score = np.select(
+            [growth_rate > self.growth_thresholds['explosive'],
+             growth_rate > self.growth_thresholds['rapid'],
+             growth_rate > self.growth_thresholds['emerging']],
+            [3, 2, 1], default=0
+        )
+        urgency_score += np.select([sentiment_change < -0.2, sentiment_change < -0.1], [2, 1], default=0)
+        urgency_score += (max_speaker_weight >= 0.9).astype(int)
+        urgency_score += np.asarray(is_significant, dtype=int)
+        
+        return np.select(
+            [urgency_score >= 5, urgency_score >= 3, urgency_score >= 2],
+            ['Critical', 'High', 'Medium'], default='Low'
+        ).tolist()
     
     def _classify_trend(self, growth_rate: float) -> str:
         """
@@ -334,17 +344,7 @@ class EmergingTopicsEngine:
         else:
             return 'Declining'
     
-    def _extract_topic_speakers(self, topic_data: pd.DataFrame) -> List[str]:
-        """
-        Extract unique speakers for a topic
-        """
-        if topic_data.empty:
-            return []
-        
-        speakers = topic_data['speaker_norm'].value_counts().head(5).index.tolist()
-        return [speaker for speaker in speakers if speaker not in ['Unknown', '']]
-    
-    def _extract_key_phrases(self, topic_data: pd.DataFrame) -> List[str]:
+    def _extract_key_phrases(self, topic_name: Optional[str]) -> List[str]:
         """
         Extract key phrases for a topic (simplified implementation)
         """
@@ -356,17 +356,17 @@ class EmergingTopicsEngine:
             'market volatility', 'credit risk', 'liquidity risk'
         ]
         
-        if topic_data.empty:
+        if topic_name is None:
             return common_phrases[:3]
         
         # Return relevant phrases based on topic
-        topic_name = topic_data['primary_topic'].iloc[0].lower()
+        topic_name = topic_name.lower()
         relevant_phrases = [phrase for phrase in common_phrases if any(word in topic_name for word in phrase.split())]
         
         return relevant_phrases[:5] if relevant_phrases else common_phrases[:3]
     
-    def _generate_trend_summary(self, emerging_topics: Dict, 
-                              recent_data: pd.DataFrame, historical_data: pd.DataFrame) -> Dict[str, Any]:
+    def _generate_trend_summary(self, emerging_topics: Dict,
+                              recent_records: int, historical_records: int) -> Dict[str, Any]:
         """
         Generate summary statistics for trend analysis
         """
@@ -392,8 +392,8 @@ class EmergingTopicsEngine:
             'analysis_period': {
                 'recent_quarters': self.recent_period,
                 'baseline_quarters': self.baseline_period,
-                'total_recent_records': len(recent_data),
-                'total_historical_records': len(historical_data)
+                'total_recent_records': recent_records,
+                'total_historical_records': historical_records
             }
         }
     
@@ -4,27 +4,238 @@ Advanced FinBERT-based sentiment analysis for financial risk monitoring
 
 import pandas as pd
 import numpy as np
+from scipy import sparse
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 from transformers import pipeline
 import torch
 from typing import Dict, List, Tuple, Optional
 import logging
+import inspect
+import itertools
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import yaml
 import re
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+# Optional ONNX Runtime backend for CPU inference
+try:
+    import onnxruntime as ort
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+    logging.debug("onnxruntime not available. ONNX backend disabled.")
+
+
+def plan_token_batches(lengths: np.ndarray, max_batch_tokens: int,
+                       max_batch_size: Optional[int] = None) -> List[np.ndarray]:
+    """
+    Group texts into length-sorted batches under a padded token budget
+    
+    Texts are sorted by token length so each batch pads to a length close to
+    that of all its members. A batch is closed when adding the next text would
+    make ``batch_size * longest_length`` exceed the budget.
+    
+    Args:
+        lengths: Token length of every text
+        max_batch_tokens: Padded token budget per batch
+        max_batch_size: Optional cap on the number of texts per batch
+        
+    Returns:
+        List of index arrays into the original texts, one per batch
+    """
+    order = np.argsort(lengths, kind='stable')
+    batches = []
+    start = 0
+    for position, index in enumerate(order):
+        size = position - start + 1
+        over_budget = size * max(int(lengths[index]), 1) > max_batch_tokens
+        over_size = max_batch_size is not None and size > max_batch_size
+        if size > 1 and (over_budget or over_size):
+            batches.append(order[start:position])
+            start = position
+    if start < len(order):
+        batches.append(order[start:])
+    return batches
+
+
+# Analyzer owned by each sharded inference worker process
+_WORKER_ANALYZER = None
+
+
+def _init_inference_worker(config_path: Optional[str], num_threads: int):
+    """Load the model once per worker process"""
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = FinBERTAnalyzer(config_path, num_threads=num_threads)
+
+
+def _score_shard(indices: np.ndarray, texts: List[str]) -> Tuple[np.ndarray, List[Dict]]:
+    """Score one length-bucketed batch in a worker process"""
+    return indices, _WORKER_ANALYZER._process_batch(texts, include_lexicon=False)
+
+
+class ONNXFinBERTBackend:
+    """
+    Dynamic int8 quantised FinBERT running on ONNX Runtime
+    
+    The PyTorch model is exported to ONNX and quantised once; the quantised
+    artefact is cached under ``models_path`` and reused by later runs.
+    """
+    
+    # Positional order of BertForSequenceClassification.forward inputs
+    INPUT_ORDER = ['input_ids', 'attention_mask', 'token_type_ids']
+    
+    # Accepted drift of the quantised model from PyTorch (see compare_backends)
+    MIN_LABEL_AGREEMENT = 0.95
+    MAX_MEAN_PROBABILITY_DIFFERENCE = 0.02
+    
+    def __init__(self, model, tokenizer, model_name: str, models_path: Path,
+                 num_threads: Optional[int] = None, max_length: int = 512):
+        """
+        Load (exporting and quantising on first use) the ONNX model
+        
+        Args:
+            model: PyTorch sequence classification model to export
+            tokenizer: Tokenizer matching the model
+            model_name: Model identifier, used for the cache directory name
+            models_path: Root directory for cached model artefacts
+            num_threads: ONNX Runtime intra-op threads (defaults to all cores)
+            max_length: Maximum sequence length after truncation
+        """
+        if not ONNX_AVAILABLE:
+            raise ImportError("onnxruntime is required for the ONNX backend")
+        
+        self.tokenizer = tokenizer
+        self.max_length = max_length
+        self.id2label = {int(k): v for k, v in model.config.id2label.items()}
+        self.model_path = self._ensure_model(model, model_name, Path(models_path))
+        
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = num_threads or os.cpu_count() or 1
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            str(self.model_path), options, providers=['CPUExecutionProvider']
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        
+        logging.info(f"ONNX FinBERT backend loaded from {self.model_path} "
+                     f"with {options.intra_op_num_threads} intra-op threads")
+    
+    def _ensure_model(self, model, model_name: str, models_path: Path) -> Path:
+        """Return the cached quantised model, creating it if needed"""
+        model_dir = models_path / 'onnx' / model_name.replace('/', '--')
+        quantized_path = model_dir / 'model.int8.onnx'
+        if quantized_path.exists():
+            return quantized_path
+        
+        model_dir.mkdir(parents=True, exist_ok=True)
+        fp32_path = model_dir / 'model.onnx'
+        logging.info(f"Exporting {model_name} to ONNX: {fp32_path}")
+        self.export(model, fp32_path)
+        
+        logging.info(f"Quantising ONNX model to int8: {quantized_path}")
+        quantize_dynamic(str(fp32_path), str(quantized_path), weight_type=QuantType.QInt8)
+        return quantized_path
+    
+    def export(self, model, path: Path):
+        """Export the PyTorch model to ONNX with dynamic batch and sequence axes"""
+        sample = self.tokenizer(["FinBERT export sample"], return_tensors='pt')
+        input_names = [name for name in self.INPUT_ORDER if name in sample]
+        dynamic_axes = {name: {0: 'batch', 1: 'sequence'} for name in input_names}
+        dynamic_axes['logits'] = {0: 'batch'}
+        
+        # Newer torch defaults to the dynamo exporter, which needs onnxscript
+        export_options = {}
+        if 'dynamo' in inspect.signature(torch.onnx.export).parameters:
+            export_options['dynamo'] = False
+        
+        model.eval()
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                tuple(sample[name] for name in input_names),
+                str(path),
+                input_names=input_names,
+                output_names=['logits'],
+                dynamic_axes=dynamic_axes,
+                opset_version=14,
+                **export_options
+            )
+    
+    def predict(self, texts: List[str]) -> List[List[Dict]]:
+        """
+        Score a batch of texts
+        
+        Returns:
+            Per-text list of ``{'label', 'score'}`` dicts, as returned by the
+            HF pipeline with all scores
+        """
+        encoded = self.tokenizer(
+            texts, padding=True, truncation=True,
+            max_length=self.max_length, return_tensors='np'
+        )
+        feeds = {name: encoded[name].astype(np.int64) for name in self.input_names}
+        logits = self.session.run(['logits'], feeds)[0]
+        
+        # Softmax over labels
+        logits = logits - logits.max(axis=1, keepdims=True)
+        probabilities = np.exp(logits)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        
+        return [
+            [{'label': self.id2label[j], 'score': float(p[j])} for j in range(len(p))]
+            for p in probabilities
+        ]
+
+
 class FinBERTAnalyzer:
     """
     Advanced FinBERT sentiment analyzer with risk-specific features
     """
     
-    def __init__(self, config_path: Optional[str] = None):
+    # Financial stress and confidence indicators for risk language features
+    STRESS_INDICATORS = ['stress', 'pressure', 'concern', 'worry', 'issue', 'problem', 'challenge']
+    CONFIDENCE_INDICATORS = ['confident', 'strong', 'solid', 'robust', 'healthy', 'optimistic']
+    
+    # Sentence boundaries used by the complexity score
+    _SENTENCE_BOUNDARY = re.compile(r'[.!?]+')
+    
+    # Lexicon feature columns in result order
+    LEXICON_FEATURES = [
+        'hedging_score', 'uncertainty_score', 'formality_score', 'complexity_score',
+        'risk_escalation_score', 'stress_score', 'confidence_score'
+    ]
+    
+    def __init__(self, config_path: Optional[str] = None, num_threads: Optional[int] = None):
+        self.config_path = config_path
         self.config = self._load_config(config_path)
         self.model_name = self.config.get('sentiment_analysis', {}).get('model_name', 'ProsusAI/finbert')
         self.batch_size = self.config.get('sentiment_analysis', {}).get('batch_size', 32)
         self.confidence_threshold = self.config.get('sentiment_analysis', {}).get('confidence_threshold', 0.7)
+        self.length_bucketing = self.config.get('sentiment_analysis', {}).get('length_bucketing', True)
+        self.max_batch_tokens = self.config.get('sentiment_analysis', {}).get('max_batch_tokens', 8192)
+        self.max_length = self.config.get('sentiment_analysis', {}).get('max_length', 512)
+        self.backend = self.config.get('sentiment_analysis', {}).get('backend', 'pytorch')
+        self.onnx_threads = self.config.get('sentiment_analysis', {}).get('onnx_threads')
+        self.models_path = Path(
+            self.config.get('sentiment_analysis', {}).get('models_path')
+            or Path(__file__).parent.parent.parent / "models"
+        )
+        self.inference_workers = self.config.get('sentiment_analysis', {}).get('inference_workers')
+        self.sharding_threshold = self.config.get('sentiment_analysis', {}).get('sharding_threshold', 5000)
+        if self.inference_workers is None:
+            self.inference_workers = max(1, (os.cpu_count() or 1) // 4)
+        
+        # Per-process thread count, set by sharded inference workers
+        if num_threads:
+            torch.set_num_threads(num_threads)
+            self.onnx_threads = num_threads
         
         # Initialize model and tokenizer
         self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
@@ -37,9 +248,18 @@ class FinBERTAnalyzer:
             model=self.model,
             tokenizer=self.tokenizer,
             device=device,
-            return_all_scores=True
+            top_k=None  # Scores for every label
         )
         
+        # Optional quantised ONNX Runtime backend
+        self.onnx_backend = None
+        if self.backend == 'onnx':
+            if ONNX_AVAILABLE:
+                self._get_onnx_backend()
+            else:
+                logging.warning("onnxruntime not installed. Falling back to PyTorch backend.")
+                self.backend = 'pytorch'
+        
         # Load risk-specific lexicons
         self._load_risk_lexicons()
         
@@ -90,53 +310,141 @@ class FinBERTAnalyzer:
         """
         Analyze sentiment for a list of texts using FinBERT
         
+        With ``length_bucketing`` enabled, texts are batched by token length
+        under the ``max_batch_tokens`` budget and results are returned in
+        input order. Otherwise fixed ``batch_size`` batches are used.
+        
         Args:
             texts: List of text strings to analyze
             
         Returns:
             List of sentiment analysis results
         """
-        results = []
+        # Lexicon features are computed in a background thread while the model runs
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            lexicon_future = executor.submit(self.lexicon_features, texts)
+            
+            if not self.length_bucketing:
+                results = []
+                
+                # Process in batches
+                for i in range(0, len(texts), self.batch_size):
+                    batch = texts[i:i + self.batch_size]
+                    batch_results = self._process_batch(batch, include_lexicon=False)
+                    results.extend(batch_results)
+            else:
+                results = [None] * len(texts)
+                batches = plan_token_batches(self._token_lengths(texts), self.max_batch_tokens)
+                for indices in batches:
+                    batch_results = self._process_batch([texts[i] for i in indices], include_lexicon=False)
+                    for i, result in zip(indices.tolist(), batch_results):
+                        results[i] = result
+            
+            return self._merge_lexicon_features(results, lexicon_future.result())
+    
+    def analyze_sentiment_sharded(self, texts: List[str], n_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Analyze sentiment across several worker processes
         
-        # Process in batches
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i:i + self.batch_size]
-            batch_results = self._process_batch(batch)
-            results.extend(batch_results)
+        Each worker loads the model once and runs with ``cores / n_workers``
+        threads. Length-bucketed batches are queued to the workers, longest
+        first, and results are reassembled in input order.
         
-        return results
+        Args:
+            texts: List of text strings to analyze
+            n_workers: Number of worker processes (defaults to ``inference_workers``)
+            
+        Returns:
+            List of sentiment analysis results
+        """
+        n_workers = n_workers or self.inference_workers
+        if n_workers <= 1 or not texts:
+            return self.analyze_sentiment(texts)
+        
+        num_threads = max(1, (os.cpu_count() or 1) // n_workers)
+        batches = plan_token_batches(self._token_lengths(texts), self.max_batch_tokens)
+        logging.info(f"Sharding {len(texts)} texts in {len(batches)} batches "
+                     f"over {n_workers} workers x {num_threads} threads")
+        
+        results = [None] * len(texts)
+        
+        # Spawned workers avoid inheriting the parent's initialised thread pools
+        with ThreadPoolExecutor(max_workers=1) as lexicon_executor, ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_inference_worker,
+            initargs=(self.config_path, num_threads)
+        ) as executor:
+            futures = [
+                executor.submit(_score_shard, indices, [texts[i] for i in indices])
+                for indices in reversed(batches)
+            ]
+            lexicon_future = lexicon_executor.submit(self.lexicon_features, texts)
+            for future in as_completed(futures):
+                indices, batch_results = future.result()
+                for i, result in zip(indices.tolist(), batch_results):
+                    results[i] = result
+            
+            return self._merge_lexicon_features(results, lexicon_future.result())
+    
+    def _analyze_texts(self, texts: List[str]) -> List[Dict]:
+        """Analyze sentiment, sharding over worker processes for large CPU inputs"""
+        use_sharding = (
+            self.inference_workers > 1
+            and len(texts) >= self.sharding_threshold
+            and not torch.cuda.is_available()
+        )
+        if use_sharding:
+            return self.analyze_sentiment_sharded(texts)
+        return self.analyze_sentiment(texts)
+    
+    def _token_lengths(self, texts: List[str], chunk_size: int = 10000) -> np.ndarray:
+        """Token length of every text after truncation to ``max_length``"""
+        lengths = np.empty(len(texts), dtype=np.int64)
+        for start in range(0, len(texts), chunk_size):
+            encoded = self.tokenizer(
+                texts[start:start + chunk_size],
+                truncation=True,
+                max_length=self.max_length
+            )
+            lengths[start:start + chunk_size] = [len(ids) for ids in encoded['input_ids']]
+        return lengths
     
-    def _process_batch(self, batch: List[str]) -> List[Dict]:
-        """Process a batch of texts through FinBERT"""
+    def _process_batch(self, batch: List[str], include_lexicon: bool = True) -> List[Dict]:
+        """
+        Process a batch of texts through FinBERT
+        
+        Args:
+            batch: Texts to score
+            include_lexicon: Add tone and risk language features; callers that
+                compute them for the whole input separately pass False
+        """
         try:
             # Get FinBERT predictions
-            predictions = self.sentiment_pipeline(batch)
+            predictions = self._predict(batch)
             
             results = []
-            for text, pred in zip(batch, predictions):
+            for pred in predictions:
                 # Extract sentiment scores
                 sentiment_scores = {item['label'].lower(): item['score'] for item in pred}
                 
                 # Determine primary sentiment
                 primary_sentiment = max(sentiment_scores.items(), key=lambda x: x[1])
                 
-                # Calculate additional features
-                tone_features = self._analyze_tone(text)
-                risk_features = self._analyze_risk_language(text)
-                
                 result = {
                     'sentiment_label': primary_sentiment[0],
                     'sentiment_score': primary_sentiment[1],
                     'sentiment_positive': sentiment_scores.get('positive', 0.0),
                     'sentiment_negative': sentiment_scores.get('negative', 0.0),
                     'sentiment_neutral': sentiment_scores.get('neutral', 0.0),
-                    'sentiment_confidence': primary_sentiment[1],
-                    **tone_features,
-                    **risk_features
+                    'sentiment_confidence': primary_sentiment[1]
                 }
                 
                 results.append(result)
             
+            if include_lexicon:
+                results = self._merge_lexicon_features(results, self.lexicon_features(batch))
+            
             return results
             
         except Exception as e:
@@ -144,6 +452,258 @@ class FinBERTAnalyzer:
             # Return default results for the batch
             return [self._get_default_result() for _ in batch]
     
+    def _predict(self, batch: List[str], backend: Optional[str] = None) -> List[List[Dict]]:
+        """Run one batch through the selected backend as a single padded forward pass"""
+        if (backend or self.backend) == 'onnx':
+            return self._get_onnx_backend().predict(batch)
+        
+        return self.sentiment_pipeline(
+            batch,
+            batch_size=len(batch),
+            truncation=True,
+            max_length=self.max_length
+        )
+    
+    def _get_onnx_backend(self) -> ONNXFinBERTBackend:
+        """Create the ONNX backend on first use"""
+        if self.onnx_backend is None:
+            self.onnx_backend = ONNXFinBERTBackend(
+                self.model,
+                self.tokenizer,
+                self.model_name,
+                self.models_path,
+                num_threads=self.onnx_threads,
+                max_length=self.max_length
+            )
+        return self.onnx_backend
+    
+    def compare_backends(self, texts: List[str], labels: Optional[List[str]] = None) -> Dict:
+        """
+        Check the ONNX backend against the PyTorch backend on a sample
+        
+        Args:
+            texts: Sample texts
+            labels: Optional gold sentiment labels for the texts
+            
+        The quantised backend is considered within tolerance when label
+        agreement is at least ``ONNXFinBERTBackend.MIN_LABEL_AGREEMENT`` and
+        the mean absolute probability difference is at most
+        ``ONNXFinBERTBackend.MAX_MEAN_PROBABILITY_DIFFERENCE``.
+        
+        Returns:
+            Dictionary with label agreement, probability differences, whether
+            they are within tolerance and, when labels are given, the
+            accuracy of each backend
+        """
+        if not texts:
+            return {'sample_size': 0}
+        
+        label_names = [label.lower() for label in self.model.config.id2label.values()]
+        batches = plan_token_batches(self._token_lengths(texts), self.max_batch_tokens)
+        
+        probabilities = {}
+        for backend in ['pytorch', 'onnx']:
+            backend_probs = np.zeros((len(texts), len(label_names)))
+            for indices in batches:
+                predictions = self._predict([texts[i] for i in indices], backend=backend)
+                for i, pred in zip(indices.tolist(), predictions):
+                    scores = {item['label'].lower(): item['score'] for item in pred}
+                    backend_probs[i] = [scores[name] for name in label_names]
+            probabilities[backend] = backend_probs
+        
+        predicted = {
+            backend: np.array(label_names)[probs.argmax(axis=1)]
+            for backend, probs in probabilities.items()
+        }
+        differences = np.abs(probabilities['pytorch'] - probabilities['onnx'])
+        
+        report = {
+            'sample_size': len(texts),
+            'label_agreement': float(np.mean(predicted['pytorch'] == predicted['onnx'])),
+            'max_probability_difference': float(differences.max()),
+            'mean_probability_difference': float(differences.mean())
+        }
+        report['within_tolerance'] = (
+            report['label_agreement'] >= ONNXFinBERTBackend.MIN_LABEL_AGREEMENT
+            and report['mean_probability_difference'] <= ONNXFinBERTBackend.MAX_MEAN_PROBABILITY_DIFFERENCE
+        )
+        
+        if labels is not None:
+            gold = np.array([str(label).lower() for label in labels])
+            for backend, backend_labels in predicted.items():
+                report[f'{backend}_accuracy'] = float(np.mean(backend_labels == gold))
+        
+        return report
+    
+    def _lexicon_families(self) -> Dict[str, List[str]]:
+        """Term lists behind the tone and risk language features"""
+        return {
+            'hedging': self.hedging_language,
+            'uncertainty': self.uncertainty_markers,
+            'formal': self.formality_indicators.get('high', []),
+            'informal': self.formality_indicators.get('low', []),
+            'deteriorating': self.risk_escalation.get('deteriorating', []),
+            'mitigation': self.risk_escalation.get('mitigation', []),
+            'stress': self.STRESS_INDICATORS,
+            'confidence': self.CONFIDENCE_INDICATORS
+        }
+    
+    @staticmethod
+    def _rows_containing(term: str, joined: str, starts: np.ndarray) -> np.ndarray:
+        """Rows of a separator-joined column whose text contains ``term``"""
+        positions = []
+        find = joined.find
+        position = find(term)
+        while position != -1:
+            positions.append(position)
+            position = find(term, position + 1)
+        return np.unique(np.searchsorted(starts, positions, side='right') - 1)
+    
+    @staticmethod
+    def _join_rows(texts: List[str]) -> Tuple[str, np.ndarray]:
+        """Join texts with a NUL separator, returning the start offset of every row"""
+        lengths = np.fromiter((len(text) + 1 for text in texts), dtype=np.int64, count=len(texts))
+        return '\x00'.join(texts), np.cumsum(lengths) - lengths
+    
+    def term_presence(self, texts: List[str], terms: List[str],
+                      tokens: Optional[List[List[str]]] = None,
+                      chunk_size: int = 100000) -> sparse.csr_matrix:
+        """
+        Sparse text x term matrix of ``term in text`` substring hits
+        
+        A term without whitespace occurs in a text exactly when it occurs
+        inside one of the text's whitespace-separated tokens. Such terms are
+        searched once in the distinct tokens of the whole column and mapped
+        back through a sparse text x token count matrix, so overlapping hits
+        (``potential`` inside ``potentially``) are kept. Terms containing
+        whitespace are searched with ``str.find`` over the joined texts.
+        
+        Args:
+            texts: Texts to scan (already lowercased if matching is case-insensitive)
+            terms: Distinct literal terms
+            tokens: ``text.split()`` of every text, when already computed
+            chunk_size: Number of texts joined per scan for whitespace terms
+            
+        Returns:
+            Binary CSR matrix of shape ``(len(texts), len(terms))``
+        """
+        n_texts, n_terms = len(texts), len(terms)
+        if tokens is None:
+            tokens = [text.split() for text in texts]
+        
+        # Text x distinct token matrix
+        token_counts = np.fromiter((len(words) for words in tokens), dtype=np.int64, count=n_texts)
+        token_codes, vocabulary = pd.factorize(
+            np.array(list(itertools.chain.from_iterable(tokens)), dtype=object)
+        )
+        text_tokens = sparse.csr_matrix(
+            (np.ones(len(token_codes)), (np.repeat(np.arange(n_texts), token_counts), token_codes)),
+            shape=(n_texts, len(vocabulary))
+        )
+        
+        # Distinct token x term hits for terms without whitespace
+        joined_vocabulary, vocabulary_starts = self._join_rows(list(vocabulary))
+        token_rows, token_columns = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+        text_rows, text_columns = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+        whitespace_terms = []
+        for j, term in enumerate(terms):
+            if not term:
+                # The empty string is contained in every text
+                text_rows.append(np.arange(n_texts))
+                text_columns.append(np.full(n_texts, j))
+            elif any(char.isspace() for char in term):
+                whitespace_terms.append(j)
+            else:
+                rows = self._rows_containing(term, joined_vocabulary, vocabulary_starts)
+                token_rows.append(rows)
+                token_columns.append(np.full(len(rows), j))
+        
+        token_terms = sparse.csr_matrix(
+            (np.ones(sum(len(rows) for rows in token_rows)),
+             (np.concatenate(token_rows), np.concatenate(token_columns))),
+            shape=(len(vocabulary), n_terms)
+        )
+        
+        # Terms spanning several tokens are searched in the texts themselves
+        for offset in range(0, n_texts if whitespace_terms else 0, chunk_size):
+            joined, starts = self._join_rows(texts[offset:offset + chunk_size])
+            for j in whitespace_terms:
+                rows = self._rows_containing(terms[j], joined, starts) + offset
+                text_rows.append(rows)
+                text_columns.append(np.full(len(rows), j))
+        
+        text_rows = np.concatenate(text_rows)
+        presence = text_tokens @ token_terms + sparse.csr_matrix(
+            (np.ones(len(text_rows)), (text_rows, np.concatenate(text_columns))), shape=(n_texts, n_terms)
+        )
+        return (presence > 0).astype(np.float64)
+    
+    def lexicon_features(self, texts: List[str]) -> pd.DataFrame:
+        """
+        Compute tone and risk language features for a whole column of texts
+        
+        Vectorised equivalent of ``_analyze_tone`` and ``_analyze_risk_language``:
+        a sparse text x term presence matrix over the distinct lexicon terms
+        (see ``term_presence``) is multiplied by a term x family weight matrix,
+        so terms listed in several families count in each of them.
+        
+        Args:
+            texts: List of text strings
+            
+        Returns:
+            DataFrame with one row per text and the ``LEXICON_FEATURES`` columns
+        """
+        families = self._lexicon_families()
+        family_names = list(families)
+        
+        # Distinct terms and how often each appears in every family list
+        terms = list(dict.fromkeys(term for family in families.values() for term in family))
+        weights = np.zeros((len(terms), len(family_names)))
+        term_index = {term: i for i, term in enumerate(terms)}
+        for j, family in enumerate(family_names):
+            for term in families[family]:
+                weights[term_index[term], j] += 1
+        
+        lower = [str(text).lower() for text in texts]
+        n_texts = len(lower)
+        split_words = [text.split() for text in lower]
+        
+        # Text x term presence, folded into family counts through the weight matrix
+        presence = self.term_presence(lower, terms, tokens=split_words)
+        counts = np.asarray(presence @ weights).reshape(n_texts, len(family_names))
+        counts = dict(zip(family_names, counts.T))
+        
+        # Word counts, word lengths and sentence counts for complexity
+        word_count = np.fromiter((len(words) for words in split_words), dtype=float, count=n_texts)
+        char_count = np.fromiter((len(''.join(words)) for words in split_words), dtype=float, count=n_texts)
+        sentence_count = np.fromiter(
+            (len(self._SENTENCE_BOUNDARY.findall(text)) + 1 for text in lower), dtype=float, count=n_texts
+        )
+        has_words = word_count > 0
+        safe_count = np.where(has_words, word_count, 1.0)
+        complexity = char_count / safe_count / 10.0 + word_count / sentence_count / 20.0
+        
+        features = {
+            'hedging_score': counts['hedging'] / safe_count,
+            'uncertainty_score': counts['uncertainty'] / safe_count,
+            'formality_score': (counts['formal'] - counts['informal']) / safe_count,
+            'complexity_score': np.minimum(complexity, 1.0),
+            'risk_escalation_score': (counts['deteriorating'] - counts['mitigation']) / safe_count,
+            'stress_score': counts['stress'] / safe_count,
+            'confidence_score': counts['confidence'] / safe_count
+        }
+        return pd.DataFrame({
+            name: np.where(has_words, values, 0.0) for name, values in features.items()
+        })
+    
+    def _merge_lexicon_features(self, results: List[Dict], features: pd.DataFrame) -> List[Dict]:
+        """Append lexicon features to model results, keeping defaults of failed batches"""
+        columns = [features[name].tolist() for name in self.LEXICON_FEATURES]
+        for result, values in zip(results, zip(*columns)):
+            for name, value in zip(self.LEXICON_FEATURES, values):
+                result.setdefault(name, value)
+        return results
+    
     def _analyze_tone(self, text: str) -> Dict:
         """Analyze tone-related features"""
         text_lower = text.lower()
@@ -191,12 +751,12 @@ class FinBERTAnalyzer:
         risk_escalation_score = (deteriorating_count - mitigation_count) / len(text_lower.split()) if text_lower.split() else 0
         
         # Financial stress indicators
-        stress_indicators = ['stress', 'pressure', 'concern', 'worry', 'issue', 'problem', 'challenge']
+        stress_indicators = self.STRESS_INDICATORS
         stress_count = sum(1 for indicator in stress_indicators if indicator in text_lower)
         stress_score = stress_count / len(text_lower.split()) if text_lower.split() else 0
         
         # Confidence indicators
-        confidence_indicators = ['confident', 'strong', 'solid', 'robust', 'healthy', 'optimistic']
+        confidence_indicators = self.CONFIDENCE_INDICATORS
         confidence_count = sum(1 for indicator in confidence_indicators if indicator in text_lower)
         confidence_score = confidence_count / len(text_lower.split()) if text_lower.split() else 0
         
@@ -237,6 +797,9 @@ class FinBERTAnalyzer:
         """
         Add sentiment analysis to a DataFrame
         
+        On CPU, inputs of at least ``sharding_threshold`` texts are scored
+        by sharded worker processes (see ``analyze_sentiment_sharded``).
+        
         Args:
             df: Input DataFrame
             text_column: Name of the column containing text
@@ -251,7 +814,7 @@ class FinBERTAnalyzer:
         texts = df[text_column].fillna('').astype(str).tolist()
         
         # Analyze sentiment
-        sentiment_results = self.analyze_sentiment(texts)
+        sentiment_results = self._analyze_texts(texts)
         
         # Add results to DataFrame
         df_copy = df.copy()
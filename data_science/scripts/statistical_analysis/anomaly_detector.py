@@ -11,21 +11,43 @@ from sklearn.cluster import DBSCAN
 from sklearn.preprocessing import StandardScaler, RobustScaler
 from sklearn.decomposition import PCA
 from sklearn.covariance import EllipticEnvelope
+from sklearn.neighbors import NearestNeighbors
+from sklearn.base import clone
+from scipy.spatial import cKDTree
+from joblib import Parallel, delayed
+import joblib
 import warnings
 from typing import Dict, List, Tuple, Optional, Any, Union
 from pathlib import Path
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 import yaml
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore')
 
+
+def _fit_detector(name: str, estimator: Any, X: np.ndarray) -> Tuple[str, Any, Optional[str]]:
+    """Fit one ensemble detector (runs in a worker process)"""
+    try:
+        return name, estimator.fit(X), None
+    except Exception as e:
+        return name, None, str(e)
+
+
 class AnomalyDetector:
     """
     Advanced multi-method anomaly detection for financial risk monitoring
     """
     
+    # Numerical features used for anomaly detection
+    FEATURE_COLUMNS = [
+        'sentiment_positive', 'sentiment_negative', 'sentiment_neutral',
+        'sentiment_confidence', 'risk_escalation_score', 'stress_score',
+        'confidence_score', 'hedging_score', 'uncertainty_score',
+        'formality_score', 'complexity_score'
+    ]
+    
     def __init__(self, config_path: Optional[str] = None):
         self.config = self._load_config(config_path)
         
@@ -44,11 +66,21 @@ class AnomalyDetector:
             'dbscan': 0.15
         })
         
+        # Fitted-ensemble persistence and refit schedule
+        anomaly_config = self.config.get('anomaly_detection', {})
+        self.n_jobs = anomaly_config.get('n_jobs', -1)
+        self.refit_interval_days = anomaly_config.get('refit_interval_days', 90)
+        self.models_path = Path(anomaly_config.get('models_path', "models/anomaly_detector.joblib"))
+        if not self.models_path.is_absolute():
+            self.models_path = Path(__file__).parent.parent.parent / self.models_path
+        self.fitted_ensemble = None
+        
         # Initialize models
         self.isolation_forest = IsolationForest(
             contamination=self.contamination,
             random_state=42,
-            n_estimators=100
+            n_estimators=100,
+            n_jobs=self.n_jobs
         )
         
         self.elliptic_envelope = EllipticEnvelope(
@@ -56,7 +88,15 @@ class AnomalyDetector:
             random_state=42
         )
         
-        self.dbscan = DBSCAN(eps=0.5, min_samples=5)
+        # DBSCAN neighbour index and sample-then-assign threshold for large inputs
+        dbscan_config = anomaly_config.get('dbscan', {})
+        self.dbscan_max_samples = dbscan_config.get('max_samples', 50000)
+        self.dbscan = DBSCAN(
+            eps=dbscan_config.get('eps', 0.5),
+            min_samples=dbscan_config.get('min_samples', 5),
+            algorithm=dbscan_config.get('algorithm', 'ball_tree'),
+            n_jobs=self.n_jobs
+        )
         
         # Scalers
         self.standard_scaler = StandardScaler()
@@ -84,6 +124,15 @@ class AnomalyDetector:
                 'z_threshold': 2.5,
                 'iqr_multiplier': 1.5,
                 'ensemble_threshold': 0.6,
+                'n_jobs': -1,
+                'refit_interval_days': 90,
+                'models_path': "models/anomaly_detector.joblib",
+                'dbscan': {
+                    'eps': 0.5,
+                    'min_samples': 5,
+                    'algorithm': 'ball_tree',
+                    'max_samples': 50000
+                },
                 'method_weights': {
                     'isolation_forest': 0.25,
                     'elliptic_envelope': 0.25,
@@ -94,26 +143,24 @@ class AnomalyDetector:
             }
         }
     
-    def prepare_features(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
+    def _available_features(self, df: pd.DataFrame) -> List[str]:
+        """Detection features present in a DataFrame"""
+        return [col for col in self.FEATURE_COLUMNS if col in df.columns]
+    
+    def prepare_features(self, df: pd.DataFrame,
+                         fill_values: Optional[pd.Series] = None) -> Tuple[pd.DataFrame, List[str]]:
         """
         Prepare features for anomaly detection
         
         Args:
             df: Input DataFrame with NLP analysis results
+            fill_values: Values for missing features (defaults to the medians of ``df``)
             
         Returns:
             Tuple of (feature_df, feature_names)
         """
-        # Select numerical features for anomaly detection
-        feature_columns = [
-            'sentiment_positive', 'sentiment_negative', 'sentiment_neutral',
-            'sentiment_confidence', 'risk_escalation_score', 'stress_score',
-            'confidence_score', 'hedging_score', 'uncertainty_score',
-            'formality_score', 'complexity_score'
-        ]
-        
         # Filter to existing columns
-        available_features = [col for col in feature_columns if col in df.columns]
+        available_features = self._available_features(df)
         
         if not available_features:
             raise ValueError("No suitable features found for anomaly detection")
@@ -122,7 +169,7 @@ class AnomalyDetector:
         feature_df = df[available_features].copy()
         
         # Handle missing values
-        feature_df = feature_df.fillna(feature_df.median())
+        feature_df = feature_df.fillna(feature_df.median() if fill_values is None else fill_values)
         
         # Add derived features
         if 'sentiment_positive' in feature_df.columns and 'sentiment_negative' in feature_df.columns:
@@ -281,28 +328,22 @@ class AnomalyDetector:
             Tuple of (anomaly_labels, anomaly_scores)
         """
         try:
-            # Fit DBSCAN
-            cluster_labels = self.dbscan.fit_predict(X)
+            # Fit DBSCAN (on a sample for large inputs)
+            if self.dbscan_max_samples and len(X) > self.dbscan_max_samples:
+                cluster_labels = self._dbscan_sample_and_assign(X)
+            else:
+                cluster_labels = self.dbscan.fit_predict(X)
             
             # Points with label -1 are considered anomalies
-            anomaly_binary = (cluster_labels == -1).astype(int)
+            noise = cluster_labels == -1
+            anomaly_binary = noise.astype(int)
             
-            # Calculate distance to nearest cluster center as score
+            # Distance to nearest cluster center as score
             anomaly_scores = np.zeros(len(X))
+            centres = self._cluster_centres(X, cluster_labels)
             
-            # For each point, calculate distance to nearest cluster center
-            unique_clusters = np.unique(cluster_labels[cluster_labels != -1])
-            
-            if len(unique_clusters) > 0:
-                for i, point in enumerate(X):
-                    if cluster_labels[i] == -1:  # Anomaly
-                        min_distance = float('inf')
-                        for cluster_id in unique_clusters:
-                            cluster_points = X[cluster_labels == cluster_id]
-                            cluster_center = np.mean(cluster_points, axis=0)
-                            distance = np.linalg.norm(point - cluster_center)
-                            min_distance = min(min_distance, distance)
-                        anomaly_scores[i] = min_distance
+            if len(centres) > 0:
+                anomaly_scores[noise] = self._nearest_centre_distances(X[noise], centres)
                 
                 # Normalize scores
                 if anomaly_scores.max() > 0:
@@ -314,6 +355,63 @@ class AnomalyDetector:
             logging.warning(f"DBSCAN method failed: {e}")
             return np.zeros(len(X)), np.zeros(len(X))
     
+    @staticmethod
+    def _cluster_centres(X: np.ndarray, labels: np.ndarray) -> np.ndarray:
+        """Mean of each cluster (noise excluded), computed in one pass"""
+        clustered = labels != -1
+        if not clustered.any():
+            return np.empty((0, X.shape[1]))
+        _, inverse = np.unique(labels[clustered], return_inverse=True)
+        counts = np.bincount(inverse)
+        points = X[clustered]
+        return np.column_stack([
+            np.bincount(inverse, weights=points[:, j]) / counts for j in range(X.shape[1])
+        ])
+    
+    @staticmethod
+    def _nearest_centre_distances(points: np.ndarray, centres: np.ndarray) -> np.ndarray:
+        """Euclidean distance from each point to its nearest cluster centre"""
+        if len(points) == 0:
+            return np.zeros(0)
+        distances, _ = cKDTree(centres).query(points, k=1)
+        return distances
+    
+    def _dbscan_sample(self, X: np.ndarray) -> Optional[np.ndarray]:
+        """Indices of the DBSCAN fitting sample for large inputs (None to fit on all of ``X``)"""
+        if not self.dbscan_max_samples or len(X) <= self.dbscan_max_samples:
+            return None
+        rng = np.random.default_rng(42)
+        return rng.choice(len(X), self.dbscan_max_samples, replace=False)
+    
+    @staticmethod
+    def _assign_to_core_samples(model: DBSCAN, X_fit: np.ndarray, X: np.ndarray) -> np.ndarray:
+        """Label of the nearest core sample within ``eps`` for every point (noise otherwise)"""
+        labels = np.full(len(X), -1)
+        if len(model.core_sample_indices_) == 0:
+            return labels
+        
+        core_points = X_fit[model.core_sample_indices_]
+        core_labels = model.labels_[model.core_sample_indices_]
+        distances, nearest = cKDTree(core_points).query(X, k=1, distance_upper_bound=model.eps)
+        within = np.isfinite(distances)
+        labels[within] = core_labels[nearest[within]]
+        return labels
+    
+    def _dbscan_sample_and_assign(self, X: np.ndarray) -> np.ndarray:
+        """
+        Approximate DBSCAN labels for large inputs
+        
+        Fits DBSCAN on a random sample of ``dbscan_max_samples`` points, then
+        gives every point the label of its nearest sampled core point within
+        ``eps`` (noise otherwise). ``eps`` and ``min_samples`` are kept as
+        configured, so a point is core if it has ``min_samples`` sampled
+        neighbours; sparse regions of the sample turn to noise first.
+        """
+        sample_idx = self._dbscan_sample(X)
+        model = clone(self.dbscan).fit(X[sample_idx])
+        logging.info(f"DBSCAN fitted on a {self.dbscan_max_samples} point sample of {len(X)}")
+        return self._assign_to_core_samples(model, X[sample_idx], X)
+    
     def ensemble_detection(self, X: np.ndarray) -> Dict[str, np.ndarray]:
         """
         Perform ensemble anomaly detection using multiple methods
@@ -351,9 +449,14 @@ class AnomalyDetector:
         db_binary, db_scores = self.detect_dbscan(X_robust)
         methods_results['dbscan'] = {'binary': db_binary, 'scores': db_scores}
         
+        return self._combine_methods(methods_results, len(X))
+    
+    def _combine_methods(self, methods_results: Dict[str, Dict[str, np.ndarray]],
+                         n_samples: int) -> Dict[str, Dict[str, np.ndarray]]:
+        """Weighted ensemble vote over per-method results"""
         # Calculate ensemble scores
-        ensemble_scores = np.zeros(len(X))
-        ensemble_binary = np.zeros(len(X))
+        ensemble_scores = np.zeros(n_samples)
+        ensemble_binary = np.zeros(n_samples)
         
         for method, weight in self.method_weights.items():
             if method in methods_results:
@@ -371,8 +474,267 @@ class AnomalyDetector:
         
         return methods_results
     
+    def fit_ensemble(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Fit the ensemble on a baseline window for later scoring
+        
+        IsolationForest, EllipticEnvelope and DBSCAN are fitted in parallel
+        worker processes. Scalers, IQR bounds and per-method score ranges are
+        kept so new records are scored against the baseline, not their batch.
+        
+        Args:
+            df: Baseline DataFrame with NLP analysis results
+            
+        Returns:
+            Fitted ensemble state (also stored on ``self.fitted_ensemble``)
+        """
+        logging.info(f"Fitting anomaly ensemble on {len(df)} baseline records")
+        
+        fill_values = df[self._available_features(df)].median()
+        feature_df, feature_names = self.prepare_features(df, fill_values=fill_values)
+        X = feature_df.values
+        
+        standard_scaler = StandardScaler().fit(X)
+        robust_scaler = RobustScaler().fit(X)
+        X_standard = standard_scaler.transform(X)
+        X_robust = robust_scaler.transform(X)
+        
+        # DBSCAN is fitted on a sample for large baselines, as in detect_dbscan
+        dbscan_idx = self._dbscan_sample(X_robust)
+        X_dbscan = X_robust if dbscan_idx is None else X_robust[dbscan_idx]
+        
+        # Independent detectors in a process pool
+        jobs = [
+            ('isolation_forest', clone(self.isolation_forest), X),
+            ('elliptic_envelope', clone(self.elliptic_envelope), X_standard),
+            ('dbscan', clone(self.dbscan), X_dbscan)
+        ]
+        n_workers = len(jobs) if self.n_jobs in (None, -1) else max(1, min(len(jobs), self.n_jobs))
+        fitted = Parallel(n_jobs=n_workers, prefer='processes')(
+            delayed(_fit_detector)(name, estimator, data) for name, estimator, data in jobs
+        )
+        models = {}
+        for name, model, error in fitted:
+            if error:
+                logging.warning(f"{name} fit failed: {error}")
+            models[name] = model
+        
+        q1, q3 = np.percentile(X, [25, 75], axis=0)
+        ensemble = {
+            'fitted_at': datetime.now().isoformat(),
+            'n_samples': len(X),
+            'raw_features': list(fill_values.index),
+            'feature_names': feature_names,
+            'fill_values': fill_values,
+            'standard_scaler': standard_scaler,
+            'robust_scaler': robust_scaler,
+            'models': models,
+            'iqr_bounds': (q1, q3),
+            'score_ranges': {}
+        }
+        
+        if models['isolation_forest'] is not None:
+            scores = models['isolation_forest'].decision_function(X)
+            ensemble['score_ranges']['isolation_forest'] = (scores.min(), scores.max())
+        if models['elliptic_envelope'] is not None:
+            scores = models['elliptic_envelope'].mahalanobis(X_standard)
+            ensemble['score_ranges']['elliptic_envelope'] = (scores.min(), scores.max())
+        if models['dbscan'] is not None:
+            ensemble['dbscan'] = self._dbscan_reference(models['dbscan'], X_dbscan, X_robust)
+        ensemble['score_ranges']['iqr'] = (0.0, max(self._iqr_distances(X, q1, q3).max(), 0.0))
+        
+        self.fitted_ensemble = ensemble
+        return ensemble
+    
+    def _dbscan_reference(self, model: DBSCAN, X_fit: np.ndarray, X: np.ndarray) -> Dict[str, Any]:
+        """Core samples, cluster centres and noise-score range of a DBSCAN fitted on ``X_fit`` (a sample of ``X``)"""
+        labels = model.labels_ if X_fit is X else self._assign_to_core_samples(model, X_fit, X)
+        core_samples = X_fit[model.core_sample_indices_]
+        reference = {
+            'eps': model.eps,
+            'core_labels': labels[model.core_sample_indices_],
+            'core_index': NearestNeighbors(n_neighbors=1).fit(core_samples) if len(core_samples) else None,
+            'centres': self._cluster_centres(X, labels),
+            'max_noise_score': 0.0
+        }
+        noise = labels == -1
+        if noise.any() and len(reference['centres']):
+            reference['max_noise_score'] = self._nearest_centre_distances(X[noise], reference['centres']).max()
+        return reference
+    
+    def _iqr_distances(self, X: np.ndarray, q1: np.ndarray, q3: np.ndarray) -> np.ndarray:
+        """Largest IQR-normalised distance outside the bounds, per sample"""
+        iqr = q3 - q1
+        lower_bound = q1 - self.iqr_multiplier * iqr
+        upper_bound = q3 + self.iqr_multiplier * iqr
+        distances = np.maximum(np.maximum(lower_bound - X, 0), np.maximum(X - upper_bound, 0))
+        return (distances / (iqr + 0.001)).max(axis=1)
+    
+    @staticmethod
+    def _scale_to_range(scores: np.ndarray, score_range: Tuple[float, float]) -> np.ndarray:
+        """Normalise scores with a baseline (min, max) range, clipped to [0, 1]"""
+        low, high = score_range
+        if high <= low:
+            return np.zeros(len(scores))
+        return np.clip((scores - low) / (high - low), 0, 1)
+    
+    def score_ensemble(self, X: np.ndarray) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Score records with the fitted ensemble (no refitting)
+        
+        Args:
+            X: Feature matrix prepared with the baseline fill values
+            
+        Returns:
+            Dictionary with results from all methods and ensemble
+        """
+        if self.fitted_ensemble is None:
+            raise ValueError("Anomaly ensemble is not fitted; call fit_ensemble or load_models first")
+        
+        ensemble = self.fitted_ensemble
+        models = ensemble['models']
+        ranges = ensemble['score_ranges']
+        X_standard = ensemble['standard_scaler'].transform(X)
+        X_robust = ensemble['robust_scaler'].transform(X)
+        zeros = np.zeros(len(X))
+        methods_results = {}
+        
+        if models['isolation_forest'] is not None:
+            methods_results['isolation_forest'] = {
+                'binary': (models['isolation_forest'].predict(X) == -1).astype(int),
+                'scores': self._scale_to_range(
+                    models['isolation_forest'].decision_function(X), ranges['isolation_forest']
+                )
+            }
+        else:
+            methods_results['isolation_forest'] = {'binary': zeros, 'scores': zeros}
+        
+        if models['elliptic_envelope'] is not None:
+            methods_results['elliptic_envelope'] = {
+                'binary': (models['elliptic_envelope'].predict(X_standard) == -1).astype(int),
+                'scores': self._scale_to_range(
+                    models['elliptic_envelope'].mahalanobis(X_standard), ranges['elliptic_envelope']
+                )
+            }
+        else:
+            methods_results['elliptic_envelope'] = {'binary': zeros, 'scores': zeros}
+        
+        # Z-scores against the baseline mean and standard deviation
+        max_z_scores = np.abs(X_standard).max(axis=1)
+        methods_results['z_score'] = {
+            'binary': (max_z_scores > self.z_threshold).astype(int),
+            'scores': np.clip(max_z_scores / (self.z_threshold * 2), 0, 1)
+        }
+        
+        q1, q3 = ensemble['iqr_bounds']
+        iqr_distances = self._iqr_distances(X, q1, q3)
+        methods_results['iqr'] = {
+            'binary': (iqr_distances > 0).astype(int),
+            'scores': self._scale_to_range(iqr_distances, ranges['iqr'])
+        }
+        
+        methods_results['dbscan'] = self._score_dbscan(X_robust, ensemble.get('dbscan'))
+        
+        return self._combine_methods(methods_results, len(X))
+    
+    def _score_dbscan(self, X: np.ndarray, reference: Optional[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Noise labels and scores for new points against fitted DBSCAN core samples"""
+        if reference is None or reference['core_index'] is None:
+            return {'binary': np.ones(len(X), dtype=int) if reference else np.zeros(len(X)),
+                    'scores': np.zeros(len(X))}
+        
+        # A point joins a cluster if it lies within eps of a core sample
+        distances, _ = reference['core_index'].kneighbors(X)
+        noise = distances[:, 0] > reference['eps']
+        
+        scores = np.zeros(len(X))
+        if noise.any() and len(reference['centres']):
+            scores[noise] = self._nearest_centre_distances(X[noise], reference['centres'])
+            scores = self._scale_to_range(scores, (0.0, reference['max_noise_score']))
+        
+        return {'binary': noise.astype(int), 'scores': scores}
+    
+    def needs_refit(self, df: Optional[pd.DataFrame] = None, now: Optional[datetime] = None) -> bool:
+        """
+        Whether the fitted ensemble is due for a refit
+        
+        Refit when no ensemble is fitted, when it is older than
+        ``refit_interval_days`` or when ``df`` has a different feature set.
+        """
+        if self.fitted_ensemble is None:
+            return True
+        
+        age = (now or datetime.now()) - datetime.fromisoformat(self.fitted_ensemble['fitted_at'])
+        if age > timedelta(days=self.refit_interval_days):
+            logging.info(f"Anomaly ensemble is {age.days} days old; refit due")
+            return True
+        
+        if df is not None and self._available_features(df) != self.fitted_ensemble['raw_features']:
+            logging.info("Feature set changed since the anomaly ensemble was fitted; refit due")
+            return True
+        
+        return False
+    
+    def save_models(self, path: Optional[Union[str, Path]] = None):
+        """Persist the fitted ensemble with joblib"""
+        if self.fitted_ensemble is None:
+            raise ValueError("Anomaly ensemble is not fitted")
+        path = Path(path or self.models_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(self.fitted_ensemble, path)
+        logging.info(f"Anomaly ensemble saved to {path}")
+    
+    def load_models(self, path: Optional[Union[str, Path]] = None) -> bool:
+        """Load a persisted ensemble; returns False if none exists"""
+        path = Path(path or self.models_path)
+        if not path.exists():
+            return False
+        self.fitted_ensemble = joblib.load(path)
+        logging.info(f"Anomaly ensemble loaded from {path} (fitted {self.fitted_ensemble['fitted_at']})")
+        return True
+    
+    def score_anomalies(self, df: pd.DataFrame,
+                        baseline_df: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Score records against the persisted ensemble, refitting only when due
+        
+        A (re)fit needs a historical ``baseline_df``: an ensemble fitted on the
+        batch being scored would judge later batches against it. Without a
+        baseline the batch is scored with in-batch ``detect_anomalies`` and
+        nothing is persisted.
+        
+        Args:
+            df: Records to score
+            baseline_df: Historical window used if a (re)fit is due
+            
+        Returns:
+            Tuple of (results_df, anomaly_report)
+        """
+        if self.fitted_ensemble is None:
+            self.load_models()
+        
+        if self.needs_refit(df):
+            if baseline_df is None or baseline_df.empty:
+                logging.warning("Anomaly ensemble refit due but no baseline window given; "
+                                "scoring the batch in-sample without persisting a model")
+                return self.detect_anomalies(df)
+            self.fit_ensemble(baseline_df)
+            self.save_models()
+        
+        logging.info(f"Scoring {len(df)} records against the fitted anomaly ensemble")
+        feature_df, feature_names = self.prepare_features(df, fill_values=self.fitted_ensemble['fill_values'])
+        X = feature_df.values
+        
+        anomaly_results = self.score_ensemble(X)
+        z_scores = np.abs(self.fitted_ensemble['standard_scaler'].transform(X))
+        results_df = self.analyze_anomalies(df, feature_names, anomaly_results, z_scores=z_scores)
+        report = self.generate_anomaly_report(results_df)
+        
+        return results_df, report
+    
     def analyze_anomalies(self, df: pd.DataFrame, feature_names: List[str], 
-                         anomaly_results: Dict[str, np.ndarray]) -> pd.DataFrame:
+                         anomaly_results: Dict[str, np.ndarray],
+                         z_scores: Optional[np.ndarray] = None) -> pd.DataFrame:
         """
         Analyze detected anomalies and add contextual information
         
@@ -380,6 +742,7 @@ class AnomalyDetector:
             df: Original DataFrame
             feature_names: List of feature names
             anomaly_results: Results from ensemble detection
+            z_scores: Absolute feature z-scores (defaults to z-scores within ``df``)
             
         Returns:
             DataFrame with anomaly analysis
@@ -408,12 +771,10 @@ class AnomalyDetector:
         anomaly_mask = results_df['is_anomaly'] == 1
         
         if anomaly_mask.any():
-            # Calculate feature contributions to anomaly
-            feature_df, _ = self.prepare_features(df)
-            X = feature_df.values
-            
             # Z-scores for feature contribution analysis
-            z_scores = np.abs(stats.zscore(X, axis=0))
+            if z_scores is None:
+                feature_df, _ = self.prepare_features(df)
+                z_scores = np.abs(stats.zscore(feature_df.values, axis=0))
             
             # For each anomaly, find the most contributing features
             anomaly_features = []
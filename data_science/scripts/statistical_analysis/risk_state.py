@@ -0,0 +1,319 @@
+"""
+Persistent running statistics for incremental risk scoring
+Keeps per-institution Welford statistics, per-quarter aggregates and a
+mergeable quantile sketch so new quarters can be scored in O(new rows)
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+from pathlib import Path
+import json
+import logging
+
+
+class RunningStats:
+    """
+    Mergeable Welford mean/variance accumulator (missing values skipped)
+    """
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def update(self, values: Iterable[float]):
+        """Add a batch of values using Chan's parallel update"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        batch_mean = float(values.mean())
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        self.merge(RunningStats(len(values), batch_mean, batch_m2))
+
+    def merge(self, other: 'RunningStats'):
+        """Merge another accumulator into this one"""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.count = total
+
+    def variance(self, ddof: int = 1) -> float:
+        """Variance with the given delta degrees of freedom (NaN if undefined)"""
+        if self.count - ddof <= 0:
+            return float('nan')
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 1) -> float:
+        """Standard deviation with the given delta degrees of freedom"""
+        return float(np.sqrt(self.variance(ddof)))
+
+    def to_dict(self) -> Dict[str, float]:
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, float]) -> 'RunningStats':
+        return cls(int(data['count']), float(data['mean']), float(data['m2']))
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL quantile sketch
+
+    Items are kept in levels of compactors; level ``h`` items each stand for
+    ``2**h`` inputs. Rank error is roughly proportional to ``1 / k``.
+    """
+
+    def __init__(self, k: int = 400, seed: int = 0):
+        self.k = k
+        self.count = 0
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self):
+        """Compact every level that is over capacity into the level above"""
+        level = 0
+        while level < len(self.levels):
+            if len(self.levels[level]) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(self.levels[level])
+
+                # An odd item out stays at this level
+                if len(items) % 2:
+                    self.levels[level], items = items[-1:], items[:-1]
+                else:
+                    self.levels[level] = np.empty(0)
+
+                offset = int(self._rng.integers(2))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], items[offset::2]])
+            level += 1
+
+    def update(self, values: Iterable[float]):
+        """Add a batch of values (missing values skipped)"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compress()
+
+    def merge(self, other: 'QuantileSketch'):
+        """Merge another sketch into this one"""
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def rank(self, values: Iterable[float]) -> np.ndarray:
+        """Approximate fraction of sketched values less than or equal to each value"""
+        values = np.asarray(values, dtype=float)
+        weight = sum(len(items) * 2 ** level for level, items in enumerate(self.levels))
+        if weight == 0:
+            return np.full(values.shape, np.nan)
+
+        below = np.zeros(values.shape)
+        for level, items in enumerate(self.levels):
+            below += np.searchsorted(np.sort(items), values, side='right') * 2 ** level
+        return np.where(np.isnan(values), np.nan, below / weight)
+
+    def quantile(self, q: Iterable[float]) -> np.ndarray:
+        """Approximate quantiles for probabilities ``q``"""
+        q = np.asarray(q, dtype=float)
+        items = np.concatenate(self.levels)
+        if len(items) == 0:
+            return np.full(q.shape, np.nan)
+        weights = np.concatenate([np.full(len(l), 2.0 ** h) for h, l in enumerate(self.levels)])
+        order = np.argsort(items)
+        cumulative = np.cumsum(weights[order]) / weights.sum()
+        positions = np.minimum(np.searchsorted(cumulative, q, side='left'), len(items) - 1)
+        return items[order][positions]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'k': self.k, 'count': self.count, 'levels': [items.tolist() for items in self.levels]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'QuantileSketch':
+        sketch = cls(k=int(data['k']))
+        sketch.count = int(data['count'])
+        sketch.levels = [np.asarray(items, dtype=float) for items in data['levels']] or [np.empty(0)]
+        return sketch
+
+
+class RiskScoringState:
+    """
+    Running statistics behind the history-dependent risk components
+
+    Per institution: row count, Welford statistics of the tracked metrics and
+    per-quarter metric counts and sums. Globally: all quarters seen, Welford
+    statistics of the statistical anomaly columns and a sketch of risk scores.
+
+    Statistics are kept per ingested (bank, quarter) partition and merged into
+    the aggregates above, so re-ingesting a quarter replaces its earlier
+    contribution instead of counting it twice.
+    """
+
+    # Metrics used by temporal and volatility risk
+    TRACKED_METRICS = ['sentiment_negative', 'risk_escalation_score', 'stress_score']
+
+    def __init__(self, sketch_k: int = 400):
+        self.sketch_k = sketch_k
+        self.partitions: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+        self.institutions: Dict[str, Dict[str, Any]] = {}
+        self.quarters: set = set()
+        self.columns: Dict[str, RunningStats] = {}
+        self.score_sketch = QuantileSketch(k=sketch_k)
+
+    @staticmethod
+    def _partition_groups(df: pd.DataFrame):
+        """Yield ((bank, quarter), rows) for every partition in a batch (missing keys as None)"""
+        keys = [
+            df[column].astype(str).where(df[column].notna()) if column in df.columns
+            else pd.Series(np.nan, index=df.index)
+            for column in ['bank', 'quarter']
+        ]
+        for key, group in df.groupby(keys, sort=False, dropna=False):
+            yield tuple(None if pd.isna(k) else k for k in key), group
+
+    def update(self, df: pd.DataFrame, anomaly_columns: Optional[List[str]] = None):
+        """
+        Fold a batch of new rows into the running statistics
+
+        Each (bank, quarter) in the batch replaces any earlier batch for the
+        same key, so re-running a quarter is idempotent.
+
+        Args:
+            df: New rows
+            anomaly_columns: Numeric columns used for statistical anomaly z-scores
+        """
+        metrics = [m for m in self.TRACKED_METRICS if m in df.columns]
+
+        for key, group in self._partition_groups(df):
+            if key in self.partitions:
+                logging.info(f"Replacing running statistics for bank={key[0]}, quarter={key[1]}")
+            self.partitions[key] = {
+                'rows': len(group),
+                'metrics': {m: self._stats(group[m]) for m in metrics},
+                'quarter_totals': {m: (int(group[m].count()), float(group[m].sum())) for m in metrics},
+                'columns': {c: self._stats(group[c]) for c in anomaly_columns or []},
+                'score_sketch': QuantileSketch(k=self.sketch_k)
+            }
+
+        self._rebuild()
+
+    def update_scores(self, df: pd.DataFrame, scores: Iterable[float]):
+        """
+        Record risk scores for rows of the last ``update`` batch
+
+        Args:
+            df: Rows the scores belong to (same bank/quarter columns as in ``update``)
+            scores: Risk score per row
+        """
+        scores = pd.Series(np.asarray(scores, dtype=float), index=df.index)
+        for key, group in self._partition_groups(df):
+            partition = self.partitions.get(key)
+            if partition is not None:
+                partition['score_sketch'].update(scores.loc[group.index].to_numpy())
+
+        self.score_sketch = QuantileSketch(k=self.sketch_k)
+        for partition in self.partitions.values():
+            self.score_sketch.merge(partition['score_sketch'])
+
+    @staticmethod
+    def _stats(values: pd.Series) -> RunningStats:
+        stats = RunningStats()
+        stats.update(values.to_numpy(dtype=float))
+        return stats
+
+    def _rebuild(self):
+        """Merge the partitions into the per-institution and global aggregates"""
+        self.institutions, self.quarters, self.columns = {}, set(), {}
+        self.score_sketch = QuantileSketch(k=self.sketch_k)
+
+        for (bank, quarter), partition in self.partitions.items():
+            if quarter is not None:
+                self.quarters.add(quarter)
+            for column, stats in partition['columns'].items():
+                self.columns.setdefault(column, RunningStats()).merge(stats)
+            self.score_sketch.merge(partition['score_sketch'])
+
+            if bank is None:
+                continue
+            institution = self.institutions.setdefault(bank, {
+                'rows': 0,
+                'metrics': {metric: RunningStats() for metric in self.TRACKED_METRICS},
+                'quarters': {}
+            })
+            institution['rows'] += partition['rows']
+            for metric, stats in partition['metrics'].items():
+                institution['metrics'][metric].merge(stats)
+            if quarter is not None and partition['quarter_totals']:
+                institution['quarters'][quarter] = dict(partition['quarter_totals'])
+
+    def institution_rows(self, bank: Any) -> int:
+        """Rows seen for an institution"""
+        institution = self.institutions.get(str(bank))
+        return institution['rows'] if institution else 0
+
+    def institution_stats(self, bank: Any, metric: str) -> RunningStats:
+        """Running statistics of a metric for an institution"""
+        institution = self.institutions.get(str(bank))
+        return institution['metrics'][metric] if institution else RunningStats()
+
+    def quarter_mean(self, bank: Any, quarter: Any, metric: str) -> float:
+        """Mean of a metric for an institution's quarter (NaN if unseen)"""
+        institution = self.institutions.get(str(bank))
+        if not institution:
+            return float('nan')
+        count, total = institution['quarters'].get(str(quarter), {}).get(metric, (0, 0.0))
+        return total / count if count else float('nan')
+
+    def save(self, path: Path):
+        """Persist the state as JSON"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'sketch_k': self.sketch_k,
+            'partitions': [
+                {
+                    'bank': bank,
+                    'quarter': quarter,
+                    'rows': partition['rows'],
+                    'metrics': {m: s.to_dict() for m, s in partition['metrics'].items()},
+                    'quarter_totals': {m: list(v) for m, v in partition['quarter_totals'].items()},
+                    'columns': {c: s.to_dict() for c, s in partition['columns'].items()},
+                    'score_sketch': partition['score_sketch'].to_dict()
+                }
+                for (bank, quarter), partition in self.partitions.items()
+            ]
+        }
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        logging.info(f"Risk scoring state saved to {path}")
+
+    @classmethod
+    def load(cls, path: Path) -> 'RiskScoringState':
+        """Load a persisted state"""
+        with open(path, 'r') as f:
+            data = json.load(f)
+
+        state = cls(sketch_k=int(data.get('sketch_k', 400)))
+        for partition in data['partitions']:
+            state.partitions[(partition['bank'], partition['quarter'])] = {
+                'rows': int(partition['rows']),
+                'metrics': {m: RunningStats.from_dict(s) for m, s in partition['metrics'].items()},
+                'quarter_totals': {m: tuple(v) for m, v in partition['quarter_totals'].items()},
+                'columns': {c: RunningStats.from_dict(s) for c, s in partition['columns'].items()},
+                'score_sketch': QuantileSketch.from_dict(partition['score_sketch'])
+            }
+        state._rebuild()
+        return state
@@ -24,6 +24,13 @@ class TimeSeriesAnalyzer:
     Advanced time series analyzer for financial risk monitoring
     """
     
+    # Key metrics analysed per institution
+    KEY_METRICS = [
+        'sentiment_negative_mean', 'sentiment_positive_mean',
+        'risk_escalation_score_mean', 'stress_score_mean', 'confidence_score_mean',
+        'hedging_score_mean', 'uncertainty_score_mean'
+    ]
+    
     def __init__(self, config_path: Optional[str] = None):
         self.config = self._load_config(config_path)
         
@@ -480,11 +487,7 @@ class TimeSeriesAnalyzer:
             Complete analysis results
         """
         # Define key metrics to analyze
-        key_metrics = [
-            'sentiment_negative_mean', 'sentiment_positive_mean',
-            'risk_escalation_score_mean', 'stress_score_mean', 'confidence_score_mean',
-            'hedging_score_mean', 'uncertainty_score_mean'
-        ]
+        key_metrics = self.KEY_METRICS
         
         # Perform all analyses
         trend_results = self.detect_trends(ts_data, institution, key_metrics)
@@ -503,6 +506,179 @@ class TimeSeriesAnalyzer:
             'correlations': correlations,
             'risk_signals': risk_signals
         }
+    
+    def build_panel(self, ts_data: pd.DataFrame, metrics: List[str],
+                    institution_col: str = 'bank') -> Tuple[pd.Index, pd.DatetimeIndex, np.ndarray, np.ndarray]:
+        """
+        Pivot time series data into an (institution x quarter x metric) array
+        
+        Args:
+            ts_data: Output of ``prepare_time_series_data``
+            metrics: Metric columns to include
+            institution_col: Column name for institution
+            
+        Returns:
+            Tuple of (institutions, quarter dates, values array, row-present mask);
+            missing metrics and quarters are NaN
+        """
+        wide = ts_data.pivot(index=institution_col, columns='quarter_date', values=metrics)
+        institutions = wide.index
+        dates = wide.columns.get_level_values('quarter_date').unique().sort_values()
+        wide = wide.reindex(columns=pd.MultiIndex.from_product([metrics, dates]))
+        
+        values = wide.to_numpy(dtype=float).reshape(len(institutions), len(metrics), len(dates))
+        values = values.transpose(0, 2, 1)
+        
+        present = ts_data.assign(_present=True).pivot(
+            index=institution_col, columns='quarter_date', values='_present'
+        ).reindex(index=institutions, columns=dates).notna().to_numpy()
+        
+        return institutions, dates, values, present
+    
+    def analyze_panel(self, ts_data: pd.DataFrame, metrics: Optional[List[str]] = None,
+                      institution_col: str = 'bank') -> pd.DataFrame:
+        """
+        Trend, seasonality and anomaly statistics for every institution at once
+        
+        Pivots ``ts_data`` once and computes the per-institution results of
+        ``detect_trends``, ``detect_seasonality`` and ``detect_anomalies`` with
+        closed-form array operations. As in those methods, each metric's trend
+        is fitted against its observed periods in order, and statistics that
+        lack ``min_periods`` (trend, anomalies) or ``max(seasonality_periods)``
+        (seasonality) observations are NaN.
+        
+        Args:
+            ts_data: Output of ``prepare_time_series_data``
+            metrics: Metric columns to analyze (defaults to ``KEY_METRICS``)
+            institution_col: Column name for institution
+            
+        Returns:
+            DataFrame with one row per (institution, metric)
+        """
+        metrics = [m for m in (metrics or self.KEY_METRICS) if m in ts_data.columns]
+        if not metrics or ts_data.empty:
+            return pd.DataFrame()
+        
+        institutions, dates, y, present = self.build_panel(ts_data, metrics, institution_col)
+        n_inst, n_dates, n_metrics = y.shape
+        valid = ~np.isnan(y)
+        n = valid.sum(axis=1)
+        rows = np.broadcast_to(present.sum(axis=1)[:, None], n.shape)
+        y0 = np.where(valid, y, 0.0)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Summary statistics (pandas conventions: std with ddof=1)
+            mean = y0.sum(axis=1) / n
+            dev = np.where(valid, y - mean[:, None, :], 0.0)
+            ss = (dev ** 2).sum(axis=1)
+            std = np.sqrt(ss / (n - 1))
+            y_min = np.where(valid, y, np.inf).min(axis=1)
+            y_max = np.where(valid, y, -np.inf).max(axis=1)
+            
+            # Trend: least squares against the position among observed periods
+            x = np.cumsum(valid, axis=1) - 1.0
+            x_mean = np.where(valid, x, 0.0).sum(axis=1) / n
+            x_dev = np.where(valid, x - x_mean[:, None, :], 0.0)
+            sxx = (x_dev ** 2).sum(axis=1)
+            sxy = (x_dev * dev).sum(axis=1)
+            slope = sxy / sxx
+            intercept = mean - slope * x_mean
+            r = np.where((sxx > 0) & (ss > 0), sxy / np.sqrt(sxx * ss), 0.0)
+            r = np.clip(r, -1.0, 1.0)
+            dof = n - 2
+            t_stat = r * np.sqrt(dof / ((1.0 - r) * (1.0 + r)))
+            trend_p = 2 * stats.t.sf(np.abs(t_stat), dof)
+            
+            # Current and previous observed values
+            last = np.where(valid & (x == (n - 1)[:, None, :]), y, 0.0).sum(axis=1)
+            previous = np.where(valid & (x == (n - 2)[:, None, :]), y, 0.0).sum(axis=1)
+            recent_change = np.where((n >= 2) & (previous != 0), (last - previous) / np.abs(previous), 0.0)
+            
+            # Seasonality: one-way ANOVA across calendar quarters
+            quarter_of = dates.quarter.to_numpy()
+            group_n = np.stack([valid[:, quarter_of == q].sum(axis=1) for q in range(1, 5)], axis=-1)
+            group_sum = np.stack([y0[:, quarter_of == q].sum(axis=1) for q in range(1, 5)], axis=-1)
+            group_mean = group_sum / group_n
+            n_groups = (group_n > 0).sum(axis=-1)
+            between = np.nansum(group_n * (group_mean - mean[..., None]) ** 2, axis=-1)
+            within_dev = np.where(valid, y - np.moveaxis(group_mean[:, :, quarter_of - 1], -1, 1), 0.0)
+            within = (within_dev ** 2).sum(axis=1)
+            f_stat = (between / (n_groups - 1)) / (within / (n - n_groups))
+            
+            # Constant quarter groups: undefined if all equal, infinite otherwise (as scipy)
+            group_range = np.stack([
+                np.nanmax(np.where(valid, y, -np.inf)[:, quarter_of == q], axis=1, initial=-np.inf)
+                - np.nanmin(np.where(valid, y, np.inf)[:, quarter_of == q], axis=1, initial=np.inf)
+                for q in range(1, 5)
+            ], axis=-1)
+            constant_groups = np.all((group_n == 0) | (group_range == 0), axis=-1)
+            f_stat = np.where(constant_groups, np.where(y_max == y_min, np.nan, np.inf), f_stat)
+            seasonal_p = stats.f.sf(f_stat, n_groups - 1, n - n_groups)
+            seasonal_amplitude = np.nanmax(group_mean, axis=-1) - np.nanmin(group_mean, axis=-1)
+            masked_means = np.where(group_n > 0, group_mean, np.nan)
+            peak = np.nanargmax(np.where(n_groups[..., None] > 0, masked_means, 0.0), axis=-1)
+            trough = np.nanargmin(np.where(n_groups[..., None] > 0, masked_means, 0.0), axis=-1)
+            
+            # Anomalies: population z-scores and IQR fences
+            z_scores = np.abs(y - mean[:, None, :]) / np.sqrt(ss / n)[:, None, :]
+            q1 = np.nanpercentile(y, 25, axis=1)
+            q3 = np.nanpercentile(y, 75, axis=1)
+            iqr = q3 - q1
+            lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+            is_anomaly = valid & (
+                (z_scores > self.anomaly_threshold) | (y < lower[:, None, :]) | (y > upper[:, None, :])
+            )
+            total_anomalies = is_anomaly.sum(axis=1)
+            latest_anomaly = np.where(
+                is_anomaly.any(axis=1), n_dates - 1 - np.argmax(is_anomaly[:, ::-1, :], axis=1), -1
+            )
+        
+        has_trend = (rows >= self.min_periods) & (n >= self.min_periods)
+        seasonal_min = max(self.seasonality_periods)
+        has_seasonality = (rows >= seasonal_min) & (n >= seasonal_min) & (n_groups >= 2)
+        quarter_labels = np.array(['Q1', 'Q2', 'Q3', 'Q4'], dtype=object)
+        
+        def column(values, mask=has_trend, fill=np.nan):
+            return np.where(mask, values, fill).ravel()
+        
+        results = pd.DataFrame({
+            institution_col: np.repeat(institutions.to_numpy(), n_metrics),
+            'metric': np.tile(metrics, n_inst),
+            'periods_analyzed': n.ravel(),
+            'slope': column(slope),
+            'intercept': column(intercept),
+            'r_squared': column(r ** 2),
+            'p_value': column(trend_p),
+            'trend_direction': column(
+                np.select([slope > 0, slope < 0], ['increasing', 'decreasing'], 'stable'), fill=None
+            ),
+            'is_significant': column(trend_p < self.significance_level, fill=False),
+            'trend_strength': column(np.abs(r)),
+            'recent_change_pct': column(recent_change * 100),
+            'current_value': column(last),
+            'mean_value': column(mean),
+            'std_value': column(std),
+            'min_value': column(y_min),
+            'max_value': column(y_max),
+            'f_statistic': column(f_stat, has_seasonality),
+            'seasonal_p_value': column(seasonal_p, has_seasonality),
+            'is_seasonal': column(seasonal_p < self.significance_level, has_seasonality, False),
+            'peak_quarter': column(quarter_labels[peak], has_seasonality, None),
+            'trough_quarter': column(quarter_labels[trough], has_seasonality, None),
+            'seasonal_amplitude': column(seasonal_amplitude, has_seasonality),
+            'total_anomalies': column(total_anomalies, fill=0).astype(int),
+            'anomaly_rate': column(total_anomalies / n),
+            'max_z_score': column(np.nanmax(np.where(valid, z_scores, -np.inf), axis=1)),
+            'iqr_lower': column(lower),
+            'iqr_upper': column(upper),
+            'latest_anomaly_date': column(
+                np.asarray(dates)[np.maximum(latest_anomaly, 0)], has_trend & (latest_anomaly >= 0), None
+            )
+        })
+        
+        logging.info(f"Panel analysis complete: {n_inst} institutions x {n_metrics} metrics over {n_dates} quarters")
+        
+        return results
 
 def get_time_series_analyzer(config_path: Optional[str] = None) -> TimeSeriesAnalyzer:
     """Get time series analyzer instance"""
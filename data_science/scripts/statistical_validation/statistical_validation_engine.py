@@ -6,17 +6,37 @@ Mock implementation for production integration
 import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Union
 import logging
 
+from .bootstrap import BootstrapEngine
+from .streaming import StreamingValidationAccumulator
+
 logger = logging.getLogger(__name__)
 
 class StatisticalValidationEngine:
     """Statistical validation engine for risk assessment results"""
     
-    def __init__(self):
-        """Initialize validation engine"""
+    # Largest sample Shapiro-Wilk p-values are reliable for
+    SHAPIRO_MAX_SAMPLES = 5000
+    
+    def __init__(self, n_resamples: int = 10000, random_state: Optional[int] = 42, n_jobs: int = 1,
+                 bootstrap_sample_size: int = 20000):
+        """
+        Initialize validation engine
+        
+        Args:
+            n_resamples: Bootstrap resamples for confidence intervals
+            random_state: Seed for reproducible validation reports
+            n_jobs: Worker processes for bootstrap resample blocks
+            bootstrap_sample_size: Largest sample bootstrapped directly; larger
+                inputs are bootstrapped on a seeded subsample and rescaled
+        """
         self.logger = logger
+        self.random_state = random_state
+        self.bootstrap_sample_size = bootstrap_sample_size
+        self.bootstrap = BootstrapEngine(n_resamples=n_resamples, random_state=random_state, n_jobs=n_jobs)
     
     def run_comprehensive_validation(
         self, 
@@ -24,33 +44,73 @@ class StatisticalValidationEngine:
         confidence_level: float = 0.95,
         significance_threshold: float = 0.05,
         include_bootstrap: bool = True,
-        include_cross_validation: bool = True
+        include_cross_validation: bool = True,
+        bootstrap_method: str = 'percentile'
     ) -> Dict[str, Any]:
         """Run comprehensive statistical validation"""
         
+        # Reservoir sized to the array so every statistic is exact
+        risk_scores = np.asarray(risk_scores, dtype=float)
+        summary = StreamingValidationAccumulator(
+            random_state=self.random_state, reservoir_size=max(len(risk_scores), 1)
+        )
+        summary.update(risk_scores)
+        
+        return self.run_streaming_validation(
+            summary, confidence_level, significance_threshold,
+            include_bootstrap, include_cross_validation, bootstrap_method
+        )
+    
+    def run_streaming_validation(
+        self,
+        chunks: Union[StreamingValidationAccumulator, Iterable[np.ndarray]],
+        confidence_level: float = 0.95,
+        significance_threshold: float = 0.05,
+        include_bootstrap: bool = True,
+        include_cross_validation: bool = True,
+        bootstrap_method: str = 'percentile'
+    ) -> Dict[str, Any]:
+        """
+        Run comprehensive statistical validation over chunked risk scores
+        
+        Args:
+            chunks: Iterable of score arrays, or an accumulator already fed
+                (e.g. merged from workers or built by ``accumulate_parquet``)
+            
+        Returns:
+            Validation report with the same structure as ``run_comprehensive_validation``
+        """
+        
         try:
             self.logger.info("Starting comprehensive statistical validation...")
             
+            if isinstance(chunks, StreamingValidationAccumulator):
+                summary = chunks
+            else:
+                summary = StreamingValidationAccumulator(random_state=self.random_state)
+                for chunk in chunks:
+                    summary.update(chunk)
+            
             # Data quality assessment
-            data_quality = self._assess_data_quality(risk_scores)
+            data_quality = self._assess_data_quality(summary)
             
             # Confidence intervals
             confidence_intervals = self._calculate_confidence_intervals(
-                risk_scores, confidence_level, include_bootstrap
+                summary, confidence_level, include_bootstrap, bootstrap_method
             )
             
             # Hypothesis testing
             hypothesis_results = self._perform_hypothesis_testing(
-                risk_scores, significance_threshold
+                summary, significance_threshold
             )
             
             # Model performance
-            model_performance = self._assess_model_performance(risk_scores)
+            model_performance = self._assess_model_performance(summary)
             
             # Cross-validation
             cv_results = None
             if include_cross_validation:
-                cv_results = self._perform_cross_validation(risk_scores)
+                cv_results = self._perform_cross_validation(summary)
             
             # Overall confidence assessment
             confidence_assessment = self._assess_overall_confidence(
@@ -69,7 +129,12 @@ class StatisticalValidationEngine:
                     'confidence_level': confidence_level,
                     'significance_threshold': significance_threshold,
                     'include_bootstrap': include_bootstrap,
-                    'include_cross_validation': include_cross_validation
+                    'include_cross_validation': include_cross_validation,
+                    'bootstrap_method': bootstrap_method,
+                    'n_resamples': self.bootstrap.n_resamples,
+                    'random_state': self.random_state,
+                    'n_scores': summary.total,
+                    'exact': summary.is_exact
                 }
             }
             
@@ -80,24 +145,46 @@ class StatisticalValidationEngine:
             self.logger.error(f"Statistical validation failed: {e}")
             raise
     
-    def _assess_data_quality(self, risk_scores: np.ndarray) -> Dict[str, Any]:
+    def accumulate_parquet(self, path: Union[str, Path], column: str = 'risk_score',
+                           batch_size: int = 1_000_000) -> StreamingValidationAccumulator:
+        """
+        Stream one column of a Parquet file or dataset directory into an accumulator
+        
+        Args:
+            path: Parquet file or directory
+            column: Risk score column
+            batch_size: Rows read per batch
+            
+        Returns:
+            Accumulator for ``run_streaming_validation``
+        """
+        import pyarrow.dataset as ds
+        
+        summary = StreamingValidationAccumulator(random_state=self.random_state)
+        for batch in ds.dataset(str(path), format='parquet').to_batches(columns=[column], batch_size=batch_size):
+            summary.update(batch.column(0).to_numpy(zero_copy_only=False))
+        
+        self.logger.info(f"Accumulated {summary.total} risk scores from {path}")
+        return summary
+    
+    def _assess_data_quality(self, summary: StreamingValidationAccumulator) -> Dict[str, Any]:
         """Assess data quality"""
         
-        # Basic quality metrics
-        completeness = 1.0 - (np.isnan(risk_scores).sum() / len(risk_scores))
+        # Basic quality metrics (NaN when there is nothing to assess)
+        total = summary.total or float('nan')
+        completeness = 1.0 - (summary.missing / total)
         
         # Range validation (risk scores should be 0-1)
-        valid_range = np.sum((risk_scores >= 0) & (risk_scores <= 1)) / len(risk_scores)
+        valid_range = summary.in_range / total
         
         # Outlier detection
-        q1, q3 = np.percentile(risk_scores, [25, 75])
+        q1, q3 = summary.percentile([25, 75])
         iqr = q3 - q1
-        outliers = np.sum((risk_scores < q1 - 1.5*iqr) | (risk_scores > q3 + 1.5*iqr))
-        outlier_rate = outliers / len(risk_scores)
+        outlier_rate = summary.fraction_outside(q1 - 1.5*iqr, q3 + 1.5*iqr) * (1.0 - summary.missing / total)
         
         # Distribution normality (Shapiro-Wilk approximation)
-        mean_score = np.mean(risk_scores)
-        std_score = np.std(risk_scores)
+        mean_score = summary.moments.mean if summary.moments.count else float('nan')
+        std_score = summary.moments.std()
         normality_score = 1.0 - min(abs(mean_score - 0.5), abs(std_score - 0.15)) * 2
         
         # Overall quality score
@@ -105,6 +192,8 @@ class StatisticalValidationEngine:
                         (1 - outlier_rate) * 0.2 + normality_score * 0.2)
         
         recommendations = []
+        if summary.moments.count == 0:
+            recommendations.append("Insufficient data - no valid risk scores to validate")
         if completeness < 0.95:
             recommendations.append("Address missing data points")
         if valid_range < 0.95:
@@ -126,19 +215,20 @@ class StatisticalValidationEngine:
         }
     
     def _calculate_confidence_intervals(
-        self, risk_scores: np.ndarray, confidence_level: float, include_bootstrap: bool
+        self, summary: StreamingValidationAccumulator, confidence_level: float, include_bootstrap: bool,
+        bootstrap_method: str = 'percentile'
     ) -> Dict[str, Any]:
         """Calculate confidence intervals"""
         
-        mean_score = np.mean(risk_scores)
-        std_score = np.std(risk_scores)
-        n = len(risk_scores)
+        n = summary.moments.count
+        mean_score = summary.moments.mean if n else float('nan')
+        std_score = summary.moments.std()
         
-        # Standard confidence interval
+        # Standard confidence interval (NaN below two scores)
         from scipy import stats
         alpha = 1 - confidence_level
-        t_critical = stats.t.ppf(1 - alpha/2, n-1)
-        margin_error = t_critical * (std_score / np.sqrt(n))
+        t_critical = stats.t.ppf(1 - alpha/2, n-1) if n > 1 else float('nan')
+        margin_error = t_critical * (std_score / np.sqrt(n)) if n > 1 else float('nan')
         
         standard_ci = {
             'lower': mean_score - margin_error,
@@ -148,21 +238,21 @@ class StatisticalValidationEngine:
         
         # Bootstrap confidence interval (if requested)
         bootstrap_ci = None
-        if include_bootstrap:
-            bootstrap_means = []
-            for _ in range(1000):
-                bootstrap_sample = np.random.choice(risk_scores, size=n, replace=True)
-                bootstrap_means.append(np.mean(bootstrap_sample))
+        if include_bootstrap and n > 1:
+            sample = summary.reservoir.values
+            if len(sample) > self.bootstrap_sample_size:
+                rng = np.random.default_rng(self.random_state)
+                sample = sample[np.sort(rng.choice(len(sample), self.bootstrap_sample_size, replace=False))]
+            bootstrap_ci = self.bootstrap.confidence_interval(sample, confidence_level, method=bootstrap_method)
             
-            bootstrap_means = np.array(bootstrap_means)
-            lower_percentile = ((1 - confidence_level) / 2) * 100
-            upper_percentile = (confidence_level + (1 - confidence_level) / 2) * 100
-            
-            bootstrap_ci = {
-                'lower': np.percentile(bootstrap_means, lower_percentile),
-                'upper': np.percentile(bootstrap_means, upper_percentile),
-                'method': 'Bootstrap resampling'
-            }
+            if len(sample) < n:
+                # Rescale the subsample bootstrap to the full sample size
+                scale = np.sqrt(len(sample) / n)
+                sample_mean = np.mean(sample)
+                for bound in ('lower', 'upper'):
+                    bootstrap_ci[bound] = mean_score + (bootstrap_ci[bound] - sample_mean) * scale
+                bootstrap_ci['standard_error'] *= scale
+                bootstrap_ci['method'] += f' (rescaled from {len(sample)} sampled scores)'
         
         return {
             'confidence_level': confidence_level,
@@ -172,13 +262,16 @@ class StatisticalValidationEngine:
         }
     
     def _perform_hypothesis_testing(
-        self, risk_scores: np.ndarray, significance_threshold: float
+        self, summary: StreamingValidationAccumulator, significance_threshold: float
     ) -> Dict[str, Any]:
         """Perform hypothesis testing"""
         
         # Test 1: One-sample t-test against neutral risk (0.5)
         from scipy import stats
-        t_stat, p_value = stats.ttest_1samp(risk_scores, 0.5)
+        n = summary.moments.count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stat = (summary.moments.mean - 0.5) / (summary.moments.std(ddof=1) / np.sqrt(n))
+        p_value = 2 * stats.t.sf(np.abs(t_stat), n - 1)
         
         primary_test = {
             'test_name': 'One-sample t-test vs neutral risk (0.5)',
@@ -188,15 +281,21 @@ class StatisticalValidationEngine:
             'interpretation': 'Risk significantly different from neutral' if p_value < significance_threshold else 'Risk not significantly different from neutral'
         }
         
-        # Test 2: Normality test
-        shapiro_stat, shapiro_p = stats.shapiro(risk_scores[:50])  # Shapiro-Wilk for small samples
+        # Test 2: Normality test on all scores
+        # (D'Agostino-Pearson above the Shapiro-Wilk sample size limit)
+        if 3 <= n <= self.SHAPIRO_MAX_SAMPLES and summary.is_exact:
+            test_name = 'Shapiro-Wilk normality test'
+            normality_stat, normality_p = stats.shapiro(summary.reservoir.values)
+        else:
+            test_name = "D'Agostino-Pearson normality test"
+            normality_stat, normality_p = summary.moments.normaltest()
         
         normality_test = {
-            'test_name': 'Shapiro-Wilk normality test',
-            'statistic': shapiro_stat,
-            'p_value': shapiro_p,
-            'significant': shapiro_p < significance_threshold,
-            'interpretation': 'Data not normally distributed' if shapiro_p < significance_threshold else 'Data approximately normal'
+            'test_name': test_name,
+            'statistic': normality_stat,
+            'p_value': normality_p,
+            'significant': normality_p < significance_threshold,
+            'interpretation': 'Data not normally distributed' if normality_p < significance_threshold else 'Data approximately normal'
         }
         
         return {
@@ -207,26 +306,17 @@ class StatisticalValidationEngine:
             'adjusted_alpha': significance_threshold / 2
         }
     
-    def _assess_model_performance(self, risk_scores: np.ndarray) -> Dict[str, Any]:
+    def _assess_model_performance(self, summary: StreamingValidationAccumulator) -> Dict[str, Any]:
         """Assess model performance metrics"""
         
-        # Generate synthetic "true" values for demonstration
-        # In production, these would be actual ground truth values
-        true_values = risk_scores + np.random.normal(0, 0.1, len(risk_scores))
-        true_values = np.clip(true_values, 0, 1)
-        
-        # Calculate performance metrics
-        mse = np.mean((risk_scores - true_values) ** 2)
+        # Metrics against synthetic "true" values (risk score plus seeded noise);
+        # in production, these would be actual ground truth values
+        performance = summary.model_performance()
+        mse = performance['mse']
         rmse = np.sqrt(mse)
-        mae = np.mean(np.abs(risk_scores - true_values))
-        
-        # R-squared
-        ss_res = np.sum((true_values - risk_scores) ** 2)
-        ss_tot = np.sum((true_values - np.mean(true_values)) ** 2)
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-        
-        # Correlation
-        correlation = np.corrcoef(risk_scores, true_values)[0, 1]
+        mae = performance['mae']
+        r_squared = performance['r_squared']
+        correlation = performance['correlation']
         
         return {
             'r_squared': r_squared,
@@ -237,21 +327,22 @@ class StatisticalValidationEngine:
             'performance_grade': 'Excellent' if r_squared > 0.8 else 'Good' if r_squared > 0.6 else 'Fair' if r_squared > 0.4 else 'Poor'
         }
     
-    def _perform_cross_validation(self, risk_scores: np.ndarray) -> Dict[str, Any]:
+    def _perform_cross_validation(self, summary: StreamingValidationAccumulator) -> Dict[str, Any]:
         """Perform cross-validation analysis"""
         
         # Simple k-fold cross-validation simulation
         k_folds = 5
-        fold_size = len(risk_scores) // k_folds
+        n = summary.moments.count
+        fold_size = n // k_folds
         cv_scores = []
         
         for i in range(k_folds):
             start_idx = i * fold_size
-            end_idx = start_idx + fold_size if i < k_folds - 1 else len(risk_scores)
+            end_idx = start_idx + fold_size if i < k_folds - 1 else n
             
             # Simulate validation score
-            fold_mean = np.mean(risk_scores[start_idx:end_idx])
-            overall_mean = np.mean(risk_scores)
+            fold_mean = summary.range_mean(start_idx, end_idx)
+            overall_mean = summary.moments.mean
             cv_score = 1 - abs(fold_mean - overall_mean)
             cv_scores.append(cv_score)
         
@@ -0,0 +1,386 @@
+"""
+Streaming Accumulators for Statistical Validation
+Mergeable moments, quantile sketch and reservoir sample so validation
+statistics can be computed from chunked risk scores without materialising them
+"""
+
+import numpy as np
+from scipy import stats
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingMoments:
+    """
+    Mergeable count, mean and central moments up to the fourth (missing values skipped)
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    def update(self, values: np.ndarray):
+        """Add a chunk of values"""
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        chunk = StreamingMoments()
+        chunk.count = len(values)
+        chunk.mean = float(values.mean())
+        deviations = values - chunk.mean
+        chunk.m2 = float(np.sum(deviations ** 2))
+        chunk.m3 = float(np.sum(deviations ** 3))
+        chunk.m4 = float(np.sum(deviations ** 4))
+        chunk.minimum = float(values.min())
+        chunk.maximum = float(values.max())
+        self.merge(chunk)
+
+    def merge(self, other: 'StreamingMoments'):
+        """Merge another accumulator into this one (Pebay's pairwise update)"""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return
+
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        m2 = self.m2 + other.m2 + delta ** 2 * na * nb / n
+        m3 = (self.m3 + other.m3 + delta ** 3 * na * nb * (na - nb) / n ** 2
+              + 3 * delta * (na * other.m2 - nb * self.m2) / n)
+        m4 = (self.m4 + other.m4 + delta ** 4 * na * nb * (na ** 2 - na * nb + nb ** 2) / n ** 3
+              + 6 * delta ** 2 * (na ** 2 * other.m2 + nb ** 2 * self.m2) / n ** 2
+              + 4 * delta * (na * other.m3 - nb * self.m3) / n)
+
+        self.count = n
+        self.mean += delta * nb / n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def std(self, ddof: int = 0) -> float:
+        """Standard deviation with the given delta degrees of freedom"""
+        if self.count - ddof <= 0:
+            return float('nan')
+        return float(np.sqrt(self.m2 / (self.count - ddof)))
+
+    def skewness(self) -> float:
+        """Biased sample skewness (as ``scipy.stats.skew``)"""
+        if self.m2 == 0:
+            return float('nan')
+        return (self.m3 / self.count) / (self.m2 / self.count) ** 1.5
+
+    def kurtosis(self) -> float:
+        """Biased Pearson kurtosis (as ``scipy.stats.kurtosis(fisher=False)``)"""
+        if self.m2 == 0:
+            return float('nan')
+        return (self.m4 / self.count) / (self.m2 / self.count) ** 2
+
+    def normaltest(self) -> Tuple[float, float]:
+        """D'Agostino-Pearson K^2 normality test from the moments (as ``scipy.stats.normaltest``)"""
+        n = float(self.count)
+        if n < 8:
+            return float('nan'), float('nan')
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Skewness test
+            y = self.skewness() * np.sqrt(((n + 1) * (n + 3)) / (6.0 * (n - 2)))
+            beta2 = (3.0 * (n ** 2 + 27 * n - 70) * (n + 1) * (n + 3)
+                     / ((n - 2.0) * (n + 5) * (n + 7) * (n + 9)))
+            w2 = -1 + np.sqrt(2 * (beta2 - 1))
+            delta = 1 / np.sqrt(0.5 * np.log(w2))
+            alpha = np.sqrt(2.0 / (w2 - 1))
+            y = 1.0 if y == 0 else y
+            z_skew = delta * np.log(y / alpha + np.sqrt((y / alpha) ** 2 + 1))
+
+            # Kurtosis test
+            expected = 3.0 * (n - 1) / (n + 1)
+            variance = 24.0 * n * (n - 2) * (n - 3) / ((n + 1) * (n + 1.0) * (n + 3) * (n + 5))
+            x = (self.kurtosis() - expected) / variance ** 0.5
+            sqrt_beta1 = (6.0 * (n * n - 5 * n + 2) / ((n + 7) * (n + 9))
+                          * ((6.0 * (n + 3) * (n + 5)) / (n * (n - 2) * (n - 3))) ** 0.5)
+            a = 6.0 + 8.0 / sqrt_beta1 * (2.0 / sqrt_beta1 + (1 + 4.0 / sqrt_beta1 ** 2) ** 0.5)
+            term1 = 1 - 2 / (9.0 * a)
+            denominator = 1 + x * (2 / (a - 4.0)) ** 0.5
+            term2 = np.nan if denominator == 0 else np.sign(denominator) * ((1 - 2.0 / a) / abs(denominator)) ** (1 / 3)
+            z_kurt = (term1 - term2) / (2 / (9.0 * a)) ** 0.5
+
+        statistic = z_skew ** 2 + z_kurt ** 2
+        return float(statistic), float(stats.chi2.sf(statistic, 2))
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL quantile sketch
+
+    Level ``h`` items each stand for ``2**h`` inputs; rank error is roughly
+    proportional to ``1 / k``.
+    """
+
+    def __init__(self, k: int = 2000, random_state: Optional[int] = 42):
+        self.k = k
+        self.count = 0
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(random_state)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self):
+        """Compact every level that is over capacity into the level above"""
+        level = 0
+        while level < len(self.levels):
+            if len(self.levels[level]) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(self.levels[level])
+                if len(items) % 2:
+                    self.levels[level], items = items[-1:], items[:-1]
+                else:
+                    self.levels[level] = np.empty(0)
+                offset = int(self._rng.integers(2))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], items[offset::2]])
+            level += 1
+
+    def update(self, values: np.ndarray):
+        """Add a chunk of values (missing values skipped)"""
+        values = values[~np.isnan(values)]
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compress()
+
+    def merge(self, other: 'QuantileSketch'):
+        """Merge another sketch into this one"""
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def _weighted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(l), 2.0 ** h) for h, l in enumerate(self.levels)])
+        order = np.argsort(items)
+        return items[order], weights[order]
+
+    def rank(self, values: np.ndarray, strict: bool = False) -> np.ndarray:
+        """Approximate fraction of values below (``strict``) or at most each value"""
+        items, weights = self._weighted_items()
+        if len(items) == 0:
+            return np.full(np.shape(values), np.nan)
+        cumulative = np.concatenate([[0.0], np.cumsum(weights)])
+        positions = np.searchsorted(items, values, side='left' if strict else 'right')
+        return cumulative[positions] / cumulative[-1]
+
+    def quantile(self, q: np.ndarray) -> np.ndarray:
+        """Approximate quantiles for probabilities ``q``"""
+        items, weights = self._weighted_items()
+        if len(items) == 0:
+            return np.full(np.shape(q), np.nan)
+        cumulative = np.cumsum(weights) / weights.sum()
+        positions = np.minimum(np.searchsorted(cumulative, q, side='left'), len(items) - 1)
+        return items[positions]
+
+
+class ReservoirSample:
+    """
+    Mergeable uniform sample of a stream (Algorithm R)
+
+    Holds every value, in order, while the stream is no longer than ``size``.
+    """
+
+    def __init__(self, size: int = 100000, random_state: Optional[int] = 42):
+        self.size = size
+        self.seen = 0
+        self.values = np.empty(0)
+        self._rng = np.random.default_rng(random_state)
+
+    def update(self, values: np.ndarray):
+        """Add a chunk of values"""
+        free = max(0, self.size - len(self.values))
+        if free:
+            self.values = np.concatenate([self.values, values[:free]])
+        rest = values[free:]
+        if len(rest):
+            positions = self.seen + free + np.arange(len(rest))
+            slots = self._rng.integers(0, positions + 1)
+            keep = slots < self.size
+            self.values[slots[keep]] = rest[keep]
+        self.seen += len(values)
+
+    def merge(self, other: 'ReservoirSample'):
+        """Merge another reservoir so the result is a uniform sample of both streams"""
+        total = self.seen + other.seen
+        if total <= self.size:
+            self.values = np.concatenate([self.values, other.values])
+        elif other.seen:
+            take = self._rng.hypergeometric(self.seen, other.seen, self.size)
+            mine = self._rng.choice(len(self.values), min(take, len(self.values)), replace=False)
+            theirs = self._rng.choice(len(other.values), self.size - len(mine), replace=False)
+            self.values = np.concatenate([self.values[np.sort(mine)], other.values[np.sort(theirs)]])
+        self.seen = total
+
+
+class StreamingValidationAccumulator:
+    """
+    Streaming summary of risk scores for ``StatisticalValidationEngine``
+
+    Feed chunks with ``update`` (or combine worker accumulators with
+    ``merge``) and pass the result to ``run_streaming_validation``. Moments,
+    t-tests, D'Agostino-Pearson normality and model performance are exact;
+    quantiles, outlier rates and bootstrap intervals are exact while the
+    stream fits the reservoir and sketch/reservoir estimates beyond it.
+    Missing scores count towards completeness only.
+    """
+
+    def __init__(self, random_state: Optional[int] = 42, reservoir_size: int = 100000,
+                 sketch_k: int = 2000, block_size: int = 1024):
+        """
+        Args:
+            random_state: Seed for the reservoir, sketch and synthetic ground truth
+            reservoir_size: Uniform sample kept for Shapiro-Wilk and bootstrap
+            sketch_k: KLL sketch accuracy parameter
+            block_size: Granularity of the positional sums behind cross-validation folds
+        """
+        self.random_state = random_state
+        self.block_size = block_size
+        self.total = 0
+        self.missing = 0
+        self.in_range = 0
+        self.moments = StreamingMoments()
+        self.sketch = QuantileSketch(k=sketch_k, random_state=random_state)
+        self.reservoir = ReservoirSample(size=reservoir_size, random_state=random_state)
+        self.block_counts: List[np.ndarray] = []
+        self.block_sums: List[np.ndarray] = []
+
+        # Synthetic ground truth as in _assess_model_performance, with co-moments
+        self._truth_rng = np.random.default_rng(random_state)
+        self.truth_moments = StreamingMoments()
+        self.comoment = 0.0
+        self.squared_error = 0.0
+        self.absolute_error = 0.0
+
+    def update(self, risk_scores: Iterable[float]):
+        """Add a chunk of risk scores"""
+        risk_scores = np.asarray(risk_scores, dtype=float)
+        valid = risk_scores[~np.isnan(risk_scores)]
+
+        self.total += len(risk_scores)
+        self.missing += len(risk_scores) - len(valid)
+        self.in_range += int(np.sum((valid >= 0) & (valid <= 1)))
+        self.reservoir.update(valid)
+        self.sketch.update(valid)
+
+        if len(valid):
+            starts = np.arange(0, len(valid), self.block_size)
+            self.block_counts.append(np.diff(np.append(starts, len(valid))))
+            self.block_sums.append(np.add.reduceat(valid, starts))
+
+        true_values = np.clip(risk_scores + self._truth_rng.normal(0, 0.1, len(risk_scores)), 0, 1)
+        true_values = true_values[~np.isnan(risk_scores)]
+        self._update_performance(valid, true_values)
+        self.moments.update(valid)
+
+    def _update_performance(self, predicted: np.ndarray, true_values: np.ndarray):
+        if len(predicted) == 0:
+            return
+        n_before = self.moments.count
+        pred_mean, true_mean = predicted.mean(), true_values.mean()
+        chunk_comoment = float(np.sum((predicted - pred_mean) * (true_values - true_mean)))
+        self._merge_comoment(n_before, self.truth_moments.mean, chunk_comoment, len(predicted),
+                             pred_mean, true_mean)
+        self.truth_moments.update(true_values)
+        self.squared_error += float(np.sum((predicted - true_values) ** 2))
+        self.absolute_error += float(np.sum(np.abs(predicted - true_values)))
+
+    def _merge_comoment(self, n_a: int, true_mean_a: float, comoment_b: float, n_b: int,
+                        pred_mean_b: float, true_mean_b: float):
+        """Chan update of the predicted/true co-moment"""
+        if n_a == 0:
+            self.comoment = comoment_b
+            return
+        n = n_a + n_b
+        self.comoment += comoment_b + (pred_mean_b - self.moments.mean) * (true_mean_b - true_mean_a) * n_a * n_b / n
+
+    def merge(self, other: 'StreamingValidationAccumulator'):
+        """Merge an accumulator fed with the chunks that follow this one's"""
+        self.total += other.total
+        self.missing += other.missing
+        self.in_range += other.in_range
+        self.reservoir.merge(other.reservoir)
+        self.sketch.merge(other.sketch)
+        self.block_counts.extend(other.block_counts)
+        self.block_sums.extend(other.block_sums)
+        self._merge_comoment(self.moments.count, self.truth_moments.mean, other.comoment,
+                             other.moments.count, other.moments.mean, other.truth_moments.mean)
+        self.truth_moments.merge(other.truth_moments)
+        self.squared_error += other.squared_error
+        self.absolute_error += other.absolute_error
+        self.moments.merge(other.moments)
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether the reservoir still holds every valid score"""
+        return self.reservoir.seen <= self.reservoir.size
+
+    def percentile(self, q: Iterable[float]) -> np.ndarray:
+        """Percentiles (0-100) of the valid scores (NaN if there are none)"""
+        q = np.asarray(q, dtype=float)
+        if self.moments.count == 0:
+            return np.full(q.shape, np.nan)
+        if self.is_exact:
+            return np.percentile(self.reservoir.values, q)
+        return self.sketch.quantile(q / 100)
+
+    def fraction_outside(self, lower: float, upper: float) -> float:
+        """Fraction of valid scores below ``lower`` or above ``upper``"""
+        if self.moments.count == 0:
+            return float('nan')
+        if self.is_exact:
+            values = self.reservoir.values
+            return float(np.mean((values < lower) | (values > upper)))
+        below = self.sketch.rank(np.array([lower]), strict=True)[0]
+        at_most = self.sketch.rank(np.array([upper]))[0]
+        return float(below + 1 - at_most)
+
+    def range_mean(self, start: int, end: int) -> float:
+        """Mean of the valid scores at positions ``start`` to ``end`` (block-interpolated beyond the reservoir)"""
+        if end <= start or self.moments.count == 0:
+            return float('nan')
+        if self.is_exact:
+            return float(np.mean(self.reservoir.values[start:end]))
+        counts = np.concatenate(self.block_counts).astype(float)
+        sums = np.concatenate(self.block_sums)
+        bounds = np.concatenate([[0.0], np.cumsum(counts)])
+        prefix = np.concatenate([[0.0], np.cumsum(sums)])
+
+        def prefix_sum(position):
+            block = min(max(np.searchsorted(bounds, position, side='right') - 1, 0), len(counts) - 1)
+            return prefix[block] + sums[block] * (position - bounds[block]) / counts[block]
+
+        return (prefix_sum(end) - prefix_sum(start)) / (end - start)
+
+    def model_performance(self) -> Dict[str, float]:
+        """MSE, MAE, R-squared and correlation against the synthetic ground truth"""
+        n = self.moments.count
+        if n == 0:
+            return {'mse': float('nan'), 'mae': float('nan'), 'r_squared': float('nan'), 'correlation': float('nan')}
+        mse = self.squared_error / n
+        ss_tot = self.truth_moments.m2
+        denominator = np.sqrt(self.moments.m2 * self.truth_moments.m2)
+        return {
+            'mse': mse,
+            'mae': self.absolute_error / n,
+            'r_squared': 1 - (self.squared_error / ss_tot) if ss_tot != 0 else 0,
+            'correlation': self.comoment / denominator if denominator > 0 else float('nan')
+        }
@@ -9,6 +9,7 @@ from bertopic import BERTopic
 from sentence_transformers import SentenceTransformer
 from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from scipy import sparse
 import yaml
 import re
 from typing import Dict, List, Tuple, Optional, Any
@@ -16,6 +17,8 @@ from pathlib import Path
 import logging
 from collections import Counter
 import warnings
+
+from .coherence import TopicCoherence
 warnings.filterwarnings('ignore')
 
 class HybridTopicEngine:
@@ -23,15 +26,33 @@ class HybridTopicEngine:
     Advanced hybrid topic modeling engine combining seed-based and emergent discovery
     """
     
+    # Word tokens used for seed keyword matching
+    _TOKEN_PATTERN = re.compile(r'\b\w+\b')
+    
     def __init__(self, config_path: Optional[str] = None):
         self.config = self._load_config(config_path)
         self.seed_topics = self._load_seed_topics()
+        self._build_seed_keyword_matrix()
         
         # Topic modeling configuration
         self.seed_threshold = self.config.get('topic_modeling', {}).get('seed_threshold', 3)
         self.min_cluster_size = self.config.get('topic_modeling', {}).get('emergent_min_cluster_size', 50)
-        self.coherence_threshold = self.config.get('topic_modeling', {}).get('coherence_threshold', 0.4)
         self.max_topics = self.config.get('topic_modeling', {}).get('max_topics', 50)
+        self.coherence_measure = self.config.get('topic_modeling', {}).get('coherence_measure', 'npmi')
+        
+        # Coherence thresholds are on each measure's own scale
+        self.coherence_thresholds = dict(TopicCoherence.DEFAULT_THRESHOLDS)
+        if 'coherence_threshold' in self.config.get('topic_modeling', {}):
+            # Legacy single threshold, tuned for the mean topic word weight
+            self.coherence_thresholds['probability'] = self.config['topic_modeling']['coherence_threshold']
+        self.coherence_thresholds.update(self.config.get('topic_modeling', {}).get('coherence_thresholds', {}))
+        self.coherence_threshold = self.coherence_thresholds[self.coherence_measure]
+        
+        # Corpus co-occurrence statistics for coherence, cached per bank and quarter
+        self.coherence_model = TopicCoherence(
+            top_k=self.config.get('topic_modeling', {}).get('coherence_top_k', 10)
+        )
+        self.coherence_key = None
         
         # Initialize embedding model
         embedding_model_name = self.config.get('topic_modeling', {}).get('embedding_model', 'all-MiniLM-L6-v2')
@@ -116,6 +137,110 @@ class HybridTopicEngine:
             verbose=False
         )
     
+    def _build_seed_keyword_matrix(self):
+        """
+        Build keyword x topic weight matrices for the seed topics
+        
+        ``seed_primary_weights`` and ``seed_secondary_weights`` count how often
+        each vocabulary keyword appears in a topic's primary and secondary
+        lists, so a sentence x keyword matrix multiplied by them gives the
+        per-topic match counts.
+        """
+        self.seed_topic_names = list(self.seed_topics.keys())
+        self.seed_vocabulary: Dict[str, int] = {}
+        
+        rows = {'primary': [], 'secondary': []}
+        cols = {'primary': [], 'secondary': []}
+        for topic_index, topic_name in enumerate(self.seed_topic_names):
+            keywords = self.seed_topics[topic_name]['keywords']
+            for kind in ['primary', 'secondary']:
+                for keyword in keywords[kind]:
+                    keyword_index = self.seed_vocabulary.setdefault(keyword, len(self.seed_vocabulary))
+                    rows[kind].append(keyword_index)
+                    cols[kind].append(topic_index)
+        
+        shape = (len(self.seed_vocabulary), len(self.seed_topic_names))
+        self.seed_primary_weights, self.seed_secondary_weights = [
+            sparse.csr_matrix((np.ones(len(rows[kind])), (rows[kind], cols[kind])), shape=shape)
+            for kind in ['primary', 'secondary']
+        ]
+        
+        topics = [self.seed_topics[name] for name in self.seed_topic_names]
+        self.seed_keyword_totals = np.array(
+            [len(t['keywords']['primary']) + len(t['keywords']['secondary']) for t in topics], dtype=float
+        )
+        self.seed_topic_weights = np.array([t['weight'] for t in topics], dtype=float)
+        self.seed_min_confidence = np.array([t['min_confidence'] for t in topics], dtype=float)
+    
+    def _seed_keyword_matrix(self, texts: List[str]) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        """
+        Build the binary sentence x keyword matrix
+        
+        Returns:
+            Tuple of (CSR matrix over ``seed_vocabulary``, word count per sentence)
+        """
+        vocabulary = self.seed_vocabulary
+        indices: List[int] = []
+        indptr = [0]
+        word_counts = np.zeros(len(texts))
+        for i, text in enumerate(texts):
+            words = self._TOKEN_PATTERN.findall(text)
+            word_counts[i] = len(words)
+            indices.extend({vocabulary[w] for w in words if w in vocabulary})
+            indptr.append(len(indices))
+        
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices)), indices, indptr),
+            shape=(len(texts), len(vocabulary))
+        )
+        return matrix, word_counts
+    
+    def score_seed_topics(self, texts: List[str]) -> pd.DataFrame:
+        """
+        Score every seed topic for every sentence with sparse matrix products
+        
+        Columnar equivalent of ``_calculate_best_seed_topic``.
+        
+        Args:
+            texts: Lowercased sentence texts
+            
+        Returns:
+            DataFrame with ``topic_seed`` (None when no topic qualifies),
+            ``topic_score``, ``topic_confidence`` and ``assigned`` (best topic
+            meets its ``min_confidence``), one row per text
+        """
+        matrix, word_counts = self._seed_keyword_matrix(texts)
+        primary_matches = (matrix @ self.seed_primary_weights).toarray()
+        secondary_matches = (matrix @ self.seed_secondary_weights).toarray()
+        
+        # Weighted score and confidence for all topics at once
+        raw_scores = primary_matches * 2.0 + secondary_matches * 1.0
+        keyword_coverage = (primary_matches + secondary_matches) / self.seed_keyword_totals
+        has_words = word_counts > 0
+        text_relevance = np.where(
+            has_words[:, None],
+            np.minimum(raw_scores / np.where(has_words, word_counts, 1.0)[:, None], 1.0),
+            0
+        )
+        confidence = (keyword_coverage * 0.6 + text_relevance * 0.4) * self.seed_topic_weights
+        
+        # Best topic: highest confidence among topics over the score threshold, first on ties
+        eligible = (raw_scores >= self.seed_threshold) & (confidence > 0)
+        best = np.where(eligible, confidence, -np.inf).argmax(axis=1)
+        rows = np.arange(len(texts))
+        has_topic = eligible[rows, best]
+        
+        best_confidence = np.where(has_topic, confidence[rows, best], 0.0)
+        return pd.DataFrame({
+            # Object dtype keeps None for rows without a topic (string inference would make them NaN)
+            'topic_seed': pd.Series(
+                np.where(has_topic, np.array(self.seed_topic_names, dtype=object)[best], None), dtype=object
+            ),
+            'topic_score': np.where(has_topic, raw_scores[rows, best], 0.0),
+            'topic_confidence': best_confidence,
+            'assigned': has_topic & (best_confidence >= self.seed_min_confidence[best])
+        })
+    
     def assign_seed_topics(self, sentences: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Assign seed topics based on keyword matching with confidence scoring
@@ -126,28 +251,29 @@ class HybridTopicEngine:
         Returns:
             Tuple of (seed_assigned_df, remaining_df)
         """
-        seed_assigned = []
-        remaining = []
+        if 'text' in sentences.columns:
+            texts = [str(text).lower() for text in sentences['text'].tolist()]
+        else:
+            texts = [''] * len(sentences)
         
-        for idx, row in sentences.iterrows():
-            text = str(row.get('text', '')).lower()
-            best_topic, best_score, best_confidence = self._calculate_best_seed_topic(text)
-            
-            if best_topic and best_confidence >= self.seed_topics[best_topic]['min_confidence']:
-                row_copy = row.copy()
-                row_copy['topic_seed'] = best_topic
-                row_copy['topic_confidence'] = best_confidence
-                row_copy['topic_score'] = best_score
-                row_copy['topic_type'] = 'seed'
-                seed_assigned.append(row_copy)
-                self.processing_stats['seed_assigned'] += 1
-            else:
-                remaining.append(row)
-        
-        seed_df = pd.DataFrame(seed_assigned) if seed_assigned else pd.DataFrame()
-        remaining_df = pd.DataFrame(remaining) if remaining else pd.DataFrame()
-        
-        logging.info(f"Seed topic assignment: {len(seed_assigned)} assigned, {len(remaining)} remaining")
+        if not self.seed_topic_names:
+            scores = pd.DataFrame({'assigned': np.zeros(len(texts), dtype=bool)})
+        else:
+            scores = self.score_seed_topics(texts)
+        mask = scores['assigned'].to_numpy()
+        
+        seed_df = sentences[mask].copy()
+        seed_df['topic_seed'] = scores.loc[mask, 'topic_seed'].to_numpy()
+        seed_df['topic_confidence'] = scores.loc[mask, 'topic_confidence'].to_numpy()
+        seed_df['topic_score'] = scores.loc[mask, 'topic_score'].to_numpy()
+        seed_df['topic_type'] = 'seed'
+        remaining_df = sentences[~mask]
+        
+        self.processing_stats['seed_assigned'] += len(seed_df)
+        logging.info(f"Seed topic assignment: {len(seed_df)} assigned, {len(remaining_df)} remaining")
+        
+        seed_df = seed_df if len(seed_df) else pd.DataFrame()
+        remaining_df = remaining_df if len(remaining_df) else pd.DataFrame()
         
         return seed_df, remaining_df
     
@@ -227,8 +353,9 @@ class HybridTopicEngine:
             # Get topic information
             topic_info = self.bertopic_model.get_topic_info()
             
-            # Validate topic coherence
-            coherence_scores = self._calculate_topic_coherence()
+            # Validate topic coherence against the threshold of the measure used
+            coherence_scores = self._calculate_topic_coherence(texts)
+            coherence_threshold = self.coherence_thresholds[self._effective_coherence_measure(texts)]
             
             # Assign results
             sentences = sentences.copy()
@@ -241,7 +368,7 @@ class HybridTopicEngine:
                 else:
                     # Check coherence threshold
                     topic_coherence = coherence_scores.get(topic_id, 0.0)
-                    if topic_coherence >= self.coherence_threshold:
+                    if topic_coherence >= coherence_threshold:
                         sentences.iloc[i, sentences.columns.get_loc('topic_emergent')] = f"emergent_{topic_id}"
                         sentences.iloc[i, sentences.columns.get_loc('topic_confidence')] = float(max(prob)) if prob is not None else 0.5
                         sentences.iloc[i, sentences.columns.get_loc('topic_type')] = 'emergent'
@@ -269,10 +396,25 @@ class HybridTopicEngine:
         
         return sentences
     
-    def _calculate_topic_coherence(self) -> Dict[int, float]:
+    def _effective_coherence_measure(self, texts: Optional[List[str]] = None) -> str:
+        """Configured coherence measure, or 'probability' when no corpus statistics are available"""
+        corpus_available = texts is not None or self.coherence_model.has_statistics(self.coherence_key)
+        if self.coherence_measure in TopicCoherence.MEASURES and corpus_available:
+            return self.coherence_measure
+        return 'probability'
+    
+    def _calculate_topic_coherence(self, texts: Optional[List[str]] = None) -> Dict[int, float]:
         """
         Calculate coherence scores for discovered topics
         
+        With ``coherence_measure`` set to 'npmi' or 'umass', topics are scored
+        against the co-occurrence statistics of the corpus, which are cached
+        under ``coherence_key`` so repeated evaluation reuses them. Without a
+        corpus, or with 'probability', the mean topic word probability is used.
+        
+        Args:
+            texts: Corpus the topics were fitted on
+            
         Returns:
             Dictionary mapping topic_id to coherence score
         """
@@ -285,6 +427,15 @@ class HybridTopicEngine:
             # Get topics
             topics = self.bertopic_model.get_topics()
             
+            if self._effective_coherence_measure(texts) != 'probability':
+                topic_words = {
+                    topic_id: [word for word, _ in words]
+                    for topic_id, words in topics.items() if topic_id != -1
+                }
+                return self.coherence_model.score(
+                    topic_words, key=self.coherence_key, texts=texts, measure=self.coherence_measure
+                )
+            
             # Calculate coherence for each topic
             for topic_id in topics.keys():
                 if topic_id != -1:  # Skip outlier topic
@@ -336,6 +487,7 @@ class HybridTopicEngine:
         
         # Reset statistics
         self.processing_stats = {k: 0 for k in self.processing_stats.keys()}
+        self.coherence_key = (bank, quarter)
         self.processing_stats['total_processed'] = len(sentences)
         
         # Ensure required columns exist
@@ -372,7 +524,7 @@ class HybridTopicEngine:
             result['topic_type'] = 'misc'
         
         # Step 4: Add final topic assignment
-        result['final_topic'] = result.apply(self._get_final_topic, axis=1)
+        result['final_topic'] = self._get_final_topics(result)
         
         # Step 5: Add metadata
         result['bank'] = bank
@@ -386,6 +538,13 @@ class HybridTopicEngine:
         
         return result, metadata
     
+    def _get_final_topics(self, df: pd.DataFrame) -> pd.Series:
+        """Final topic for every row: seed topic, else emergent topic, else miscellaneous"""
+        missing = pd.Series(None, index=df.index, dtype=object)
+        seed = df['topic_seed'] if 'topic_seed' in df.columns else missing
+        emergent = df['topic_emergent'] if 'topic_emergent' in df.columns else missing
+        return seed.astype(object).where(seed.notna(), emergent).fillna('miscellaneous')
+    
     def _get_final_topic(self, row) -> str:
         """Determine final topic assignment for a row"""
         if pd.notna(row.get('topic_seed')):
@@ -411,6 +570,7 @@ class HybridTopicEngine:
             'configuration': {
                 'seed_threshold': self.seed_threshold,
                 'min_cluster_size': self.min_cluster_size,
+                'coherence_measure': self.coherence_measure,
                 'coherence_threshold': self.coherence_threshold,
                 'max_topics': self.max_topics
             }
@@ -0,0 +1,123 @@
+"""
+Tests for the fitted AnomalyDetector ensemble
+
+Scoring the baseline with the fitted ensemble must reproduce the
+fit-and-score ensemble_detection results on the same data.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.append(str(Path(__file__).parent.parent / 'scripts'))
+
+from statistical_analysis.anomaly_detector import AnomalyDetector
+
+
+@pytest.fixture(scope='module')
+def baseline_df():
+    rng = np.random.default_rng(0)
+    n = 1500
+    df = pd.DataFrame({column: rng.random(n) for column in AnomalyDetector.FEATURE_COLUMNS[:9]})
+    df.iloc[:20, 0] = 5.0
+    return df
+
+
+@pytest.fixture(scope='module')
+def detector(baseline_df, tmp_path_factory):
+    detector = AnomalyDetector()
+    detector.models_path = tmp_path_factory.mktemp('models') / 'anomaly_detector.joblib'
+    detector.fit_ensemble(baseline_df)
+    return detector
+
+
+def test_fitted_scoring_matches_ensemble_detection(detector, baseline_df):
+    X = detector.prepare_features(baseline_df)[0].values
+    expected = detector.ensemble_detection(X)
+    scored = detector.score_ensemble(X)
+
+    for method in expected:
+        np.testing.assert_array_equal(scored[method]['binary'], expected[method]['binary'])
+        np.testing.assert_allclose(scored[method]['scores'], expected[method]['scores'], atol=1e-12)
+
+
+def test_persisted_ensemble_scores_without_refit(detector, baseline_df):
+    detector.save_models()
+    loaded = AnomalyDetector()
+    loaded.models_path = detector.models_path
+
+    results_df, report = loaded.score_anomalies(baseline_df.iloc[:50])
+    assert loaded.fitted_ensemble['fitted_at'] == detector.fitted_ensemble['fitted_at']
+    assert report['summary']['total_records'] == 50
+    assert results_df['is_anomaly'].iloc[:20].all()
+
+
+def test_first_fit_needs_a_baseline(baseline_df, tmp_path):
+    detector = AnomalyDetector()
+    detector.models_path = tmp_path / 'anomaly_detector.joblib'
+
+    results_df, report = detector.score_anomalies(baseline_df.iloc[:200])
+    assert report['summary']['total_records'] == 200
+    assert detector.fitted_ensemble is None and not detector.models_path.exists()
+
+    detector.score_anomalies(baseline_df.iloc[:200], baseline_df=baseline_df)
+    assert detector.fitted_ensemble['n_samples'] == len(baseline_df) and detector.models_path.exists()
+
+
+def test_refit_schedule(detector, baseline_df):
+    assert not detector.needs_refit(baseline_df)
+    assert detector.needs_refit(now=datetime.now() + timedelta(days=detector.refit_interval_days + 1))
+    assert detector.needs_refit(baseline_df.drop(columns=['stress_score']))
+
+
+def reference_dbscan_scores(X, labels):
+    scores = np.zeros(len(X))
+    clusters = np.unique(labels[labels != -1])
+    for i, point in enumerate(X):
+        if labels[i] == -1:
+            scores[i] = min(np.linalg.norm(point - X[labels == c].mean(axis=0)) for c in clusters)
+    return scores / scores.max() if scores.max() > 0 else scores
+
+
+@pytest.fixture(scope='module')
+def clustered_X():
+    rng = np.random.default_rng(1)
+    return np.vstack([rng.normal(c, 0.3, (500, 4)) for c in range(3)] + [rng.uniform(-3, 5, (100, 4))])
+
+
+def test_dbscan_scores_match_reference(detector, clustered_X):
+    binary, scores = detector.detect_dbscan(clustered_X)
+    labels = detector.dbscan.fit_predict(clustered_X)
+    np.testing.assert_array_equal(binary, (labels == -1).astype(int))
+    np.testing.assert_allclose(scores, reference_dbscan_scores(clustered_X, labels), atol=1e-12)
+
+
+def test_dbscan_sample_and_assign(clustered_X):
+    detector = AnomalyDetector()
+    full_binary, _ = detector.detect_dbscan(clustered_X)
+    detector.dbscan_max_samples = 800
+    binary, scores = detector.detect_dbscan(clustered_X)
+    assert len(binary) == len(clustered_X)
+    assert (binary == full_binary).mean() > 0.95
+    assert scores.max() <= 1.0
+
+
+def test_ensemble_dbscan_fits_on_sample(clustered_X):
+    clustered_df = pd.DataFrame(clustered_X, columns=AnomalyDetector.FEATURE_COLUMNS[:4])
+    detector = AnomalyDetector()
+    detector.dbscan_max_samples = 800
+    detector.fit_ensemble(clustered_df)
+    model = detector.fitted_ensemble['models']['dbscan']
+    assert len(model.labels_) == 800
+    assert model.min_samples == detector.dbscan.min_samples
+    assert len(detector.fitted_ensemble['dbscan']['centres']) > 0
+
+    X = detector.prepare_features(clustered_df)[0].values
+    expected = detector.ensemble_detection(X)['dbscan']
+    scored = detector.score_ensemble(X)['dbscan']
+    np.testing.assert_array_equal(scored['binary'], expected['binary'])
+    assert 0 < scored['binary'].mean() < 0.5
@@ -0,0 +1,108 @@
+"""
+Tests for the asynchronous document pipeline in DashboardIntegration
+"""
+
+import pytest
+import asyncio
+import sys
+from pathlib import Path
+
+# data_science first, so ``scripts`` is data_science/scripts and not the repository's scripts/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scripts.business_intelligence import dashboard_integration
+from scripts.business_intelligence.dashboard_integration import DashboardIntegration
+
+
+class ETLStandIn:
+    """
+    Stand-in for the ETL pipeline and schema transformer, which read
+    config/etl_config.yaml from the working directory and are not used by the
+    document pipeline under test
+    """
+
+
+class UploadedFile:
+    """Minimal stand-in for an uploaded file object"""
+
+    def __init__(self, name, content):
+        self.name = name
+        self.content = content.encode('utf-8')
+
+    def getvalue(self):
+        return self.content
+
+
+def make_uploads(n):
+    paragraph = "Our chief risk officer reviewed credit exposure and capital buffers in detail this quarter."
+    uploads = [UploadedFile(f"transcript_{i}_Q{i % 4 + 1}_2024.txt", "\n\n".join([paragraph] * (i + 1)))
+               for i in range(n)]
+    uploads.append(UploadedFile("financials_Q1_2024.csv", "metric,value\nCET1,13.2\nLCR,135\n"))
+    uploads.append(UploadedFile("notes.docx", "unsupported"))
+    return uploads
+
+
+@pytest.fixture(scope='module')
+def integration():
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(dashboard_integration, 'ETLPipeline', ETLStandIn, raising=False)
+        patch.setattr(dashboard_integration, 'SchemaTransformer', ETLStandIn, raising=False)
+        integration = DashboardIntegration()
+    integration.max_workers = 2
+    integration.max_in_flight_documents = 2
+    integration.enable_sentiment = False
+    yield integration
+    integration.close()
+
+
+def test_documents_processed_concurrently_with_backpressure(integration):
+    uploads = make_uploads(6)
+    events = []
+
+    processed = asyncio.run(integration._process_documents_etl(uploads, 'TestBank'))
+    assert len(processed) == sum(range(1, 7)) + 2
+    assert set(processed['source_file']) == {upload.name for upload in uploads[:-1]}
+
+    results = integration.process_documents_sync(uploads, 'TestBank', progress_callback=events.append)
+    assert results['processing_summary']['total_records'] == len(processed)
+
+    assert max(event['in_flight_documents'] for event in events) <= 2
+    document_status = {event['document']: event['status'] for event in events if event['stage'] == 'document'}
+    assert document_status.pop('notes.docx') == 'skipped'
+    assert set(document_status.values()) == {'completed'}
+
+    parsed = [event for event in events if event['stage'] == 'parsing' and event['status'] == 'completed']
+    assert sorted(event['records'] for event in parsed) == sorted(list(range(1, 7)) + [2])
+    assert events[-1]['stage'] == 'pipeline' and events[-1]['progress'] == 1.0
+    assert all(a['progress'] <= b['progress'] for a, b in zip(events, events[1:]))
+
+
+def test_cancellation_stops_in_flight_documents(integration, monkeypatch):
+    uploads = make_uploads(20)
+    events = []
+
+    async def run():
+        # CPU stages block until cancelled, so exactly max_in_flight_documents are in flight
+        entered, gate = [], asyncio.Event()
+        all_in_flight = asyncio.Event()
+
+        async def blocked_stage(func, *args):
+            entered.append(func)
+            if len(entered) == integration.max_in_flight_documents:
+                all_in_flight.set()
+            await gate.wait()
+
+        monkeypatch.setattr(integration, '_run_cpu_stage', blocked_stage)
+        task = asyncio.ensure_future(integration.process_documents_async(uploads, 'TestBank', events.append))
+        await asyncio.wait_for(all_in_flight.wait(), timeout=30)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert len(entered) == integration.max_in_flight_documents
+
+    asyncio.run(run())
+    assert events[-1]['stage'] == 'pipeline' and events[-1]['status'] == 'cancelled'
+    finished = [event for event in events if event['stage'] == 'document' and event['status'] != 'started']
+    assert [event['status'] for event in finished] == ['cancelled'] * integration.max_in_flight_documents
+    assert not any(event['stage'] == 'parsing' and event['status'] == 'completed' for event in events)
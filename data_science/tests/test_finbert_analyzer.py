@@ -0,0 +1,259 @@
+"""
+Tests for FinBERT batching, backends, sharded inference and lexicon features
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import yaml
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.append(str(Path(__file__).parent.parent / 'scripts'))
+
+pytest.importorskip('torch')
+pytest.importorskip('transformers')
+
+from sentiment_analysis.finbert_analyzer import FinBERTAnalyzer, ONNXFinBERTBackend, plan_token_batches
+
+SAMPLE_TEXTS = [
+    "Net interest income rose 12% year on year, driven by strong loan growth.",
+    "Our CET1 ratio strengthened to 14.2%, well above regulatory requirements.",
+    "Credit impairment charges increased sharply on deteriorating exposures.",
+    "Trading revenues declined as market volatility reduced client activity.",
+    "We recorded a significant loss on the disposal of the lending portfolio.",
+    "The board will meet next month to review the dividend policy.",
+    "I will now hand over to our Chief Financial Officer.",
+    "Costs may rise, and we are probably facing pressure on margins.",
+    "",
+    "Robust, stable and improving capital position despite the challenging outlook!",
+]
+
+
+@pytest.fixture(scope='module')
+def tiny_model_config(tmp_path_factory):
+    """
+    Config for a small randomly initialised BERT classifier saved locally,
+    standing in for FinBERT so tests need no model download
+    """
+    from transformers import BertConfig, BertForSequenceClassification, BertTokenizer
+    import torch
+
+    directory = tmp_path_factory.mktemp('tiny_finbert')
+    words = sorted({w.strip('.,%!').lower() for text in SAMPLE_TEXTS for w in text.split()} - {''})
+    vocab = ['[PAD]', '[UNK]', '[CLS]', '[SEP]', '[MASK]'] + words + list('abcdefghijklmnopqrstuvwxyz0123456789.,%!')
+    (directory / 'vocab.txt').write_text('\n'.join(vocab))
+
+    torch.manual_seed(0)
+    labels = ['positive', 'negative', 'neutral']
+    model = BertForSequenceClassification(BertConfig(
+        vocab_size=len(vocab), hidden_size=32, num_hidden_layers=2, num_attention_heads=2,
+        intermediate_size=64, initializer_range=0.2, num_labels=3,
+        id2label=dict(enumerate(labels)), label2id={label: i for i, label in enumerate(labels)}
+    ))
+    model_path = directory / 'model'
+    model.save_pretrained(model_path)
+    BertTokenizer(str(directory / 'vocab.txt')).save_pretrained(model_path)
+
+    config_path = directory / 'config.yaml'
+    config_path.write_text(yaml.safe_dump({'sentiment_analysis': {
+        'model_name': str(model_path),
+        'models_path': str(directory / 'models'),
+        'use_gpu': False,
+        'max_batch_tokens': 64,
+        'inference_workers': 1,
+    }}))
+    return config_path
+
+
+@pytest.fixture(scope='module')
+def analyzer(tiny_model_config):
+    return FinBERTAnalyzer(str(tiny_model_config))
+
+
+def check_plan(lengths, batches, max_batch_tokens, max_batch_size=None):
+    """Every text is planned exactly once and every batch respects the limits"""
+    planned = np.concatenate(batches) if batches else np.empty(0, dtype=np.int64)
+    assert np.array_equal(np.sort(planned), np.arange(len(lengths)))
+
+    for batch in batches:
+        assert len(batch) > 0
+        padded_tokens = len(batch) * max(int(lengths[batch].max()), 1)
+        assert padded_tokens <= max_batch_tokens or len(batch) == 1
+        if max_batch_size is not None:
+            assert len(batch) <= max_batch_size
+
+
+@pytest.mark.parametrize('max_batch_tokens,max_batch_size', [
+    (64, None), (64, 3), (512, None), (512, 5), (7, None), (10_000, 1)
+])
+def test_plan_token_batches_limits(max_batch_tokens, max_batch_size):
+    rng = np.random.default_rng(3)
+    lengths = rng.integers(1, 300, 500)
+
+    batches = plan_token_batches(lengths, max_batch_tokens, max_batch_size)
+
+    check_plan(lengths, batches, max_batch_tokens, max_batch_size)
+
+
+def test_plan_token_batches_sorted_by_length():
+    lengths = np.array([40, 5, 40, 12, 5, 300, 12, 1])
+
+    batches = plan_token_batches(lengths, max_batch_tokens=48)
+
+    check_plan(lengths, batches, 48)
+    # Batches follow ascending length, stable for equal lengths
+    assert [b.tolist() for b in batches] == [[7, 1, 4, 3], [6], [0], [2], [5]]
+
+
+def test_plan_token_batches_oversized_texts_get_their_own_batch():
+    lengths = np.array([600, 10, 700, 10])
+
+    batches = plan_token_batches(lengths, max_batch_tokens=100)
+
+    check_plan(lengths, batches, 100)
+    assert [b.tolist() for b in batches] == [[1, 3], [0], [2]]
+
+
+def test_plan_token_batches_edge_cases():
+    assert plan_token_batches(np.array([], dtype=np.int64), 64) == []
+
+    # Zero lengths count as one token
+    batches = plan_token_batches(np.zeros(10, dtype=np.int64), 4)
+    check_plan(np.zeros(10, dtype=np.int64), batches, 4)
+    assert [len(b) for b in batches] == [4, 4, 2]
+
+
+def test_onnx_backend_within_documented_tolerance(analyzer):
+    pytest.importorskip('onnxruntime')
+    pytest.importorskip('onnx')
+
+    labels = ['positive'] * 2 + ['negative'] * 3 + ['neutral'] * 5
+    report = analyzer.compare_backends(SAMPLE_TEXTS, labels)
+
+    assert report['sample_size'] == len(SAMPLE_TEXTS)
+    assert report['label_agreement'] >= ONNXFinBERTBackend.MIN_LABEL_AGREEMENT
+    assert report['mean_probability_difference'] <= ONNXFinBERTBackend.MAX_MEAN_PROBABILITY_DIFFERENCE
+    assert report['within_tolerance']
+    assert {'pytorch_accuracy', 'onnx_accuracy'} <= set(report)
+
+    # The quantised model is cached and its predictions are probability vectors
+    backend = analyzer._get_onnx_backend()
+    assert backend.model_path.name == 'model.int8.onnx' and backend.model_path.exists()
+    for prediction in backend.predict(SAMPLE_TEXTS[:3]):
+        assert [item['label'] for item in prediction] == ['positive', 'negative', 'neutral']
+        assert sum(item['score'] for item in prediction) == pytest.approx(1.0, abs=1e-5)
+
+
+def test_pytorch_backend_scores_every_label(analyzer):
+    results = analyzer.analyze_sentiment(SAMPLE_TEXTS)
+
+    assert len(results) == len(SAMPLE_TEXTS)
+    for result in results:
+        probabilities = [result[f'sentiment_{label}'] for label in ['positive', 'negative', 'neutral']]
+        assert sum(probabilities) == pytest.approx(1.0, abs=1e-5)
+        assert result['sentiment_score'] == max(probabilities)
+
+
+def test_sharded_inference_matches_serial(analyzer):
+    texts = [f"{text} Item {i}." if text else text for i, text in enumerate(SAMPLE_TEXTS * 3)]
+
+    serial = analyzer.analyze_sentiment(texts)
+    sharded = analyzer.analyze_sentiment_sharded(texts, n_workers=2)
+
+    assert len(sharded) == len(serial) == len(texts)
+    for sharded_result, serial_result in zip(sharded, serial):
+        assert sharded_result.keys() == serial_result.keys()
+        assert sharded_result['sentiment_label'] == serial_result['sentiment_label']
+        for key, value in serial_result.items():
+            if key != 'sentiment_label':
+                # Workers pad differently sized batches, so allow float noise
+                assert sharded_result[key] == pytest.approx(value, abs=1e-5), key
+
+
+def test_analyze_texts_shards_from_threshold(analyzer, monkeypatch):
+    calls = []
+    monkeypatch.setattr(analyzer, 'inference_workers', 2)
+    monkeypatch.setattr(analyzer, 'sharding_threshold', 5)
+    monkeypatch.setattr(analyzer, 'analyze_sentiment_sharded', lambda texts: calls.append('sharded') or [])
+    monkeypatch.setattr(analyzer, 'analyze_sentiment', lambda texts: calls.append('serial') or [])
+    monkeypatch.setattr('torch.cuda.is_available', lambda: False)
+
+    analyzer._analyze_texts(SAMPLE_TEXTS[:4])
+    analyzer._analyze_texts(SAMPLE_TEXTS[:5])
+    monkeypatch.setattr(analyzer, 'inference_workers', 1)
+    analyzer._analyze_texts(SAMPLE_TEXTS)
+
+    assert calls == ['serial', 'sharded', 'serial']
+
+
+def test_analyze_dataframe_sharded_keeps_row_order(analyzer, monkeypatch):
+    df = pd.DataFrame({'text': SAMPLE_TEXTS * 2 + [None]})
+    serial = analyzer.analyze_dataframe(df)
+
+    monkeypatch.setattr(analyzer, 'inference_workers', 2)
+    monkeypatch.setattr(analyzer, 'sharding_threshold', 1)
+    sharded = analyzer.analyze_dataframe(df)
+
+    assert sharded['sentiment_label'].tolist() == serial['sentiment_label'].tolist()
+    np.testing.assert_allclose(sharded['sentiment_positive'], serial['sentiment_positive'], atol=1e-5)
+    np.testing.assert_allclose(sharded['stress_score'], serial['stress_score'])
+
+
+@pytest.fixture
+def lexicon_analyzer():
+    """Analyzer with the configured lexicons and no model loaded"""
+    lexicon_analyzer = FinBERTAnalyzer.__new__(FinBERTAnalyzer)
+    lexicon_analyzer._load_risk_lexicons()
+    return lexicon_analyzer
+
+
+LEXICON_TEXTS = SAMPLE_TEXTS + [
+    # Overlapping terms: potential/potentially, stress in two families, kind of/of
+    "Potentially stressed, the stress may be somewhat kind of unclear.",
+    "The mayor could SHOULD would, approximately around about roughly!",
+    "Notwithstanding the aforementioned, pursuant to policy, therefore strong.",
+    "   ",
+    "worsening\nissue\tconcern problem challenge... resilient? healthy!",
+    "aboutaround robustrobust",
+]
+
+
+def test_lexicon_features_match_per_text_analysis(lexicon_analyzer):
+    features = lexicon_analyzer.lexicon_features(LEXICON_TEXTS)
+
+    assert list(features.columns) == FinBERTAnalyzer.LEXICON_FEATURES
+    assert len(features) == len(LEXICON_TEXTS)
+    for row, text in zip(features.to_dict('records'), LEXICON_TEXTS):
+        expected = {**lexicon_analyzer._analyze_tone(text), **lexicon_analyzer._analyze_risk_language(text)}
+        for name in FinBERTAnalyzer.LEXICON_FEATURES:
+            assert row[name] == pytest.approx(expected[name]), (text, name)
+
+
+def test_lexicon_features_count_overlapping_and_repeated_terms(lexicon_analyzer):
+    lexicon_analyzer.hedging_language = ['potential', 'potentially', 'ally', 'tent', 'potential']
+    lexicon_analyzer.uncertainty_markers = ['ten', 'potentially']
+    texts = ['potentially', 'potential', 'tally', 'ten potential cases', '']
+
+    features = lexicon_analyzer.lexicon_features(texts)
+
+    # Substring hits, with a term listed twice in a family counted twice
+    assert (features['hedging_score'] * [1, 1, 1, 3, 1]).tolist() == pytest.approx([5, 3, 1, 3, 0])
+    assert (features['uncertainty_score'] * [1, 1, 1, 3, 1]).tolist() == pytest.approx([2, 1, 0, 1, 0])
+    for row, text in zip(features.to_dict('records'), texts):
+        expected = lexicon_analyzer._analyze_tone(text)
+        assert row['hedging_score'] == pytest.approx(expected['hedging_score'])
+        assert row['uncertainty_score'] == pytest.approx(expected['uncertainty_score'])
+
+
+def test_term_presence_matches_substring_checks(lexicon_analyzer):
+    terms = ['risk', 'risky', 'isk', 'credit risk', 'k', 'edit', '', 'kind of', 'it r']
+    texts = ['credit risky', 'RISK', 'risk', 'kredit', '', 'no match here', 'cred\x00it',
+             'kind  of', 'kind of', 'kind\tof', 'a kind of credit risk']
+
+    presence = lexicon_analyzer.term_presence(texts, terms, chunk_size=3)
+
+    assert presence.shape == (len(texts), len(terms))
+    expected = np.array([[term in text for term in terms] for text in texts], dtype=float)
+    np.testing.assert_array_equal(presence.toarray(), expected)
@@ -0,0 +1,137 @@
+"""
+Tests for vectorised seed topic scoring and assignment
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.append(str(Path(__file__).parent.parent / 'scripts'))
+
+pytest.importorskip('bertopic')
+pytest.importorskip('sentence_transformers')
+
+from topic_modeling.hybrid_topic_engine import HybridTopicEngine
+
+# Two identical topics tie on every sentence; the first listed must win
+TIE_TOPICS = {
+    'liquidity_a': {
+        'keywords': {'primary': ['liquidity', 'funding', 'deposit'], 'secondary': ['outflow', 'buffer']},
+        'weight': 1.0, 'min_confidence': 0.3
+    },
+    'liquidity_b': {
+        'keywords': {'primary': ['liquidity', 'funding', 'deposit'], 'secondary': ['outflow', 'buffer']},
+        'weight': 1.0, 'min_confidence': 0.3
+    },
+    # Repeated and shared keywords, and a keyword that cannot match a \w+ token
+    'capital': {
+        'keywords': {'primary': ['capital', 'capital', 'cet1', 'buffer'], 'secondary': ['tier', 'leverage-ratio']},
+        'weight': 0.8, 'min_confidence': 0.2
+    },
+}
+
+TEXTS = [
+    'Liquidity and funding remained strong despite deposit outflow.',
+    'Capital capital CET1 buffer and tier ratios improved.',
+    'Liquidity buffer and capital buffer with funding and CET1 capital.',
+    'The loan book saw higher credit provisions and impairment on the mortgage portfolio.',
+    'Cyber fraud incidents and operational disruption increased.',
+    'Nothing about any seed topic here.',
+    '',
+    '   ',
+    'funding',
+    'Leverage-ratio tier capital',
+    'Credit credit credit default default',
+    'Market volatility, trading losses and interest rate hedging.',
+]
+
+
+def make_engine(seed_topics, seed_threshold=3):
+    """Engine with only the seed topic state (no embedding or BERTopic model)"""
+    engine = HybridTopicEngine.__new__(HybridTopicEngine)
+    engine.seed_topics = seed_topics
+    engine.seed_threshold = seed_threshold
+    engine.processing_stats = {'seed_assigned': 0}
+    engine._build_seed_keyword_matrix()
+    return engine
+
+
+@pytest.fixture(params=['configured', 'ties'])
+def engine(request):
+    if request.param == 'ties':
+        return make_engine(TIE_TOPICS, seed_threshold=2)
+    configured = HybridTopicEngine.__new__(HybridTopicEngine)
+    return make_engine(configured._load_seed_topics())
+
+
+def reference_assignment(engine, sentences):
+    """Per-document assignment with ``_calculate_best_seed_topic``"""
+    rows = []
+    for _, row in sentences.iterrows():
+        topic, score, confidence = engine._calculate_best_seed_topic(str(row.get('text', '')).lower())
+        assigned = bool(topic) and confidence >= engine.seed_topics[topic]['min_confidence']
+        rows.append((topic, score, confidence, assigned))
+    return rows
+
+
+def test_score_seed_topics_matches_per_document_scoring(engine):
+    texts = [text.lower() for text in TEXTS]
+
+    scores = engine.score_seed_topics(texts)
+
+    assert len(scores) == len(texts)
+    for row, text in zip(scores.to_dict('records'), texts):
+        topic, score, confidence = engine._calculate_best_seed_topic(text)
+        assert row['topic_seed'] == topic, text
+        assert row['topic_score'] == score
+        assert row['topic_confidence'] == pytest.approx(confidence, abs=1e-12)
+
+
+def test_score_seed_topics_breaks_ties_on_topic_order():
+    engine = make_engine(TIE_TOPICS, seed_threshold=2)
+
+    scores = engine.score_seed_topics(['liquidity funding outflow', 'deposit buffer funding'])
+
+    assert scores['topic_seed'].tolist() == ['liquidity_a', 'liquidity_a']
+    assert engine._calculate_best_seed_topic('liquidity funding outflow')[0] == 'liquidity_a'
+
+
+def test_score_seed_topics_without_hits():
+    engine = make_engine(TIE_TOPICS, seed_threshold=2)
+
+    # A single secondary keyword scores 1, below the threshold of 2
+    scores = engine.score_seed_topics(['', 'no keywords here', 'outflow'])
+
+    assert scores['topic_seed'].tolist() == [None, None, None]
+    assert scores['topic_score'].tolist() == [0.0, 0.0, 0.0]
+    assert scores['topic_confidence'].tolist() == [0.0, 0.0, 0.0]
+    assert not scores['assigned'].any()
+
+
+def test_assign_seed_topics_matches_per_document_assignment(engine):
+    sentences = pd.DataFrame({
+        'text': TEXTS + [None],
+        'sentence_id': np.arange(len(TEXTS) + 1) * 10,
+    }, index=np.arange(len(TEXTS) + 1)[::-1])
+
+    seed_df, remaining_df = engine.assign_seed_topics(sentences)
+    expected = reference_assignment(engine, sentences)
+
+    assigned_ids = [sid for sid, (_, _, _, assigned) in zip(sentences['sentence_id'], expected) if assigned]
+    assert seed_df.get('sentence_id', pd.Series(dtype=int)).tolist() == assigned_ids
+    assert remaining_df.get('sentence_id', pd.Series(dtype=int)).tolist() == [
+        sid for sid in sentences['sentence_id'] if sid not in assigned_ids
+    ]
+    assert engine.processing_stats['seed_assigned'] == len(assigned_ids)
+
+    expected_assigned = [row for row in expected if row[3]]
+    if expected_assigned:
+        assert seed_df['topic_seed'].tolist() == [topic for topic, _, _, _ in expected_assigned]
+        assert seed_df['topic_score'].tolist() == [score for _, score, _, _ in expected_assigned]
+        np.testing.assert_allclose(seed_df['topic_confidence'], [c for _, _, c, _ in expected_assigned])
+        assert (seed_df['topic_type'] == 'seed').all()
+        # Original index labels are kept
+        assert seed_df.index.tolist() == sentences.index[[row[3] for row in expected]].tolist()
@@ -0,0 +1,115 @@
+"""
+Tests for the batched contradiction and hedging analysis in QuoteAnalyzer
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# The emerging_topics package imports plotly for its dashboards
+pytest.importorskip('plotly')
+
+sys.path.append(str(Path(__file__).parent.parent / 'scripts'))
+
+from emerging_topics.quote_analyzer import QuoteAnalyzer
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return QuoteAnalyzer()
+
+
+@pytest.fixture(scope='module')
+def texts():
+    rng = np.random.default_rng(7)
+    phrases = [
+        'not a major concern', 'limited impact', 'well positioned', 'under control', 'may impact',
+        'subject to market conditions', 'market conditions are uncertain', 'industry wide challenge',
+        'all banks face', 'while we monitor', 'we are monitoring risk', 'opportunity', 'committed',
+        'progress', 'volatile', 'assessing', 'the', 'and'
+    ]
+    return pd.Series(
+        [' '.join(rng.choice(phrases, rng.integers(1, 10))).capitalize() for _ in range(2000)] + [None, ''],
+        index=np.arange(2002) * 3 + 1
+    )
+
+
+def test_batch_matches_single_quote_analysis(analyzer, texts):
+    batch = analyzer.analyze_contradiction_batch(texts)
+    assert batch.index.equals(texts.index)
+
+    for label, text in texts.fillna('').items():
+        expected = analyzer._analyze_single_quote_contradiction({'text': text})
+        row = batch.loc[label]
+        for key, value in expected.items():
+            assert row[key] == value
+        for family in ['downplaying', 'hedging', 'deflection']:
+            lowered = text.lower()
+            assert [lowered[start:end] for start, end in row[f'{family}_spans']] == row[f'{family}_matches']
+
+
+def test_contradictory_sentiment_uses_batch(analyzer):
+    quotes = analyzer._generate_sample_climate_quotes()
+    analysis = analyzer.analyze_contradictory_sentiment(quotes)
+
+    batch = analyzer.analyze_contradiction_batch([quote['text'] for quote in quotes])
+    total = batch[['downplaying_count', 'hedging_count', 'deflection_count']].to_numpy().sum()
+    assert analysis['contradiction_score'] == pytest.approx(min(1.0, total / len(quotes)))
+    assert analysis['downplaying_indicators'] == [m for matches in batch['downplaying_matches'] for m in matches]
+    assert set(analysis['detailed_analysis']) == {quote['quote_id'] for quote in quotes}
+
+
+def test_index_reused_for_the_same_frame():
+    analyzer = QuoteAnalyzer()
+    data = pd.DataFrame({'text': ['Credit risk is under control', 'We are monitoring risk'],
+                         'speaker_norm': ['CEO', 'CFO']})
+    index = analyzer._get_index(data)
+    assert analyzer._get_index(data) is index
+    assert analyzer._get_index(None) is index
+
+    # Another frame is indexed again, even with equal content
+    copy = data.copy()
+    assert analyzer._get_index(copy) is not index
+
+    changed = data.assign(text=['Credit risk is rising', 'We are monitoring risk'])
+    assert analyzer._get_index(changed) is not index
+    assert analyzer.search_quotes(changed, keyword='rising')['text'].tolist() == ['Credit risk is rising']
+
+
+def test_index_rebuilt_when_frame_layout_changes():
+    analyzer = QuoteAnalyzer()
+    data = pd.DataFrame({'text': ['Credit risk is under control', 'We are monitoring risk']})
+    index = analyzer._get_index(data)
+
+    data['speaker_norm'] = ['CEO', 'CFO']
+    with_speaker = analyzer._get_index(data)
+    assert with_speaker is not index
+    assert analyzer.search_quotes(data, speaker='cfo')['text'].tolist() == ['We are monitoring risk']
+
+    data.loc[2] = ['Liquidity risk is rising', 'CEO']
+    assert analyzer._get_index(data) is not with_speaker
+    assert analyzer.search_quotes(data, keyword='liquidity')['text'].tolist() == ['Liquidity risk is rising']
+
+
+def test_in_place_value_edits_need_build_index():
+    analyzer = QuoteAnalyzer()
+    data = pd.DataFrame({'text': ['Credit risk is under control', 'We are monitoring risk']})
+    analyzer._get_index(data)
+
+    data.loc[0, 'text'] = 'Credit risk is rising'
+    assert analyzer.search_quotes(data, keyword='rising').empty
+
+    analyzer.build_index(data)
+    assert analyzer.search_quotes(data, keyword='rising')['text'].tolist() == ['Credit risk is rising']
+
+
+def test_loaded_index_is_used_without_data(tmp_path):
+    data = pd.DataFrame({'text': ['Credit risk is under control', 'We are monitoring risk']})
+    QuoteAnalyzer().build_index(data).save(tmp_path / 'quotes.joblib')
+
+    analyzer = QuoteAnalyzer()
+    loaded = analyzer.load_index(tmp_path / 'quotes.joblib')
+    assert analyzer._get_index(None) is loaded
+    assert analyzer._get_index(data) is not loaded
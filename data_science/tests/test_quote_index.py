@@ -0,0 +1,116 @@
+"""
+Tests for the QuoteIndex inverted index and positional context windows
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add emerging topics directory to path (the package imports plotly)
+sys.path.append(str(Path(__file__).parent.parent / 'scripts' / 'emerging_topics'))
+
+from quote_index import QuoteIndex
+
+
+@pytest.fixture(scope='module')
+def sentences():
+    rng = np.random.default_rng(11)
+    words = ['climate', 'risk', 'credit', 'we', 'are', 'monitoring', 'net', 'zero', 'capital', 'exposure']
+    n = 3000
+    df = pd.DataFrame({
+        'text': [' '.join(rng.choice(words, rng.integers(3, 12))).capitalize() for _ in range(n)],
+        'call_id': rng.choice(['JPM_Q1', 'JPM_Q2', 'HSBC_Q1', 'UBS_Q4'], n),
+        'sentence_id': rng.permutation(n),
+        'speaker_norm': rng.choice(['CEO', 'CFO', 'Analyst', None], n),
+        'primary_topic': rng.choice(['Climate Risk', 'Credit Risk', 'Capital', None], n),
+    })
+    # Shuffled, non-default index labels
+    return df.set_index(np.arange(n) * 5 + 3)
+
+
+@pytest.fixture(scope='module')
+def index(sentences):
+    return QuoteIndex(sentences)
+
+
+def test_filters_match_dataframe_scans(index, sentences):
+    topic = index.search(topic='climate', limit=None)
+    assert set(topic.index) == set(sentences.index[sentences['primary_topic'].str.contains('climate', case=False, na=False)])
+
+    phrase = index.search(keyword='Net Zero', speaker='cfo', limit=None)
+    expected = sentences['text'].str.lower().str.contains('net zero') & (sentences['speaker_norm'] == 'CFO')
+    assert set(phrase.index) == set(sentences.index[expected])
+
+    with pytest.raises(ValueError):
+        index.query()
+
+
+def test_ranking_is_bm25_ordered(index):
+    results = index.search(keyword='monitoring', limit=50)
+    assert len(results) == 50
+    assert results['score'].is_monotonic_decreasing
+    assert (results['score'] > 0).all()
+
+    # Top-k selection agrees with ranking all matches
+    everything = index.search(keyword='monitoring', limit=None)
+    assert results.index.equals(everything.index[:50])
+
+
+def test_postings_and_context_follow_call_order(index, sentences):
+    # Calls in order of first appearance, sentences by sentence_id
+    call_order = pd.factorize(sentences['call_id'])[0]
+    ordered = sentences.assign(call_order=call_order).sort_values(['call_order', 'sentence_id'])
+    calls = ordered['call_id'].to_numpy()
+    texts = ordered['text'].to_numpy()
+
+    for position in [0, 1, 500, len(ordered) - 1]:
+        before = index.context(position, -1)
+        after = index.context(position, 1)
+        assert index.texts[position] == texts[position]
+        assert before == (texts[position - 1] if position > 0 and calls[position - 1] == calls[position] else None)
+        assert after == (texts[position + 1] if position + 1 < len(texts) and calls[position + 1] == calls[position] else None)
+
+    pairs = index.postings('zero')
+    mask = ordered['text'].str.lower().str.split().apply(lambda tokens: 'zero' in tokens)
+    assert pairs == list(zip(ordered.loc[mask, 'call_id'], ordered.loc[mask, 'sentence_id']))
+
+
+def test_save_and_load(index, tmp_path):
+    path = tmp_path / 'quote_index.joblib'
+    index.save(path)
+    loaded = QuoteIndex.load(path)
+    pd.testing.assert_frame_equal(loaded.search(keyword='capital exposure'), index.search(keyword='capital exposure'))
+
+
+def test_phrase_needs_adjacent_tokens_and_searchable_keyword():
+    index = QuoteIndex(pd.DataFrame({
+        'text': ['Our risk-appetite is unchanged', 'Risk and appetite both rose', 'Appetite for risk fell', None],
+        'call_id': ['A', 'A', 'B', 'B'],
+    }))
+    assert index.search(keyword='risk appetite', limit=None)['text'].tolist() == ['Our risk-appetite is unchanged']
+
+    positions, scores = index.query(keyword='!!!')
+    assert len(positions) == 0 and len(scores) == 0
+
+
+def test_phrase_positions_match_token_scan(index, sentences):
+    ordered_tokens = pd.Series(index.texts, dtype=object).str.lower().str.findall(QuoteIndex.TOKEN_PATTERN)
+    for phrase in ['net zero', 'credit risk exposure', 'we are monitoring risk', 'zero net zero', 'risk risk']:
+        terms = phrase.split()
+        expected = [
+            position for position, tokens in enumerate(ordered_tokens)
+            if any(tokens[i:i + len(terms)] == terms for i in range(len(tokens) - len(terms) + 1))
+        ]
+        assert index._phrase_positions(terms).tolist() == expected
+
+
+def test_phrase_does_not_span_sentences():
+    index = QuoteIndex(pd.DataFrame({
+        'text': ['Capital is strong and credit', 'Risk exposure fell', 'Credit risk exposure rose'],
+        'call_id': ['A', 'A', 'A'],
+        'sentence_id': [0, 1, 2],
+    }))
+    assert index.search(keyword='credit risk exposure', limit=None)['text'].tolist() == ['Credit risk exposure rose']
+    assert index.search(keyword='credit risk', limit=None)['sentence_id'].tolist() == [2]
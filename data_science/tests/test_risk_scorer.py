@@ -0,0 +1,191 @@
+"""
+Parity tests for the vectorised RiskScorer components
+
+The reference functions below are the original row-by-row implementations;
+the vectorised scorer must reproduce their outputs.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.append(str(Path(__file__).parent.parent / 'scripts'))
+
+from statistical_analysis.risk_scorer import RiskScorer
+
+
+def reference_topic_risk(scorer, df):
+    topic_risk = pd.Series(0.0, index=df.index)
+    for idx, topic in df['final_topic'].items():
+        topic_weight = scorer.topic_risk_weights.get(str(topic).lower(), 0.2)
+        base_risk = topic_weight * 0.6
+        confidence = df.loc[idx, 'topic_confidence']
+        if not pd.isna(confidence):
+            base_risk += confidence * 0.4 if topic_weight > 0.7 else confidence * 0.2
+        topic_risk.loc[idx] = min(base_risk, 1.0)
+    return topic_risk
+
+
+def reference_speaker_risk(scorer, df):
+    speaker_risk = pd.Series(0.0, index=df.index)
+    base_sentiment_risk = scorer.calculate_sentiment_risk(df)
+    for idx, speaker in df['speaker_norm'].items():
+        speaker_risk.loc[idx] = base_sentiment_risk.loc[idx] * scorer.speaker_weights.get(str(speaker), 0.1)
+    return speaker_risk
+
+
+def reference_temporal_risk(df):
+    temporal_risk = pd.Series(0.0, index=df.index)
+    for institution in df['bank'].unique():
+        inst_data = df[df['bank'] == institution]
+        if len(inst_data) < 2:
+            continue
+        for quarter in inst_data['quarter'].unique():
+            quarter_data = inst_data[inst_data['quarter'] == quarter]
+            if quarter_data['sentiment_negative'].mean() > inst_data['sentiment_negative'].mean() * 1.2:
+                temporal_risk.loc[quarter_data.index] += 0.3
+            if quarter_data['risk_escalation_score'].mean() > inst_data['risk_escalation_score'].mean() * 1.5:
+                temporal_risk.loc[quarter_data.index] += 0.4
+    sorted_quarters = sorted(df['quarter'].unique())
+    if len(sorted_quarters) > 1:
+        for i, quarter in enumerate(sorted_quarters):
+            temporal_risk.loc[df['quarter'] == quarter] += (i + 1) / len(sorted_quarters) * 0.3
+    return np.clip(temporal_risk, 0, 1)
+
+
+def reference_volatility_risk(df):
+    volatility_risk = pd.Series(0.0, index=df.index)
+    for institution in df['bank'].unique():
+        inst_data = df[df['bank'] == institution]
+        if len(inst_data) < 3:
+            continue
+        total_volatility, valid_metrics = 0, 0
+        for metric in ['sentiment_negative', 'risk_escalation_score', 'stress_score']:
+            metric_values = inst_data[metric].dropna()
+            if len(metric_values) >= 3:
+                total_volatility += metric_values.std() / (metric_values.mean() + 0.001)
+                valid_metrics += 1
+        if valid_metrics > 0:
+            volatility_risk.loc[inst_data.index] = min(total_volatility / valid_metrics / 2.0, 1.0)
+    return volatility_risk
+
+
+def reference_categories(scorer, scores):
+    thresholds = scorer.risk_thresholds
+    return [
+        'low' if s <= thresholds['low'] else
+        'medium' if s <= thresholds['medium'] else
+        'high' if s <= thresholds['high'] else 'critical'
+        for s in scores
+    ]
+
+
+@pytest.fixture(scope='module')
+def scorer():
+    return RiskScorer()
+
+
+@pytest.fixture(scope='module')
+def sample_df():
+    rng = np.random.default_rng(42)
+    n = 2000
+    df = pd.DataFrame({
+        'bank': rng.choice(['JPM', 'HSBC', 'Barclays', 'UBS', None], n, p=[0.3, 0.3, 0.2, 0.15, 0.05]),
+        'quarter': rng.choice(['Q1_2024', 'Q2_2024', 'Q3_2024', 'Q4_2024'], n),
+        'final_topic': rng.choice(['credit_risk', 'Market_Risk', 'esg_sustainability', 'other', None], n),
+        'topic_confidence': np.where(rng.random(n) < 0.1, np.nan, rng.random(n)),
+        'speaker_norm': rng.choice(['CEO', 'CFO', 'Analyst', 'Unknown speaker'], n),
+        'sentiment_negative': np.where(rng.random(n) < 0.05, np.nan, rng.random(n)),
+        'risk_escalation_score': rng.normal(0.05, 0.1, n),
+        'stress_score': rng.random(n) * 0.2,
+        'confidence_score': rng.random(n),
+    })
+    # Single-row institution, and a shuffled non-default index
+    df.loc[0, 'bank'] = 'Solo'
+    return df.sample(frac=1, random_state=1).set_index(np.arange(n) * 3)
+
+
+def test_topic_risk_parity(scorer, sample_df):
+    pd.testing.assert_series_equal(scorer.calculate_topic_risk(sample_df), reference_topic_risk(scorer, sample_df))
+
+
+def test_speaker_risk_parity(scorer, sample_df):
+    pd.testing.assert_series_equal(scorer.calculate_speaker_risk(sample_df), reference_speaker_risk(scorer, sample_df))
+
+
+def test_temporal_risk_parity(scorer, sample_df):
+    pd.testing.assert_series_equal(
+        scorer.calculate_temporal_risk(sample_df), reference_temporal_risk(sample_df), rtol=0, atol=1e-12
+    )
+
+
+def test_volatility_risk_parity(scorer, sample_df):
+    pd.testing.assert_series_equal(
+        scorer.calculate_volatility_risk(sample_df), reference_volatility_risk(sample_df), rtol=0, atol=1e-12
+    )
+
+
+def test_risk_category_parity(scorer, sample_df):
+    result = scorer.calculate_composite_risk_score(sample_df)
+    assert result['risk_category'].tolist() == reference_categories(scorer, result['risk_score'])
+    assert result.index.equals(sample_df.index)
+
+
+def test_running_statistics_merge():
+    from statistical_analysis.risk_state import RunningStats, QuantileSketch
+    rng = np.random.default_rng(0)
+    values = rng.normal(2.0, 3.0, 5000)
+    stats = RunningStats()
+    for chunk in np.array_split(values, 7):
+        stats.update(chunk)
+    assert stats.count == len(values)
+    assert np.isclose(stats.mean, values.mean())
+    assert np.isclose(stats.std(), values.std(ddof=1))
+
+    sketch = QuantileSketch(k=200)
+    for chunk in np.array_split(values, 20):
+        sketch.update(chunk)
+    assert sketch.count == len(values)
+    assert np.allclose(sketch.rank(np.quantile(values, [0.1, 0.5, 0.9])), [0.1, 0.5, 0.9], atol=0.02)
+
+
+def test_incremental_matches_full_recompute(scorer, sample_df, tmp_path):
+    state_path = tmp_path / 'state.json'
+    history = sample_df[sample_df['quarter'] != 'Q4_2024']
+    new_quarter = sample_df[sample_df['quarter'] == 'Q4_2024']
+
+    scorer.calculate_incremental_risk_score(history, state_path=state_path)
+    incremental = scorer.calculate_incremental_risk_score(new_quarter, state_path=state_path)
+    full = scorer.calculate_composite_risk_score(sample_df).loc[new_quarter.index]
+
+    for component in ['risk_temporal', 'risk_volatility', 'risk_sentiment', 'risk_topic']:
+        pd.testing.assert_series_equal(incremental[component], full[component], rtol=0, atol=1e-9)
+    assert incremental['risk_percentile'].isna().equals(incremental['risk_score'].isna())
+    assert incremental['risk_percentile'].dropna().between(0, 1).all()
+
+
+def test_rescoring_a_quarter_replaces_its_statistics(scorer, sample_df, tmp_path):
+    from statistical_analysis.risk_state import RiskScoringState
+    history = sample_df[sample_df['quarter'] != 'Q4_2024']
+    new_quarter = sample_df[sample_df['quarter'] == 'Q4_2024']
+
+    once, twice = RiskScoringState(), RiskScoringState()
+    scorer.calculate_incremental_risk_score(history, state=once, save_state=False)
+    scorer.calculate_incremental_risk_score(new_quarter, state=once, save_state=False)
+    scorer.calculate_incremental_risk_score(history, state=twice, save_state=False)
+    scorer.calculate_incremental_risk_score(new_quarter, state=twice, save_state=False)
+    scorer.calculate_incremental_risk_score(history, state=twice, state_path=tmp_path / 'state.json')
+    twice = RiskScoringState.load(tmp_path / 'state.json')
+
+    assert twice.score_sketch.count == once.score_sketch.count
+    assert twice.quarters == once.quarters
+    for bank in sample_df['bank'].dropna().unique():
+        assert twice.institution_rows(bank) == once.institution_rows(bank)
+        for metric in RiskScoringState.TRACKED_METRICS:
+            assert twice.institution_stats(bank, metric).count == once.institution_stats(bank, metric).count
+            assert np.isclose(twice.institution_stats(bank, metric).mean, once.institution_stats(bank, metric).mean)
+            assert np.isclose(twice.quarter_mean(bank, 'Q1_2024', metric), once.quarter_mean(bank, 'Q1_2024', metric),
+                              equal_nan=True)
@@ -0,0 +1,87 @@
+"""
+Parity tests for the batched StatisticalSignificanceTester APIs
+
+Each batch result must match the corresponding scipy test run topic by topic.
+"""
+
+import pytest
+import numpy as np
+from scipy import stats
+import sys
+from pathlib import Path
+
+# Add emerging topics directory to path (the package imports plotly)
+sys.path.append(str(Path(__file__).parent.parent / 'scripts' / 'emerging_topics'))
+
+from statistical_significance import StatisticalSignificanceTester
+
+
+@pytest.fixture(scope='module')
+def tester():
+    return StatisticalSignificanceTester()
+
+
+@pytest.fixture(scope='module')
+def groups():
+    rng = np.random.default_rng(3)
+    recent = [rng.integers(0, 6, rng.integers(1, 30)).astype(float) for _ in range(200)]
+    historical = [rng.integers(0, 6, rng.integers(1, 30)).astype(float) for _ in range(200)]
+    return recent, historical
+
+
+def test_frequency_change_batch_matches_scipy(tester, groups):
+    recent, historical = groups
+    result = tester.test_frequency_change_batch(recent, historical)
+
+    for i, (x, y) in enumerate(zip(recent, historical)):
+        if len(x) < 2 or len(y) < 2:
+            assert result['p_value'][i] == 1.0 and result['statistic'][i] == 0.0
+            continue
+        expected = stats.mannwhitneyu(x, y, alternative='two-sided', method='asymptotic')
+        assert result['statistic'][i] == pytest.approx(expected.statistic)
+        assert result['p_value'][i] == pytest.approx(expected.pvalue, rel=1e-9)
+        assert result['effect_size'][i] == pytest.approx(abs(1 - 2 * expected.statistic / (len(x) * len(y))))
+
+
+@pytest.mark.parametrize('equal_var', [False, True])
+def test_sentiment_change_batch_matches_scipy(tester, groups, equal_var):
+    recent, historical = groups
+    recent = [x / 5 for x in recent]
+    result = tester.test_sentiment_change_batch(recent, historical, equal_var=equal_var)
+
+    for i, (x, y) in enumerate(zip(recent, historical)):
+        if len(x) < 2 or len(y) < 2:
+            assert result['p_value'][i] == 1.0
+            continue
+        expected = stats.ttest_ind(x, y, equal_var=equal_var)
+        assert result['statistic'][i] == pytest.approx(expected.statistic, nan_ok=True)
+        assert result['p_value'][i] == pytest.approx(expected.pvalue, rel=1e-9, nan_ok=True)
+        assert result['effect_size'][i] == pytest.approx(tester._calculate_cohens_d(list(x), list(y)))
+
+
+def test_speaker_pattern_change_batch_matches_single(tester):
+    rng = np.random.default_rng(5)
+    speakers = ['CEO', 'CFO', 'CRO', 'Analyst']
+    recent = [list(rng.choice(speakers[:rng.integers(1, 5)], rng.integers(0, 60))) for _ in range(100)]
+    historical = [list(rng.choice(speakers[:rng.integers(1, 5)], rng.integers(0, 60))) for _ in range(100)]
+
+    tables, labels = tester.speaker_contingency(recent, historical)
+    assert tables.shape == (100, 2, len(labels))
+    result = tester.test_speaker_pattern_change_batch(tables)
+
+    for i, (x, y) in enumerate(zip(recent, historical)):
+        expected = tester.test_speaker_pattern_change(x, y)
+        assert result['p_value'][i] == pytest.approx(expected['p_value'], rel=1e-9)
+        assert result['statistic'][i] == pytest.approx(expected['statistic'], rel=1e-9)
+        assert result['effect_size'][i] == pytest.approx(expected['effect_size'], rel=1e-9)
+        assert result['degrees_of_freedom'][i] == expected.get('degrees_of_freedom', 0)
+
+
+def test_multiple_testing_correction(tester):
+    p_values = [0.01, 0.04, 0.03, 0.2, 0.005]
+    bh = tester.multiple_testing_correction(p_values, method='fdr_bh')['corrected_p_values']
+    assert bh == pytest.approx(stats.false_discovery_control(p_values, method='bh'))
+
+    holm = tester.multiple_testing_correction(p_values, method='holm')['corrected_p_values']
+    # statsmodels.stats.multitest.multipletests(p_values, method='holm')
+    assert holm == pytest.approx([0.04, 0.09, 0.09, 0.2, 0.025])
@@ -0,0 +1,94 @@
+"""
+Tests for streaming statistical validation
+
+Chunked and merged accumulators must reproduce the in-memory validation
+report (exactly while the scores fit the reservoir).
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+from scipy import stats
+
+# Add scripts directory to path
+sys.path.append(str(Path(__file__).parent.parent / 'scripts'))
+
+from statistical_validation.statistical_validation_engine import StatisticalValidationEngine
+from statistical_validation.streaming import StreamingMoments, StreamingValidationAccumulator
+
+
+def flatten(report, prefix=''):
+    values = {}
+    for key, value in report.items():
+        if isinstance(value, dict):
+            values.update(flatten(value, f'{prefix}{key}.'))
+        elif key != 'validation_timestamp':
+            values[prefix + key] = value
+    return values
+
+
+@pytest.fixture(scope='module')
+def scores():
+    return np.random.default_rng(1).beta(2, 5, 3000)
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return StatisticalValidationEngine(n_resamples=2000)
+
+
+def test_chunked_report_matches_in_memory(engine, scores):
+    expected = flatten(engine.run_comprehensive_validation(scores, bootstrap_method='bca'))
+    streamed = flatten(engine.run_streaming_validation(np.array_split(scores, 7), bootstrap_method='bca'))
+
+    assert streamed.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, (float, np.floating)):
+            assert streamed[key] == pytest.approx(value, rel=1e-9, abs=1e-12, nan_ok=True), key
+        elif isinstance(value, list):
+            np.testing.assert_allclose(streamed[key], value, rtol=1e-9)
+        else:
+            assert streamed[key] == value, key
+
+
+def test_merged_moments_match_scipy(scores):
+    moments = StreamingMoments()
+    for chunk in np.array_split(scores, 5):
+        part = StreamingMoments()
+        part.update(chunk)
+        moments.merge(part)
+
+    assert moments.mean == pytest.approx(scores.mean())
+    assert moments.std(ddof=1) == pytest.approx(scores.std(ddof=1))
+    assert moments.skewness() == pytest.approx(stats.skew(scores))
+    assert moments.kurtosis() == pytest.approx(stats.kurtosis(scores, fisher=False))
+    assert moments.normaltest() == pytest.approx(tuple(stats.normaltest(scores)))
+
+
+def test_sketch_beyond_reservoir(engine):
+    scores = np.random.default_rng(2).beta(2, 5, 200000)
+    summary = StreamingValidationAccumulator(reservoir_size=5000)
+    for chunk in np.array_split(scores, 20):
+        summary.update(chunk)
+
+    assert not summary.is_exact
+    np.testing.assert_allclose(summary.percentile([25, 50, 75]), np.percentile(scores, [25, 50, 75]), atol=5e-3)
+    assert summary.range_mean(40000, 80000) == pytest.approx(scores[40000:80000].mean(), abs=1e-4)
+
+    report = engine.run_streaming_validation(summary)
+    assert report['confidence_intervals']['mean_estimate'] == pytest.approx(scores.mean())
+    assert report['parameters']['n_scores'] == len(scores)
+
+
+@pytest.mark.parametrize('scores', [np.full(10, np.nan), np.array([])])
+def test_no_valid_scores_reports_insufficient_data(engine, scores):
+    report = engine.run_comprehensive_validation(scores)
+
+    assert report['parameters']['n_scores'] == len(scores)
+    assert 'Insufficient data - no valid risk scores to validate' in report['data_quality']['recommendations']
+    assert np.isnan(report['confidence_intervals']['mean_estimate'])
+    assert report['confidence_intervals']['bootstrap_ci'] is None
+    assert np.isnan(report['model_performance']['mse'])
+    assert np.isnan(report['hypothesis_testing']['primary_test']['p_value'])
+    assert report['confidence_assessment']['level'] == 'Low'
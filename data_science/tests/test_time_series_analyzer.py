@@ -0,0 +1,97 @@
+"""
+Parity tests for the TimeSeriesAnalyzer panel mode
+
+analyze_panel must reproduce the per-institution detect_trends,
+detect_seasonality and detect_anomalies results.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.append(str(Path(__file__).parent.parent / 'scripts'))
+
+from statistical_analysis.time_series_analyzer import TimeSeriesAnalyzer
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return TimeSeriesAnalyzer()
+
+
+@pytest.fixture(scope='module')
+def ts_data(analyzer):
+    rng = np.random.default_rng(7)
+    quarters = [f'Q{q}_{y}' for y in range(2020, 2024) for q in range(1, 5)]
+    frames = []
+    for i, bank in enumerate(['JPM', 'HSBC', 'Barclays', 'UBS', 'Short', 'Flat']):
+        bank_quarters = quarters[:2] if bank == 'Short' else quarters[i % 3:]
+        for quarter in bank_quarters:
+            n = 20
+            frame = pd.DataFrame({
+                'bank': bank,
+                'quarter': quarter,
+                'sentiment_negative': rng.random(n) + (0.5 if quarter.startswith('Q4') else 0.0),
+                'sentiment_positive': rng.random(n),
+                'risk_escalation_score': rng.normal(0.05 * len(frames), 0.1, n),
+                'stress_score': 0.1 if bank == 'Flat' else rng.random(n),
+                'confidence_score': rng.random(n),
+            })
+            for column in ['sentiment_neutral', 'sentiment_confidence', 'hedging_score',
+                           'uncertainty_score', 'formality_score', 'complexity_score']:
+                frame[column] = rng.random(n)
+            if rng.random() < 0.15:
+                frame['confidence_score'] = np.nan
+            frames.append(frame)
+    df = pd.concat(frames, ignore_index=True)
+    df.loc[df['bank'] == 'UBS', 'risk_escalation_score'] = df.loc[df['bank'] == 'UBS', 'risk_escalation_score'] * 0 + 0.01
+    df.loc[(df['bank'] == 'UBS') & (df['quarter'] == 'Q2_2022'), 'risk_escalation_score'] = 5.0
+    return analyzer.prepare_time_series_data(df)
+
+
+def test_panel_matches_per_institution(analyzer, ts_data):
+    panel = analyzer.analyze_panel(ts_data).set_index(['bank', 'metric'])
+
+    for bank in ts_data['bank'].unique():
+        trends = analyzer.detect_trends(ts_data, bank, analyzer.KEY_METRICS)
+        seasonality = analyzer.detect_seasonality(ts_data, bank, analyzer.KEY_METRICS)
+        anomalies = analyzer.detect_anomalies(ts_data, bank, analyzer.KEY_METRICS)
+
+        for metric in [m for m in analyzer.KEY_METRICS if m in ts_data.columns]:
+            row = panel.loc[(bank, metric)]
+            if metric not in trends:
+                assert np.isnan(row['slope'])
+                assert metric not in anomalies
+            else:
+                expected = trends[metric]
+                for key in ['slope', 'r_squared', 'p_value', 'trend_strength', 'recent_change_pct',
+                            'current_value', 'mean_value', 'std_value']:
+                    assert row[key] == pytest.approx(expected[key], rel=1e-9, abs=1e-12, nan_ok=True), (bank, metric, key)
+                assert row['trend_direction'] == expected['trend_direction']
+                assert row['is_significant'] == expected['is_significant']
+
+                expected = anomalies[metric]
+                assert row['total_anomalies'] == expected['total_anomalies'], (bank, metric)
+                assert row['anomaly_rate'] == pytest.approx(expected['anomaly_rate'])
+                assert row['iqr_lower'] == pytest.approx(expected['iqr_bounds']['lower'])
+                assert row['iqr_upper'] == pytest.approx(expected['iqr_bounds']['upper'])
+
+            if metric in seasonality:
+                expected = seasonality[metric]
+                assert row['f_statistic'] == pytest.approx(expected['f_statistic'], rel=1e-9, nan_ok=True)
+                assert row['seasonal_p_value'] == pytest.approx(expected['p_value'], rel=1e-9, nan_ok=True)
+                assert row['peak_quarter'] == expected['peak_quarter']
+                assert row['trough_quarter'] == expected['trough_quarter']
+                assert row['seasonal_amplitude'] == pytest.approx(expected['seasonal_amplitude'])
+            else:
+                assert np.isnan(row['f_statistic'])
+
+
+def test_panel_flags_injected_anomaly(analyzer, ts_data):
+    panel = analyzer.analyze_panel(ts_data).set_index(['bank', 'metric'])
+    row = panel.loc[('UBS', 'risk_escalation_score_mean')]
+    assert row['total_anomalies'] >= 1
+    assert row['latest_anomaly_date'] == pd.Timestamp('2022-04-01')
@@ -0,0 +1,174 @@
+"""
+Tests for corpus topic coherence and its per-measure thresholds
+"""
+
+import pytest
+import math
+import numpy as np
+import yaml
+import sys
+from pathlib import Path
+
+# Add topic modeling directory to path (the package imports BERTopic)
+sys.path.append(str(Path(__file__).parent.parent / 'scripts' / 'topic_modeling'))
+
+import coherence as coherence_module
+from coherence import TopicCoherence
+
+CONFIG_PATH = Path(__file__).parent.parent / 'config' / 'risk_monitoring_config.yaml'
+
+THEMES = {
+    'capital': ['capital', 'ratio', 'buffer', 'tier', 'requirement', 'surplus'],
+    'credit': ['loan', 'losses', 'provision', 'impairment', 'default', 'arrears'],
+    'climate': ['climate', 'transition', 'emissions', 'carbon', 'net', 'zero'],
+}
+FILLER = ['quarter', 'year', 'group', 'business', 'expect', 'continue', 'level', 'strong']
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    rng = np.random.default_rng(0)
+    texts = []
+    for _ in range(600):
+        theme = THEMES[rng.choice(list(THEMES))]
+        words = list(rng.choice(theme, 4, replace=False)) + list(rng.choice(FILLER, 3))
+        texts.append(' '.join(rng.permutation(words)))
+    return texts
+
+
+@pytest.fixture(scope='module')
+def thresholds():
+    with open(CONFIG_PATH) as f:
+        config = yaml.safe_load(f)['topic_modeling']
+    return {**TopicCoherence.DEFAULT_THRESHOLDS, **config.get('coherence_thresholds', {})}
+
+
+@pytest.mark.parametrize('measure', ['npmi', 'umass'])
+def test_coherent_topics_pass_configured_threshold(corpus, thresholds, measure):
+    topics = {i: words for i, words in enumerate(THEMES.values())}
+    scores = TopicCoherence().score(topics, key='corpus', texts=corpus, measure=measure)
+
+    kept = [topic_id for topic_id, score in scores.items() if score >= thresholds[measure]]
+    assert len(kept) >= 1
+    if measure == 'umass':
+        assert thresholds['umass'] < 0 and max(scores.values()) <= 0
+
+
+def test_npmi_threshold_rejects_mixed_topics(corpus, thresholds):
+    # Words drawn across themes rarely co-occur
+    mixed = {0: ['capital', 'loan', 'climate', 'ratio', 'losses', 'carbon']}
+    scores = TopicCoherence().score(mixed, key='corpus', texts=corpus, measure='npmi')
+    assert scores[0] < thresholds['npmi']
+
+
+# Small corpus for hand-computed scores: document frequencies capital 3,
+# ratio 2, loan 2, buffer 1, losses 1 over 4 documents
+SMALL_CORPUS = ['capital ratio buffer', 'capital ratio', 'capital loan', 'loan losses']
+
+
+def small_coherence():
+    return TopicCoherence(ngram_range=(1, 1), stop_words=None, min_df=1)
+
+
+def hand_npmi(joint, df_first, df_second, n_docs=4, epsilon=1e-12):
+    p_joint = (joint + epsilon) / n_docs
+    return math.log(p_joint / (df_first / n_docs * df_second / n_docs)) / -math.log(p_joint)
+
+
+def test_npmi_matches_hand_computation():
+    topics = {0: ['capital', 'ratio', 'buffer'], 1: ['capital', 'losses'], 2: ['loan', 'unseen']}
+
+    scores = small_coherence().score(topics, key='small', texts=SMALL_CORPUS, measure='npmi')
+
+    # Pairs (capital, ratio), (capital, buffer), (ratio, buffer)
+    assert hand_npmi(2, 3, 2) == pytest.approx(math.log(4 / 3) / math.log(2), rel=1e-9)
+    assert hand_npmi(1, 2, 1) == pytest.approx(0.5, rel=1e-9)
+    expected = (hand_npmi(2, 3, 2) + hand_npmi(1, 3, 1) + hand_npmi(1, 2, 1)) / 3
+    assert scores[0] == pytest.approx(expected, rel=1e-9)
+    assert scores[0] == pytest.approx(0.374185, abs=1e-6)
+    # Words that never co-occur tend to -1
+    assert scores[1] == pytest.approx(hand_npmi(0, 3, 1), rel=1e-9)
+    assert scores[1] < -0.9
+    # Fewer than two words in the vocabulary
+    assert scores[2] == 0.0
+
+
+def test_umass_matches_hand_computation():
+    topics = {0: ['capital', 'ratio', 'buffer'], 1: ['capital', 'losses'], 2: ['buffer', 'capital']}
+
+    scores = small_coherence().score(topics, key='small', texts=SMALL_CORPUS, measure='umass')
+
+    # log((D(earlier, later) + 1) / D(earlier)) averaged over ranked pairs
+    assert scores[0] == pytest.approx((math.log(3 / 3) + math.log(2 / 3) + math.log(2 / 2)) / 3, rel=1e-9)
+    assert scores[1] == pytest.approx(math.log(1 / 3), rel=1e-9)
+    # Conditioning on the earlier-ranked word makes UMass order dependent
+    assert scores[2] == pytest.approx(math.log(2 / 1), rel=1e-9)
+
+
+@pytest.fixture
+def vectorizer_builds(monkeypatch):
+    """Count how often corpus statistics are built from scratch"""
+    builds = []
+    original = coherence_module.CountVectorizer
+
+    def counting_vectorizer(*args, **kwargs):
+        builds.append(kwargs)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(coherence_module, 'CountVectorizer', counting_vectorizer)
+    return builds
+
+
+def test_second_score_reuses_cached_statistics(vectorizer_builds):
+    coherence = small_coherence()
+    topics = {0: ['capital', 'ratio', 'buffer']}
+
+    assert not coherence.has_statistics('q1')
+    first = coherence.score(topics, key='q1', texts=SMALL_CORPUS)
+    assert coherence.has_statistics('q1')
+    stats = coherence.fit(key='q1')
+
+    # Same corpus passed again, and the corpus omitted, both reuse the statistics
+    assert coherence.score(topics, key='q1', texts=list(SMALL_CORPUS)) == first
+    assert coherence.score(topics, key='q1', measure='umass') != first
+    assert coherence.score(topics, key='q1') == first
+    assert coherence.fit(key='q1') is stats
+    assert len(vectorizer_builds) == 1
+
+    # A different corpus under another key is built separately
+    coherence.score(topics, key='q2', texts=SMALL_CORPUS[:3])
+    assert coherence.has_statistics('q1') and coherence.has_statistics('q2')
+    assert len(vectorizer_builds) == 2
+
+
+def test_clear_cache_forces_rebuild(vectorizer_builds):
+    coherence = small_coherence()
+    topics = {0: ['capital', 'ratio', 'buffer']}
+    first = coherence.score(topics, key='q1', texts=SMALL_CORPUS)
+    coherence.score(topics, key='q2', texts=SMALL_CORPUS)
+    stats = coherence.fit(key='q1')
+
+    coherence.clear_cache('q1')
+
+    assert not coherence.has_statistics('q1')
+    assert coherence.has_statistics('q2')
+    with pytest.raises(ValueError):
+        coherence.score(topics, key='q1')
+
+    assert coherence.score(topics, key='q1', texts=SMALL_CORPUS) == first
+    assert coherence.fit(key='q1') is not stats
+    assert len(vectorizer_builds) == 3
+
+    coherence.clear_cache()
+    assert not coherence.has_statistics('q1') and not coherence.has_statistics('q2')
+
+
+def test_changed_corpus_under_same_key_is_rebuilt(vectorizer_builds):
+    coherence = small_coherence()
+    topics = {0: ['capital', 'ratio']}
+
+    before = coherence.score(topics, key='q1', texts=SMALL_CORPUS)
+    after = coherence.score(topics, key='q1', texts=SMALL_CORPUS + ['ratio losses'])
+
+    assert len(vectorizer_builds) == 2
+    assert after[0] != before[0]
@@ -0,0 +1,104 @@
+"""
+Parity tests for the pivot-based EmergingTopicsEngine
+
+The reference function below is the original per-topic implementation of
+the trend statistics; the single-pivot engine must reproduce its outputs.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from scipy import stats
+import sys
+from pathlib import Path
+
+# Add emerging topics directory to path (the package imports plotly)
+sys.path.append(str(Path(__file__).parent.parent / 'scripts' / 'emerging_topics'))
+
+from trend_detection_engine import EmergingTopicsEngine
+
+
+def reference_topic_trend(engine, topic, recent_data, historical_data):
+    recent_topic = recent_data[recent_data['primary_topic'] == topic]
+    historical_topic = historical_data[historical_data['primary_topic'] == topic]
+    recent_mentions, historical_mentions = len(recent_topic), len(historical_topic)
+
+    if historical_mentions == 0:
+        growth_rate = 500.0 if recent_mentions > 0 else 0.0
+        confidence_interval = [max(0, growth_rate - 50), growth_rate + 50]
+    else:
+        growth_rate = ((recent_mentions - historical_mentions) / historical_mentions) * 100
+        recent_ci = stats.poisson.interval(0.95, recent_mentions)
+        historical_ci = stats.poisson.interval(0.95, historical_mentions)
+        confidence_interval = [
+            round(((recent_ci[0] - historical_ci[1]) / historical_mentions) * 100, 1),
+            round(((recent_ci[1] - historical_ci[0]) / historical_mentions) * 100, 1)
+        ]
+
+    recent_sentiment = recent_topic['sentiment_score'].mean() if recent_mentions else 0.5
+    historical_sentiment = historical_topic['sentiment_score'].mean() if historical_mentions else 0.5
+
+    sent_p_value = 1.0
+    recent_scores = recent_topic['sentiment_score'].dropna()
+    historical_scores = historical_topic['sentiment_score'].dropna()
+    if recent_mentions > 1 and historical_mentions > 1 and len(recent_scores) > 1 and len(historical_scores) > 1:
+        sent_p_value = stats.ttest_ind(recent_scores, historical_scores).pvalue
+    p_value = min(2.0, sent_p_value * 2, 1.0)
+
+    speakers = recent_topic['speaker_norm'].value_counts().head(5).index.tolist()
+    return {
+        'recent_mentions': recent_mentions,
+        'historical_mentions': historical_mentions,
+        'growth_rate': round(growth_rate, 1),
+        'recent_sentiment': round(recent_sentiment, 3),
+        'historical_sentiment': round(historical_sentiment, 3),
+        'sentiment_change': round(recent_sentiment - historical_sentiment, 3),
+        'speakers': [s for s in speakers if s not in ['Unknown', '']],
+        'confidence_interval': confidence_interval,
+        'p_value': round(p_value, 4),
+        'is_significant': p_value < engine.significance_threshold
+    }
+
+
+@pytest.fixture(scope='module')
+def sample_df():
+    rng = np.random.default_rng(7)
+    n = 4000
+    topics = [f'Topic {i} risk' for i in range(12)] + ['Cyber Security', 'Unknown', 'Other', None]
+    df = pd.DataFrame({
+        'text': 'statement',
+        'quarter': rng.choice([f'Q{q}_{y}' for y in (2023, 2024) for q in range(1, 5)], n),
+        'speaker_norm': rng.choice(['CEO', 'CFO', 'Analyst', 'Unknown', '', None], n),
+        'primary_topic': rng.choice(topics, n, p=rng.dirichlet(np.ones(len(topics)))),
+        'sentiment_score': np.where(rng.random(n) < 0.2, np.nan, rng.random(n).round(1)),
+    })
+    # Constant sentiment, and a topic that only appears in recent quarters
+    df.loc[df['primary_topic'] == 'Topic 0 risk', 'sentiment_score'] = 0.5
+    df.loc[(df['primary_topic'] == 'Topic 1 risk') & df['quarter'].str.endswith('2023'), 'primary_topic'] = 'Topic 2 risk'
+    return df
+
+
+def test_topic_trends_match_per_topic_reference(sample_df):
+    engine = EmergingTopicsEngine()
+    recent_quarters, historical_quarters = engine._segment_quarters(sample_df)
+    recent_data, historical_data = engine._segment_temporal_data(sample_df)
+    topics = engine._extract_unique_topics(sample_df)
+
+    analyses = engine._analyze_topic_trends(sample_df, topics, recent_quarters, historical_quarters)
+
+    assert list(analyses) == topics
+    for topic in topics:
+        expected = reference_topic_trend(engine, topic, recent_data, historical_data)
+        actual = {key: analyses[topic][key] for key in expected}
+        assert actual == pytest.approx(expected, nan_ok=True), topic
+
+
+def test_detect_emerging_topics_keeps_significant(sample_df):
+    engine = EmergingTopicsEngine({'significance_threshold': 0.5})
+    result = engine.detect_emerging_topics(sample_df)
+
+    assert 'note' not in result
+    assert all(topic['is_significant'] for topic in result['emerging_topics'].values())
+    recent_quarters, _ = engine._segment_quarters(sample_df)
+    assert result['analysis_summary']['analysis_period']['total_recent_records'] == \
+        sample_df['quarter'].isin(recent_quarters).sum()
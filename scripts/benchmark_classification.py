@@ -0,0 +1,98 @@
+"""Benchmark batch financial classification against the per-record path."""
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'boe-etl-nlp'))
+
+from boe_etl_nlp.analytics.classification import FinancialClassifier
+
+SAMPLE_WORDS = (
+    "earnings call presentation revenue risk credit risk tier 1 capital ratio "
+    "basel cash flow balance sheet total assets strategy guidance outlook "
+    "net income operating income market risk liquidity the and we our quarter"
+).split()
+
+SAMPLE_FILES = ['', 'Q1_2025_earnings_call.pdf', 'results_presentation.pdf', 'press_release.txt']
+
+
+def print_header(text):
+    """Print a formatted header."""
+    print("\n" + "=" * 50)
+    print(f" {text} ")
+    print("=" * 50)
+
+
+def make_records(n_records, seed=0):
+    """Generate synthetic transcript records."""
+    rng = random.Random(seed)
+    return [
+        {
+            'text': ' '.join(rng.choices(SAMPLE_WORDS, k=rng.randint(5, 40))),
+            'source_file': rng.choice(SAMPLE_FILES)
+        }
+        for _ in range(n_records)
+    ]
+
+
+def classify_per_record(classifier, records):
+    """Reference path: the three per-record classifiers on every record."""
+    results = []
+    for record in records:
+        text = record.get('text', '')
+        filename = record.get('source_file', '')
+        doc_type = classifier.classify_document_type(text, filename)
+        content_category = classifier.classify_content_category(text)
+        statement_type = classifier.classify_financial_statement_type(text)
+        results.append((
+            doc_type['document_type'],
+            content_category['primary_category'],
+            statement_type['statement_type']
+        ))
+    return results
+
+
+def timed(func, *args, **kwargs):
+    """Run a function and return (result, seconds)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=100000, help='Number of records')
+    args = parser.parse_args()
+
+    classifier = FinancialClassifier()
+    records = make_records(args.records)
+
+    print_header(f"CLASSIFICATION BENCHMARK ({args.records:,} records)")
+    reference, per_record_time = timed(classify_per_record, classifier, records)
+    batch, batch_time = timed(classifier.classify_batch, records)
+    columns, columns_time = timed(
+        classifier.classify_columns,
+        [r['text'] for r in records],
+        [r['source_file'] for r in records]
+    )
+
+    matches = all(
+        (b['document_type'], b['content_category'], b['statement_type']) == r
+        for b, r in zip(batch, reference)
+    )
+
+    for name, seconds in [
+        ('per-record', per_record_time),
+        ('classify_batch', batch_time),
+        ('classify_columns', columns_time),
+    ]:
+        print(f"{name:<18} {seconds:8.3f}s  {args.records / seconds:12,.0f} records/s  "
+              f"x{per_record_time / seconds:.1f}")
+    print(f"Results identical: {matches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Compare the PyTorch and quantised ONNX FinBERT backends for accuracy and throughput."""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'data_science' / 'scripts'))
+
+from sentiment_analysis.finbert_analyzer import FinBERTAnalyzer
+
+# Small labelled sample used when no --sample file is given
+DEFAULT_SAMPLE = [
+    ("Net interest income rose 12% year on year, driven by strong loan growth.", "positive"),
+    ("Our CET1 ratio strengthened to 14.2%, well above regulatory requirements.", "positive"),
+    ("Fee income was robust across wealth management and investment banking.", "positive"),
+    ("We delivered record revenues and improved our return on tangible equity.", "positive"),
+    ("Credit impairment charges increased sharply on deteriorating commercial real estate exposures.", "negative"),
+    ("Trading revenues declined as market volatility reduced client activity.", "negative"),
+    ("We recorded a significant loss on the disposal of the consumer lending portfolio.", "negative"),
+    ("Non-performing loans rose for the third consecutive quarter.", "negative"),
+    ("The board will meet next month to review the dividend policy.", "neutral"),
+    ("Slides for today's presentation are available on our investor relations website.", "neutral"),
+    ("The results cover the three months ended 31 March.", "neutral"),
+    ("I will now hand over to our Chief Financial Officer.", "neutral"),
+]
+
+
+def print_header(text):
+    """Print a formatted header."""
+    print("\n" + "=" * 50)
+    print(f" {text} ")
+    print("=" * 50)
+
+
+def load_sample(path):
+    """Load a labelled sample with 'text' and 'label' columns."""
+    if path is None:
+        return [t for t, _ in DEFAULT_SAMPLE], [l for _, l in DEFAULT_SAMPLE]
+    sample = pd.read_csv(path) if str(path).endswith('.csv') else pd.read_parquet(path)
+    return sample['text'].astype(str).tolist(), sample['label'].astype(str).tolist()
+
+
+def main():
+    """Run the parity check and throughput benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sample', help='CSV or Parquet file with text and label columns')
+    parser.add_argument('--repeat', type=int, default=50,
+                        help='Times the sample is repeated for the throughput run')
+    args = parser.parse_args()
+
+    texts, labels = load_sample(args.sample)
+    analyzer = FinBERTAnalyzer()
+
+    print_header(f"ACCURACY PARITY ({len(texts)} labelled texts)")
+    for key, value in analyzer.compare_backends(texts, labels).items():
+        print(f"{key:<30} {value}")
+
+    print_header(f"THROUGHPUT ({len(texts) * args.repeat:,} texts)")
+    workload = texts * args.repeat
+    timings = {}
+    for backend in ['pytorch', 'onnx']:
+        analyzer.backend = backend
+        start = time.perf_counter()
+        analyzer.analyze_sentiment(workload)
+        timings[backend] = time.perf_counter() - start
+        print(f"{backend:<10} {timings[backend]:8.2f}s  {len(workload) / timings[backend]:10,.1f} texts/s")
+    print(f"ONNX speedup: x{timings['pytorch'] / timings['onnx']:.2f}")
+
+
+if __name__ == '__main__':
+    main()
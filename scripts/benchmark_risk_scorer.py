@@ -0,0 +1,67 @@
+"""Benchmark RiskScorer components on a large synthetic transcript frame."""
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'data_science' / 'scripts'))
+
+from statistical_analysis.risk_scorer import RiskScorer
+
+BANKS = ['JPMorgan', 'BankOfAmerica', 'Citigroup', 'WellsFargo', 'HSBC', 'Barclays', 'UBS', 'DeutscheBank']
+QUARTERS = [f'Q{q}_{y}' for y in range(2020, 2025) for q in range(1, 5)]
+TOPICS = ['credit_risk', 'market_risk', 'operational_risk', 'regulatory_risk',
+          'liquidity_risk', 'esg_sustainability', 'miscellaneous']
+SPEAKERS = ['CEO', 'CFO', 'CRO', 'Analyst', 'UNKNOWN']
+
+
+def print_header(text):
+    """Print a formatted header."""
+    print("\n" + "=" * 50)
+    print(f" {text} ")
+    print("=" * 50)
+
+
+def make_frame(n_rows, seed=0):
+    """Generate a synthetic sentence-level risk frame."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'bank': rng.choice(BANKS, n_rows),
+        'quarter': rng.choice(QUARTERS, n_rows),
+        'final_topic': rng.choice(TOPICS, n_rows),
+        'topic_confidence': rng.random(n_rows),
+        'speaker_norm': rng.choice(SPEAKERS, n_rows),
+        'sentiment_negative': rng.random(n_rows),
+        'risk_escalation_score': rng.normal(0.05, 0.1, n_rows),
+        'stress_score': rng.random(n_rows) * 0.2,
+        'uncertainty_score': rng.random(n_rows) * 0.2,
+        'confidence_score': rng.random(n_rows),
+    })
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Number of rows')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    scorer = RiskScorer()
+    df = make_frame(args.rows)
+
+    print_header(f"RISK SCORER BENCHMARK ({args.rows:,} rows)")
+    for name in ['calculate_sentiment_risk', 'calculate_topic_risk', 'calculate_speaker_risk',
+                 'calculate_temporal_risk', 'calculate_anomaly_risk', 'calculate_volatility_risk',
+                 'calculate_composite_risk_score']:
+        start = time.perf_counter()
+        getattr(scorer, name)(df)
+        seconds = time.perf_counter() - start
+        print(f"{name:<32} {seconds:8.3f}s  {args.rows / seconds:14,.0f} rows/s")
+
+
+if __name__ == '__main__':
+    main()
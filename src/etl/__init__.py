@@ -15,10 +15,13 @@ from .topic_modeling import get_topic_modeler
 from .metadata import MetadataManager
 from .error_handling import get_exception_handler
 from .progress_tracker import get_progress_tracker
+from .near_duplicates import NearDuplicateIndex
+from .search_index import SentenceSearchIndex, get_search_index
 
 __all__ = [
     'ETLPipeline', 'PDFParser', 'ConfigManager', 'NLPSchema',
     'TextCleaner', 'get_storage_config', 'get_data_version_manager',
     'get_version_tag_manager', 'get_topic_modeler', 'MetadataManager',
-    'get_exception_handler', 'get_progress_tracker'
+    'get_exception_handler', 'get_progress_tracker', 'NearDuplicateIndex',
+    'SentenceSearchIndex', 'get_search_index'
 ]
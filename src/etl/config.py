@@ -86,6 +86,23 @@ class SentimentAnalysisConfig(BaseModel):
     model_name: str = "ProsusAI/finbert"
     batch_size: int = 32
 
+class DeduplicationConfig(BaseModel):
+    """Configuration for near-duplicate (boilerplate) detection"""
+    enabled: bool = True
+    num_perm: int = 128
+    bands: int = 32
+    threshold: float = 0.8  # Minimum estimated Jaccard similarity
+    shingle_size: int = 3
+    min_group_size: int = 2  # Group size at which records count as boilerplate
+    exclude_from_topic_modeling: bool = True  # Keep boilerplate out of BERTopic fitting
+
+class SearchIndexConfig(BaseModel):
+    """Configuration for the full-text sentence search index"""
+    enabled: bool = True
+    db_path: str = "data/search/sentences.db"
+    tokenizer: str = "porter unicode61"  # FTS5 tokenizer specification
+    replace_existing: bool = True  # Re-processing a source document replaces its sentences
+
 class ProcessingConfig(BaseModel):
     """Processing configuration"""
     # Directory settings
@@ -97,6 +114,8 @@ class ProcessingConfig(BaseModel):
     text_cleaning: TextCleaningConfig = Field(default_factory=TextCleaningConfig)
     topic_modeling: TopicModelingConfig = Field(default_factory=TopicModelingConfig)
     sentiment_analysis: SentimentAnalysisConfig = Field(default_factory=SentimentAnalysisConfig)
+    deduplication: DeduplicationConfig = Field(default_factory=DeduplicationConfig)
+    search_index: SearchIndexConfig = Field(default_factory=SearchIndexConfig)
 
 class ConfigError(Exception):
     """Base exception for configuration errors"""
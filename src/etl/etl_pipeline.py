@@ -18,6 +18,8 @@ from .pdf_parser import get_pdf_parser
 from .error_handling import get_exception_handler
 from .progress_tracker import get_progress_tracker
 from .schema_transformer import SchemaTransformer
+from .near_duplicates import NearDuplicateIndex
+from .search_index import get_search_index
 
 # Set up logging
 logging.basicConfig(
@@ -47,6 +49,14 @@ class ETLPipeline:
         self.metadata_manager = MetadataManager()
         self.text_cleaner = TextCleaner()
         
+        # Near-duplicate index for boilerplate tagging (shared by this pipeline's documents)
+        self.dedup_config = self.config.processing.deduplication
+        self.near_duplicate_index = NearDuplicateIndex.from_config(self.dedup_config)
+        
+        # Full-text search index, fed as processed data is stored
+        self.search_config = self.config.processing.search_index
+        self.search_index = get_search_index(self.search_config) if self.search_config.enabled else None
+        
         # Set up data directories from config
         self.raw_data_dir = Path(self.config.processing.raw_data_dir)
         self.processed_data_dir = Path(self.config.processing.processed_data_dir)
@@ -151,6 +161,19 @@ class ETLPipeline:
         
         return cleaned_records
     
+    def _tag_boilerplate(self, cleaned_data: List[Dict], bank_name: str, quarter: str) -> Dict[str, float]:
+        """Tag near-duplicate boilerplate records in place
+        
+        Records are keyed by bank, quarter and source files, so re-processing
+        a document replaces its earlier sentences in the index.
+        """
+        if not self.dedup_config.enabled:
+            return {}
+        source_files = tuple(sorted({str(record.get("file_path", "")) for record in cleaned_data}))
+        return self.near_duplicate_index.tag_records(
+            cleaned_data, document_key=(bank_name, quarter, source_files)
+        )
+    
     def _apply_topic_modeling(
         self,
         cleaned_data: List[Dict],
@@ -158,10 +181,14 @@ class ETLPipeline:
         quarter: str
     ) -> List[Dict]:
         """Apply topic modeling to processed data"""
+        self._tag_boilerplate(cleaned_data, bank_name, quarter)
+        
         processed_data = self.topic_modeler.process_batch(
             cleaned_data,
             bank_name=bank_name,
-            quarter=quarter
+            quarter=quarter,
+            exclude_boilerplate=(self.dedup_config.enabled and
+                                 self.dedup_config.exclude_from_topic_modeling)
         )
         return processed_data
     
@@ -188,6 +215,11 @@ class ETLPipeline:
             "cleaning_parameters": self.text_cleaner.get_parameters()
         }
         
+        # Near-duplicate statistics
+        if "is_boilerplate" in df.columns:
+            metadata["boilerplate_ratio"] = float(df["is_boilerplate"].mean())
+            metadata["dedup_ratio"] = float(df["is_near_duplicate"].mean())
+        
         return metadata
     
     def _store_data(
@@ -218,6 +250,9 @@ class ETLPipeline:
         parquet_path = version_path / "processed_data.parquet"
         df.to_parquet(parquet_path)
         
+        # Make the new sentences searchable
+        self._index_sentences(df, bank_name, quarter, version_id)
+        
         # Store metadata
         metadata_path = version_path / "processing_metadata.json"
         with open(metadata_path, 'w') as f:
@@ -225,6 +260,15 @@ class ETLPipeline:
         
         return version_id
     
+    def _index_sentences(self, df: pd.DataFrame, bank_name: str, quarter: str, version_id: str) -> None:
+        """Add stored sentences to the full-text search index"""
+        if self.search_index is None:
+            return
+        try:
+            self.search_index.add_records(df, bank_name, quarter, version_id=version_id)
+        except Exception as e:
+            logger.error(f"Failed to index sentences for {bank_name} {quarter}: {e}", exc_info=True)
+    
     def _tag_version(self, version_id: str, bank_name: str, quarter: str) -> None:
         """Tag the processed version"""
         self.tag_manager.create_tag(
@@ -0,0 +1,276 @@
+"""
+Near-duplicate detection for boilerplate transcript content.
+
+Operator scripts, safe-harbour statements and legal disclaimers are repeated
+across calls with only dates or figures changed. This module keeps a MinHash
+signature per normalised sentence and uses locality-sensitive hashing (LSH)
+banding to group near-duplicates, so that boilerplate records can be tagged
+after schema transformation and skipped by the more expensive NLP stages.
+"""
+
+import re
+import zlib
+import logging
+from typing import Dict, List, Optional, Any, Tuple, Hashable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Mersenne prime used for the universal hash family; keeps a * x + b inside uint64
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+
+class NearDuplicateIndex:
+    """MinHash/LSH index over normalised sentences.
+
+    Each indexed sentence is assigned to a near-duplicate group. A group whose
+    size reaches ``min_group_size`` is treated as boilerplate; every member
+    after the first is redundant and can reuse the first member's NLP results.
+    Records tagged under a document key replace that document's earlier
+    contribution, so re-processing a document does not inflate group sizes.
+    """
+
+    # Normalisation rules applied in order; figures and dates collapse to tokens
+    _NORMALISATION_PATTERNS = [
+        (re.compile(r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}\b'), ' <date> '),
+        (re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'), ' <date> '),
+        (re.compile(r'\b(?:q[1-4]|[1-4]q)\s*[-_]?\s*(?:\d{4}|\d{2})\b'), ' <quarter> '),
+        (re.compile(r'[$£€]?\d[\d,]*(?:\.\d+)?\s*(?:%|(?:bn|billion|mn|million|m|k|bps)\b)?'), ' <num> '),
+        (re.compile(r'[^\w<>\s]'), ' '),
+        (re.compile(r'\s+'), ' '),
+    ]
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 32,
+        threshold: float = 0.8,
+        shingle_size: int = 3,
+        min_group_size: int = 2,
+        seed: int = 1
+    ):
+        """Initialize the near-duplicate index.
+
+        Args:
+            num_perm: Number of MinHash permutations per signature
+            bands: Number of LSH bands; must divide ``num_perm``
+            threshold: Minimum estimated Jaccard similarity for a match
+            shingle_size: Word n-gram size used for shingling
+            min_group_size: Group size at which members are tagged as boilerplate
+            seed: Seed for the permutation coefficients
+        """
+        if num_perm % bands != 0:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.min_group_size = min_group_size
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+        self._group_signatures: List[np.ndarray] = []
+        self._group_sizes: List[int] = []
+        self._document_groups: Dict[Hashable, List[int]] = {}
+
+    @classmethod
+    def from_config(cls, config: Optional[Any] = None) -> "NearDuplicateIndex":
+        """Create an index from a DeduplicationConfig (defaults if None)."""
+        if config is None:
+            return cls()
+        return cls(
+            num_perm=config.num_perm,
+            bands=config.bands,
+            threshold=config.threshold,
+            shingle_size=config.shingle_size,
+            min_group_size=config.min_group_size
+        )
+
+    def normalise(self, text: str) -> str:
+        """Normalise text so that sentences differing only in dates or figures match.
+
+        Args:
+            text: Raw sentence text
+
+        Returns:
+            Lowercased text with dates, quarters and numbers replaced by placeholders
+        """
+        normalised = str(text).lower()
+        for pattern, replacement in self._NORMALISATION_PATTERNS:
+            normalised = pattern.sub(replacement, normalised)
+        return normalised.strip()
+
+    def _shingles(self, normalised: str) -> np.ndarray:
+        """Hash the word n-gram shingles of a normalised sentence."""
+        tokens = normalised.split()
+        if not tokens:
+            return np.empty(0, dtype=np.uint64)
+
+        if len(tokens) < self.shingle_size:
+            shingles = tokens
+        else:
+            shingles = [
+                ' '.join(tokens[i:i + self.shingle_size])
+                for i in range(len(tokens) - self.shingle_size + 1)
+            ]
+
+        hashes = {zlib.crc32(s.encode('utf-8')) & 0x7FFFFFFF for s in shingles}
+        return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """Compute the MinHash signature of a sentence.
+
+        Args:
+            text: Raw sentence text
+
+        Returns:
+            Signature array of length ``num_perm``, or None for empty text
+        """
+        shingles = self._shingles(self.normalise(text))
+        if shingles.size == 0:
+            return None
+
+        # (num_perm, n_shingles) permuted hashes, minimum over shingles
+        permuted = (np.outer(self._a, shingles) + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """Split a signature into per-band bucket keys."""
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def add(self, text: str) -> Tuple[int, bool]:
+        """Index a sentence and return its near-duplicate group.
+
+        Args:
+            text: Raw sentence text
+
+        Returns:
+            Tuple of (group id, is_first_member). Empty text returns (-1, True);
+            joining a group whose members were all removed counts as first.
+        """
+        signature = self.signature(text)
+        if signature is None:
+            return -1, True
+
+        keys = self._band_keys(signature)
+
+        # Candidate groups share at least one band; verify on full signature
+        candidates = set()
+        for band, key in enumerate(keys):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best_group, best_similarity = -1, 0.0
+        for group_id in candidates:
+            similarity = float(np.mean(self._group_signatures[group_id] == signature))
+            if similarity >= self.threshold and similarity > best_similarity:
+                best_group, best_similarity = group_id, similarity
+
+        if best_group >= 0:
+            is_first = self._group_sizes[best_group] == 0
+            self._group_sizes[best_group] += 1
+            return best_group, is_first
+
+        group_id = len(self._group_signatures)
+        self._group_signatures.append(signature)
+        self._group_sizes.append(1)
+        for band, key in enumerate(keys):
+            self._buckets[band].setdefault(key, []).append(group_id)
+        return group_id, True
+
+    def group_size(self, group_id: int) -> int:
+        """Number of sentences indexed into a group so far."""
+        if group_id < 0:
+            return 0
+        return self._group_sizes[group_id]
+
+    def remove_document(self, document_key: Hashable) -> int:
+        """Remove the sentences previously tagged under a document key.
+
+        Args:
+            document_key: Key passed to ``tag_records``
+
+        Returns:
+            Number of sentences removed
+        """
+        groups = self._document_groups.pop(document_key, [])
+        for group_id in groups:
+            self._group_sizes[group_id] -= 1
+        return len(groups)
+
+    def tag_records(
+        self,
+        records: List[Dict[str, Any]],
+        text_field: str = "text",
+        document_key: Optional[Hashable] = None
+    ) -> Dict[str, float]:
+        """Tag records in place with their near-duplicate group and boilerplate flag.
+
+        Adds ``boilerplate_group``, ``is_boilerplate`` and ``is_near_duplicate``
+        to every record. Groups are shared with sentences indexed by earlier
+        calls, so boilerplate repeated across calls is detected on its second
+        appearance.
+
+        Args:
+            records: NLP schema records, modified in place
+            text_field: Name of the text field
+            document_key: Optional key (e.g. bank, quarter and source file) of the
+                document the records come from; tagging the same key again first
+                removes the document's earlier sentences
+
+        Returns:
+            Dictionary with record counts and the dedup ratio
+        """
+        if document_key is not None:
+            self.remove_document(document_key)
+
+        groups = []
+        for record in records:
+            group_id, is_first = self.add(record.get(text_field, ""))
+            record["boilerplate_group"] = group_id
+            record["is_near_duplicate"] = not is_first
+            groups.append(group_id)
+
+        if document_key is not None:
+            self._document_groups[document_key] = [g for g in groups if g >= 0]
+
+        # Evaluate boilerplate once the whole batch is indexed
+        boilerplate_count = 0
+        for record, group_id in zip(records, groups):
+            is_boilerplate = self.group_size(group_id) >= self.min_group_size
+            record["is_boilerplate"] = is_boilerplate
+            boilerplate_count += is_boilerplate
+
+        duplicate_count = sum(1 for r in records if r["is_near_duplicate"])
+        total = len(records)
+        stats = {
+            "total_records": total,
+            "boilerplate_records": boilerplate_count,
+            "near_duplicate_records": duplicate_count,
+            "boilerplate_ratio": boilerplate_count / total if total else 0.0,
+            "dedup_ratio": duplicate_count / total if total else 0.0,
+        }
+        logger.info(
+            f"Near-duplicate tagging: {boilerplate_count}/{total} boilerplate, "
+            f"dedup ratio {stats['dedup_ratio']:.2%}"
+        )
+        return stats
+
+    def reset(self) -> None:
+        """Clear all indexed sentences."""
+        self._buckets = [{} for _ in range(self.bands)]
+        self._group_signatures = []
+        self._group_sizes = []
+        self._document_groups = {}
+
+    def __len__(self) -> int:
+        return len(self._group_signatures)
+
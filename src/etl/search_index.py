@@ -0,0 +1,348 @@
+"""
+Full-text search over processed sentences.
+
+Every sentence stored by the ETL pipeline is also written to a SQLite
+database with an FTS5 index, so supervisors can search all banks and
+quarters without loading Parquet files. The ``sentences`` table holds the
+text, facet columns (bank, quarter, speaker, topic, sentiment) and the
+source document each sentence came from; the
+``sentences_fts`` virtual table indexes its text as external content and
+is kept in sync by triggers. Matches are ranked with BM25 and returned
+with highlighted snippets.
+"""
+
+import re
+import sqlite3
+import logging
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Sequence, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_QUARTER_PATTERN = re.compile(r'Q([1-4])[\s_-]*(\d{4})', re.IGNORECASE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sentences (
+    rowid INTEGER PRIMARY KEY,
+    text TEXT NOT NULL,
+    bank TEXT,
+    quarter TEXT,
+    speaker TEXT,
+    topic TEXT,
+    sentiment REAL,
+    call_id TEXT,
+    sentence_id TEXT,
+    version_id TEXT,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_sentences_bank_quarter_source ON sentences (bank, quarter, source);
+CREATE INDEX IF NOT EXISTS idx_sentences_quarter ON sentences (quarter);
+CREATE VIRTUAL TABLE IF NOT EXISTS sentences_fts USING fts5(
+    text, content='sentences', content_rowid='rowid', tokenize='{tokenizer}'
+);
+CREATE TRIGGER IF NOT EXISTS sentences_ai AFTER INSERT ON sentences BEGIN
+    INSERT INTO sentences_fts (rowid, text) VALUES (new.rowid, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS sentences_ad AFTER DELETE ON sentences BEGIN
+    INSERT INTO sentences_fts (sentences_fts, rowid, text) VALUES ('delete', old.rowid, old.text);
+END;
+"""
+
+
+def _as_text(value: Any) -> Optional[str]:
+    """Store identifiers as text; integral floats (from NaN upcasting) lose their '.0'."""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _quarter_key(quarter: str) -> tuple:
+    """Chronological sort key for quarter labels such as 'Q1_2025'."""
+    match = _QUARTER_PATTERN.search(str(quarter))
+    if not match:
+        return (0, 0, str(quarter))
+    return (int(match.group(2)), int(match.group(1)), str(quarter))
+
+
+class SentenceSearchIndex:
+    """SQLite FTS5 index over processed sentences.
+
+    Records are added per bank and quarter as they are stored; re-processing
+    a source document replaces its previous sentences, while other documents
+    of the same bank and quarter are kept.
+    """
+
+    # Record fields the stored columns are read from, in priority order
+    FIELD_SOURCES = {
+        'source': ['file_path', 'source_file'],
+        'speaker': ['speaker_norm', 'speaker'],
+        'topic': ['topic_label', 'primary_topic', 'final_topic'],
+        'sentiment': ['sentiment_score'],
+        'call_id': ['call_id'],
+        'sentence_id': ['sentence_id'],
+    }
+    FACETS = ['bank', 'quarter', 'speaker', 'topic']
+    RESULT_COLUMNS = ['text', 'bank', 'quarter', 'speaker', 'topic', 'sentiment', 'call_id', 'sentence_id',
+                      'version_id', 'source']
+
+    def __init__(self, db_path: Union[str, Path] = "data/search/sentences.db",
+                 tokenizer: str = "porter unicode61", replace_existing: bool = True):
+        """Initialize the search index, creating the database if needed.
+
+        Args:
+            db_path: SQLite database file (':memory:' is not supported, as each
+                operation opens its own connection)
+            tokenizer: FTS5 tokenizer specification
+            replace_existing: Replace a source document's sentences when it is indexed again
+        """
+        self.db_path = Path(db_path)
+        self.tokenizer = tokenizer
+        self.replace_existing = replace_existing
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            # Databases created before sentences carried their source document
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sentences'").fetchone():
+                columns = {row['name'] for row in conn.execute("PRAGMA table_info(sentences)")}
+                if 'source' not in columns:
+                    conn.execute("ALTER TABLE sentences ADD COLUMN source TEXT")
+            conn.executescript(_SCHEMA.format(tokenizer=tokenizer))
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection tuned for bulk inserts and concurrent readers."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _field(self, df: pd.DataFrame, name: str, default: Any = None) -> pd.Series:
+        """First available record column for a stored column, or a constant."""
+        for column in self.FIELD_SOURCES[name]:
+            if column in df.columns:
+                return df[column]
+        return pd.Series(default, index=df.index, dtype=object)
+
+    def add_records(self, records: Union[pd.DataFrame, List[Dict[str, Any]]], bank_name: str,
+                    quarter: str, version_id: Optional[str] = None) -> int:
+        """Index processed sentences for a bank and quarter.
+
+        Each record's source document is read from its 'file_path' (or
+        'source_file') field. With ``replace_existing``, sentences previously
+        indexed for the same bank, quarter and source document are replaced.
+
+        Args:
+            records: Processed records (DataFrame or list of dicts) with a 'text' field
+            bank_name: Bank the records belong to, stored as their bank facet
+            quarter: Quarter identifier
+            version_id: Data version the records were stored under
+
+        Returns:
+            Number of sentences indexed
+        """
+        df = records if isinstance(records, pd.DataFrame) else pd.DataFrame(records)
+        if df.empty or 'text' not in df.columns:
+            return 0
+
+        source = self._field(df, 'source')
+        sources = source.astype(object).where(source.notna(), None).map(_as_text).unique().tolist()
+
+        df = df[df['text'].notna() & (df['text'].astype(str).str.strip() != '')]
+        sentiment = pd.to_numeric(self._field(df, 'sentiment'), errors='coerce')
+        rows = pd.DataFrame({
+            'text': df['text'].astype(str),
+            'bank': bank_name,
+            'quarter': quarter,
+            'speaker': self._field(df, 'speaker'),
+            'topic': self._field(df, 'topic'),
+            'sentiment': sentiment.astype(object).where(sentiment.notna(), None),
+            'call_id': self._field(df, 'call_id'),
+            'sentence_id': self._field(df, 'sentence_id'),
+            'version_id': version_id,
+            'source': source.loc[df.index],
+        })
+        for column in ['speaker', 'topic', 'call_id', 'sentence_id', 'source']:
+            rows[column] = rows[column].astype(object).where(rows[column].notna(), None).map(_as_text)
+
+        with closing(self._connect()) as conn, conn:
+            if self.replace_existing:
+                conn.executemany(
+                    "DELETE FROM sentences WHERE bank = ? AND quarter = ? AND source IS ?",
+                    [(bank_name, quarter, value) for value in sources]
+                )
+            conn.executemany(
+                f"INSERT INTO sentences ({', '.join(rows.columns)}) VALUES ({', '.join('?' * len(rows.columns))})",
+                rows.itertuples(index=False, name=None)
+            )
+
+        logger.info(f"Indexed {len(rows)} sentences for {bank_name} {quarter}")
+        return len(rows)
+
+    def remove(self, bank_name: str, quarter: Optional[str] = None) -> int:
+        """Remove a bank's sentences, optionally for one quarter only."""
+        with closing(self._connect()) as conn, conn:
+            if quarter is None:
+                cursor = conn.execute("DELETE FROM sentences WHERE bank = ?", (bank_name,))
+            else:
+                cursor = conn.execute("DELETE FROM sentences WHERE bank = ? AND quarter = ?", (bank_name, quarter))
+            return cursor.rowcount
+
+    def optimize(self) -> None:
+        """Merge the FTS5 index segments (run after large loads)."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("INSERT INTO sentences_fts (sentences_fts) VALUES ('optimize')")
+
+    def quarters(self) -> List[str]:
+        """Indexed quarters in chronological order."""
+        # Skip-scan the quarter index: one lookup per distinct quarter
+        values = []
+        with closing(self._connect()) as conn:
+            quarter = conn.execute("SELECT MIN(quarter) FROM sentences").fetchone()[0]
+            while quarter is not None:
+                values.append(quarter)
+                quarter = conn.execute("SELECT MIN(quarter) FROM sentences WHERE quarter > ?", (quarter,)).fetchone()[0]
+        return sorted(values, key=_quarter_key)
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM sentences").fetchone()[0]
+
+    @staticmethod
+    def to_match_expression(query: str) -> str:
+        """Turn free text into an FTS5 expression matching all of its words."""
+        terms = re.findall(r'\w+', query)
+        return ' '.join('"' + term + '"' for term in terms)
+
+    def _where(self, query: Optional[str], raw: bool, banks: Optional[Sequence[str]],
+               quarters: Optional[Sequence[str]], latest_quarters: Optional[int],
+               speakers: Optional[Sequence[str]], topics: Optional[Sequence[str]],
+               min_sentiment: Optional[float], max_sentiment: Optional[float]) -> tuple:
+        """SQL conditions and parameters for a query and its facet filters."""
+        conditions, params = [], []
+        if query:
+            conditions.append("sentences_fts MATCH ?")
+            params.append(query if raw else self.to_match_expression(query))
+
+        if latest_quarters:
+            recent = self.quarters()[-latest_quarters:]
+            quarters = [q for q in quarters if q in recent] if quarters else recent
+
+        for column, values in [('s.bank', banks), ('s.quarter', quarters),
+                               ('s.speaker', speakers), ('s.topic', topics)]:
+            if values is not None:
+                values = list(values)
+                conditions.append(f"{column} IN ({', '.join('?' * len(values))})" if values else "0")
+                params.extend(values)
+        if min_sentiment is not None:
+            conditions.append("s.sentiment >= ?")
+            params.append(min_sentiment)
+        if max_sentiment is not None:
+            conditions.append("s.sentiment <= ?")
+            params.append(max_sentiment)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
+    def search(self, query: Optional[str] = None, banks: Optional[Sequence[str]] = None,
+               quarters: Optional[Sequence[str]] = None, latest_quarters: Optional[int] = None,
+               speakers: Optional[Sequence[str]] = None, topics: Optional[Sequence[str]] = None,
+               min_sentiment: Optional[float] = None, max_sentiment: Optional[float] = None,
+               limit: int = 20, offset: int = 0, raw: bool = False,
+               highlight: tuple = ('[', ']'), snippet_tokens: int = 16) -> List[Dict[str, Any]]:
+        """Search sentences, best BM25 matches first.
+
+        Args:
+            query: Free text (all words must match) or an FTS5 expression if ``raw``
+            banks: Restrict to these banks
+            quarters: Restrict to these quarters
+            latest_quarters: Restrict to the N most recent indexed quarters
+            speakers: Restrict to these speakers
+            topics: Restrict to these topics
+            min_sentiment: Minimum sentiment score
+            max_sentiment: Maximum sentiment score
+            limit: Maximum number of results
+            offset: Number of results to skip (for paging)
+            raw: Pass ``query`` to FTS5 unchanged (phrases, NEAR, OR, prefix*)
+            highlight: Opening and closing markers around matched terms in snippets
+            snippet_tokens: Maximum tokens per snippet
+
+        Returns:
+            List of result dicts with the facet columns, 'score' (BM25, lower is
+            better) and 'snippet'. Without a query, results are in index order.
+        """
+        where, params = self._where(query, raw, banks, quarters, latest_quarters,
+                                    speakers, topics, min_sentiment, max_sentiment)
+        columns = ', '.join(f"s.{c}" for c in self.RESULT_COLUMNS)
+
+        if query:
+            sql = (f"SELECT {columns}, bm25(sentences_fts) AS score, "
+                   f"snippet(sentences_fts, 0, ?, ?, '...', ?) AS snippet "
+                   f"FROM sentences_fts JOIN sentences s ON s.rowid = sentences_fts.rowid "
+                   f"{where} ORDER BY score LIMIT ? OFFSET ?")
+            params = [highlight[0], highlight[1], snippet_tokens] + params
+        else:
+            sql = (f"SELECT {columns}, NULL AS score, s.text AS snippet FROM sentences s "
+                   f"{where} ORDER BY s.rowid LIMIT ? OFFSET ?")
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params + [limit, offset]).fetchall()
+        return [dict(row) for row in rows]
+
+    def search_frame(self, *args, **kwargs) -> pd.DataFrame:
+        """``search`` results as a DataFrame."""
+        return pd.DataFrame(self.search(*args, **kwargs), columns=self.RESULT_COLUMNS + ['score', 'snippet'])
+
+    def facet_counts(self, query: Optional[str] = None, facets: Optional[Iterable[str]] = None,
+                     raw: bool = False, **filters) -> Dict[str, Dict[str, int]]:
+        """Number of matching sentences per value of each facet.
+
+        Args:
+            query: Free text or FTS5 expression, as in ``search``
+            facets: Facet columns to count (default bank, quarter, speaker and topic)
+            raw: Pass ``query`` to FTS5 unchanged
+            **filters: Facet filters accepted by ``search``
+
+        Returns:
+            Dictionary of facet -> {value: count}, most frequent first
+        """
+        where, params = self._where(query, raw, filters.get('banks'), filters.get('quarters'),
+                                    filters.get('latest_quarters'), filters.get('speakers'),
+                                    filters.get('topics'), filters.get('min_sentiment'),
+                                    filters.get('max_sentiment'))
+        source = ("sentences_fts JOIN sentences s ON s.rowid = sentences_fts.rowid" if query
+                  else "sentences s")
+
+        counts = {}
+        with closing(self._connect()) as conn:
+            for facet in facets or self.FACETS:
+                if facet not in self.FACETS:
+                    raise ValueError(f"Unknown facet: {facet}")
+                rows = conn.execute(
+                    f"SELECT s.{facet}, COUNT(*) FROM {source} {where} "
+                    f"GROUP BY s.{facet} ORDER BY COUNT(*) DESC", params
+                ).fetchall()
+                counts[facet] = {row[0]: row[1] for row in rows}
+        return counts
+
+
+def get_search_index(config: Optional[Any] = None) -> SentenceSearchIndex:
+    """Get the singleton sentence search index instance
+
+    Args:
+        config: Optional SearchIndexConfig used on first creation
+    """
+    if not hasattr(get_search_index, 'instance'):
+        if config is None:
+            get_search_index.instance = SentenceSearchIndex()
+        else:
+            get_search_index.instance = SentenceSearchIndex(
+                db_path=config.db_path,
+                tokenizer=config.tokenizer,
+                replace_existing=config.replace_existing
+            )
+    return get_search_index.instance
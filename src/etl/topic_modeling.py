@@ -153,24 +153,49 @@ class TopicModeler:
             "seed_theme_count": len(df[df["topic_label"].str.startswith("Emerging").fillna(False)])
         }
     
+    def process_boilerplate(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Label boilerplate records without fitting them into emerging topics"""
+        for record in records:
+            record["topic_label"] = "Boilerplate"
+            record["topic_confidence"] = 1.0
+            record["topic_keywords"] = "boilerplate"
+        
+        logging.info(f"Excluded {len(records)} boilerplate records from topic fitting")
+        return records
+    
     def process_batch(
         self,
         records: List[Dict[str, Any]],
         bank_name: str,
-        quarter: str
+        quarter: str,
+        exclude_boilerplate: bool = False
     ) -> List[Dict[str, Any]]:
-        """Process a batch of records through the hybrid pipeline"""
+        """Process a batch of records through the hybrid pipeline
+        
+        Args:
+            records: Cleaned NLP schema records
+            bank_name: Name of the bank
+            quarter: Quarter identifier
+            exclude_boilerplate: Keep records tagged ``is_boilerplate`` out of
+                BERTopic fitting so they cannot form their own emerging topics
+        """
         try:
             logging.info(f"Processing {len(records)} records for {bank_name} {quarter}")
             
             # Stage 1: Seed theme assignment
             seed_assigned, misc_corpus = self.process_seed_themes(records)
             
+            # Boilerplate is labelled directly rather than clustered
+            boilerplate_records = []
+            if exclude_boilerplate:
+                boilerplate_records = [r for r in misc_corpus if r.get("is_boilerplate")]
+                misc_corpus = [r for r in misc_corpus if not r.get("is_boilerplate")]
+            
             # Stage 2: Emerging topic modeling
             emerging_records = self.process_emerging_topics(misc_corpus)
             
             # Combine results
-            all_records = seed_assigned + emerging_records
+            all_records = seed_assigned + emerging_records + self.process_boilerplate(boilerplate_records)
             
             # Add metadata
             for record in all_records:
@@ -0,0 +1,113 @@
+"""Tests for near-duplicate boilerplate detection."""
+import json
+from types import SimpleNamespace
+
+import pytest
+from src.etl.near_duplicates import NearDuplicateIndex
+
+OPERATOR_SCRIPT = (
+    "Good morning and welcome to the Citigroup first quarter {year} earnings call. "
+    "Today is {date}. Please note this call is being recorded."
+)
+
+
+def test_normalise_replaces_dates_and_figures():
+    """Sentences differing only in dates or figures normalise identically."""
+    index = NearDuplicateIndex()
+    a = index.normalise("Revenue was $14.2 billion, up 5% on April 15, 2025.")
+    b = index.normalise("Revenue was $13.9 billion, up 3% on January 12, 2024.")
+    assert a == b
+
+
+def test_tag_records_groups_boilerplate():
+    """Repeated operator scripts are tagged, distinct content is not."""
+    index = NearDuplicateIndex()
+    records = [
+        {"text": OPERATOR_SCRIPT.format(year=2025, date="April 15, 2025")},
+        {"text": "Net interest income rose on higher deposit balances."},
+        {"text": OPERATOR_SCRIPT.format(year=2024, date="April 12, 2024")},
+        {"text": "Card losses increased as expected in the consumer book."},
+        {"text": ""},
+    ]
+
+    stats = index.tag_records(records)
+
+    assert [r["is_boilerplate"] for r in records] == [True, False, True, False, False]
+    assert records[0]["boilerplate_group"] == records[2]["boilerplate_group"]
+    assert records[2]["is_near_duplicate"] and not records[0]["is_near_duplicate"]
+    assert records[4]["boilerplate_group"] == -1
+    assert stats["boilerplate_records"] == 2
+    assert stats["dedup_ratio"] == pytest.approx(1 / 5)
+
+
+def test_groups_persist_across_calls():
+    """Boilerplate from an earlier call is matched in a later one."""
+    index = NearDuplicateIndex()
+    index.tag_records([{"text": OPERATOR_SCRIPT.format(year=2024, date="July 14, 2024")}])
+    later = [{"text": OPERATOR_SCRIPT.format(year=2025, date="July 15, 2025")}]
+
+    index.tag_records(later)
+
+    assert later[0]["is_boilerplate"] and later[0]["is_near_duplicate"]
+
+
+def test_bands_must_divide_permutations():
+    """Invalid LSH banding is rejected."""
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(num_perm=100, bands=32)
+
+
+def test_unit_suffix_needs_word_boundary():
+    """Unit suffixes are only stripped as whole words."""
+    index = NearDuplicateIndex()
+    assert index.normalise("We hired 5 more bankers") == "we hired <num> more bankers"
+    assert index.normalise("Costs fell 5 million") == index.normalise("Costs fell 7m")
+
+
+def test_retagging_a_document_replaces_it():
+    """Re-processing the same document does not turn it into boilerplate."""
+    index = NearDuplicateIndex()
+    texts = ["Net interest income rose on higher deposit balances.",
+             "Card losses increased as expected in the consumer book."]
+    key = ("Citigroup", "Q1_2025", ("transcript.pdf",))
+
+    first = index.tag_records([{"text": t} for t in texts], document_key=key)
+    records = [{"text": t} for t in texts]
+    second = index.tag_records(records, document_key=key)
+
+    assert first == second
+    assert second["boilerplate_ratio"] == 0.0
+    assert not any(r["is_near_duplicate"] for r in records)
+
+
+def test_pipeline_stores_boilerplate_ratios_in_metadata(tmp_path):
+    """The ETL pipeline writes boilerplate and dedup ratios to the stored metadata."""
+    from src.etl.config import DeduplicationConfig
+    from src.etl.etl_pipeline import ETLPipeline
+
+    pipeline = ETLPipeline.__new__(ETLPipeline)
+    pipeline.dedup_config = DeduplicationConfig()
+    pipeline.near_duplicate_index = NearDuplicateIndex.from_config(pipeline.dedup_config)
+    pipeline.topic_modeler = SimpleNamespace(
+        process_batch=lambda records, **kwargs: [dict(record, topic_label="Risk") for record in records]
+    )
+    pipeline.text_cleaner = SimpleNamespace(get_parameters=lambda: {})
+    pipeline.version_manager = SimpleNamespace(
+        create_version=lambda **kwargs: "v1",
+        _get_version_path=lambda bank_name, quarter, version_id: tmp_path
+    )
+    pipeline.search_index = None
+
+    records = [
+        {"text": OPERATOR_SCRIPT.format(year=2025, date="April 15, 2025"), "file_path": "transcript.pdf"},
+        {"text": OPERATOR_SCRIPT.format(year=2024, date="April 12, 2024"), "file_path": "transcript.pdf"},
+        {"text": "Net interest income rose on higher deposit balances.", "file_path": "transcript.pdf"},
+        {"text": "Card losses increased as expected in the consumer book.", "file_path": "transcript.pdf"},
+    ]
+    processed = pipeline._apply_topic_modeling(records, "Citigroup", "Q1_2025")
+    metadata = pipeline._generate_metadata(processed, "Citigroup", "Q1_2025")
+    pipeline._store_data(processed, metadata, "Citigroup", "Q1_2025")
+
+    stored = json.loads((tmp_path / "processing_metadata.json").read_text())
+    assert stored["boilerplate_ratio"] == pytest.approx(2 / 4)
+    assert stored["dedup_ratio"] == pytest.approx(1 / 4)
@@ -0,0 +1,75 @@
+"""Tests for the FTS5 sentence search index."""
+import pytest
+from src.etl.search_index import SentenceSearchIndex
+
+
+def make_records(bank, topic_text):
+    return [
+        {"text": f"We continue to monitor {topic_text} closely.", "speaker_norm": "CRO",
+         "topic_label": "Risk", "sentiment_score": -0.2, "call_id": f"{bank}_call", "sentence_id": 1},
+        {"text": "Net interest income rose on higher deposit balances.", "speaker_norm": "CFO",
+         "topic_label": "Revenue", "sentiment_score": 0.4, "call_id": f"{bank}_call", "sentence_id": 2},
+        {"text": "", "speaker_norm": "Operator"},
+    ]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SentenceSearchIndex(tmp_path / "sentences.db")
+    for quarter in ["Q3_2024", "Q4_2024", "Q1_2025"]:
+        index.add_records(make_records("JPMorgan", "commercial real estate exposure"), "JPMorgan", quarter, "v1")
+        index.add_records(make_records("HSBC", "climate transition risk"), "HSBC", quarter, "v1")
+    return index
+
+
+def test_add_records_skips_empty_text_and_replaces_quarter(index):
+    assert len(index) == 12
+    index.add_records(make_records("HSBC", "private credit"), "HSBC", "Q1_2025", "v2")
+    assert len(index) == 12
+    assert index.search("climate", banks=["HSBC"], quarters=["Q1_2025"]) == []
+    assert index.quarters() == ["Q3_2024", "Q4_2024", "Q1_2025"]
+
+
+def test_documents_of_one_quarter_are_replaced_separately(tmp_path):
+    index = SentenceSearchIndex(tmp_path / "sentences.db")
+    transcript = [dict(record, file_path="raw/HSBC/Q1_2025/transcript.pdf", bank_name="HSBC Holdings")
+                  for record in make_records("HSBC", "climate transition risk")]
+    presentation = [dict(record, file_path="raw/HSBC/Q1_2025/presentation.pdf")
+                    for record in make_records("HSBC", "private credit")]
+
+    index.add_records(transcript, "HSBC", "Q1_2025", "v1")
+    index.add_records(presentation, "HSBC", "Q1_2025", "v2")
+    assert len(index) == 4
+    assert len(index.search("climate", banks=["HSBC"])) == 1
+    assert len(index.search("private credit", banks=["HSBC"])) == 1
+
+    # Re-processing one document replaces only its own sentences
+    index.add_records(transcript, "HSBC", "Q1_2025", "v3")
+    assert len(index) == 4
+    assert index.facet_counts(facets=["bank"]) == {"bank": {"HSBC": 4}}
+    assert index.search("climate")[0]["version_id"] == "v3"
+    assert index.search("climate")[0]["source"] == "raw/HSBC/Q1_2025/transcript.pdf"
+
+
+def test_search_ranks_snippets_and_filters(index):
+    results = index.search("real estate", latest_quarters=2)
+    assert sorted(r["quarter"] for r in results) == ["Q1_2025", "Q4_2024"]
+    assert all(r["bank"] == "JPMorgan" and r["speaker"] == "CRO" for r in results)
+    assert "[real] [estate]" in results[0]["snippet"]
+    assert results[0]["sentence_id"] == "1"
+
+    # Porter stemming and sentiment filters
+    assert len(index.search("monitoring", max_sentiment=0.0)) == 6
+    assert index.search("deposit", min_sentiment=0.5) == []
+
+    # Raw FTS5 expressions
+    assert len(index.search('"climate transition" OR estate', raw=True, limit=100)) == 6
+
+
+def test_facet_counts(index):
+    counts = index.facet_counts("income", quarters=["Q1_2025"])
+    assert counts["bank"] == {"JPMorgan": 1, "HSBC": 1}
+    assert counts["speaker"] == {"CFO": 2}
+
+    with pytest.raises(ValueError):
+        index.facet_counts("income", facets=["sentiment"])